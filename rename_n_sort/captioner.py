@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Process-wide Moondream2 captioner shared by the image and PDF plugins.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import time
+import threading
+from pathlib import Path
+from collections.abc import Callable
+
+#============================================
+
+
+def _load_moondream2() -> dict:
+	# imported here so torch/transformers load only when a caption is needed
+	from rename_n_sort import moondream2_caption
+	components = moondream2_caption.setup_ai_components()
+	return components
+
+
+#============================================
+
+
+def _caption_moondream2(image, components: dict) -> str:
+	from rename_n_sort import moondream2_caption
+	caption = moondream2_caption.caption_image(image, components)
+	return caption
+
+
+#============================================
+
+
+class CaptionerService:
+	"""
+	Lazily loaded, thread-safe captioning model.
+
+	The model is loaded on the first caption request and reused for the
+	life of the process. A failed load is remembered and re-raised instead
+	of being retried for every file. Inference is serialized because the
+	model is not safe to call from several threads at once. Moondream2 has
+	no batched caption call, so images are captioned one at a time on the
+	calling thread.
+	"""
+
+	#============================================
+	def __init__(
+		self,
+		load_components: Callable[[], dict] = _load_moondream2,
+		run_caption: Callable[[object, dict], str] = _caption_moondream2,
+	) -> None:
+		"""
+		Create an unloaded captioner.
+
+		Args:
+			load_components: Returns the model components (called once).
+			run_caption: Captions one image (path or PIL image) with the components.
+		"""
+		self._load_components = load_components
+		self._run_caption = run_caption
+		self._components: dict | None = None
+		self._load_error: Exception | None = None
+		self._load_lock = threading.Lock()
+		self._run_lock = threading.Lock()
+		self.load_seconds: float | None = None
+		self.caption_count = 0
+		self.caption_seconds = 0.0
+		self.max_caption_seconds = 0.0
+
+	#============================================
+	@property
+	def loaded(self) -> bool:
+		"""
+		True once the model components are in memory.
+		"""
+		return self._components is not None
+
+	#============================================
+	def load(self) -> None:
+		"""
+		Load the model now if it is not loaded yet.
+
+		Raises:
+			RuntimeError: When the model cannot be initialized.
+		"""
+		self._ensure_loaded()
+
+	#============================================
+	def _ensure_loaded(self) -> dict:
+		components = self._components
+		if components is not None:
+			return components
+		with self._load_lock:
+			if self._components is not None:
+				return self._components
+			if self._load_error is not None:
+				raise RuntimeError(f"Failed to initialize Moondream2: {self._load_error}")
+			start = time.monotonic()
+			try:
+				self._components = self._load_components()
+			except Exception as exc:
+				self._load_error = exc
+				raise RuntimeError(f"Failed to initialize Moondream2: {exc}") from exc
+			self.load_seconds = time.monotonic() - start
+			return self._components
+
+	#============================================
+	def caption(self, image: Path | object) -> str:
+		"""
+		Caption one image.
+
+		Args:
+			image: Image path or PIL image.
+
+		Returns:
+			Caption text.
+		"""
+		components = self._ensure_loaded()
+		with self._run_lock:
+			start = time.monotonic()
+			caption = self._run_caption(image, components)
+			duration = time.monotonic() - start
+			self.caption_count += 1
+			self.caption_seconds += duration
+			self.max_caption_seconds = max(self.max_caption_seconds, duration)
+		return caption
+
+	#============================================
+	def stats(self) -> dict[str, float | int | None]:
+		"""
+		Return load time and caption latency counters.
+		"""
+		average = self.caption_seconds / self.caption_count if self.caption_count else 0.0
+		return {
+			"load_seconds": self.load_seconds,
+			"captions": self.caption_count,
+			"caption_seconds": round(self.caption_seconds, 3),
+			"avg_caption_seconds": round(average, 3),
+			"max_caption_seconds": round(self.max_caption_seconds, 3),
+		}
+
+
+#============================================
+
+
+_SHARED: CaptionerService | None = None
+_SHARED_LOCK = threading.Lock()
+
+#============================================
+
+
+def get_captioner() -> CaptionerService:
+	"""
+	Return the process-wide captioner, creating it (unloaded) on first use.
+	"""
+	global _SHARED
+	with _SHARED_LOCK:
+		if _SHARED is None:
+			_SHARED = CaptionerService()
+		return _SHARED
+
+
+#============================================
+
+
+def set_captioner(service: CaptionerService | None) -> CaptionerService | None:
+	"""
+	Replace the process-wide captioner (tests, alternate backends).
+
+	Args:
+		service: New captioner, or None to reset to a fresh default on next use.
+
+	Returns:
+		The previous captioner.
+	"""
+	global _SHARED
+	with _SHARED_LOCK:
+		previous = _SHARED
+		_SHARED = service
+	return previous
@@ -8,17 +8,19 @@ import argparse
 import logging
 from pathlib import Path
 import urllib.request
-import random
 from collections import Counter
+from collections.abc import Iterable, Iterator
 import sys
 
 # local repo modules
 from .config import AppConfig, parse_exts
+from .llm_cache import LLM_CACHE_FILENAME, LLMResponseCache
 from .llm_engine import LLMEngine
 from .llm_utils import apple_models_available, choose_model
+from .ocr_backends import OCR_BACKENDS
 from .transports import AppleTransport, OllamaTransport
 from .organizer import Organizer
-from .scanner import iter_files
+from .scanner import iter_files, select_files
 
 #============================================
 
@@ -121,7 +123,97 @@ def parse_args() -> argparse.Namespace:
 		dest="context",
 		help="Optional context string added to LLM prompts to keep naming on-theme (e.g., 'Biology class', 'Client ACME').",
 	)
-	parser.set_defaults(apply=False, dry_run=True, randomize=True, sorted=False)
+	parser.add_argument(
+		"--ollama-history-tokens",
+		dest="ollama_history_tokens",
+		type=int,
+		default=0,
+		help="Send up to this many estimated tokens of recent Ollama turns with each call (default 0: stateless).",
+	)
+	parser.add_argument(
+		"--no-ollama-stream",
+		dest="ollama_stream",
+		action="store_false",
+		help="Wait for full Ollama replies instead of streaming and stopping once the tags close.",
+	)
+	parser.add_argument(
+		"--sniff-content",
+		dest="sniff_content",
+		action="store_true",
+		help="Route files by their first few KB when the extension is missing, unknown or contradicted (e.g. a .bin or .txt that is a PDF).",
+	)
+	parser.add_argument(
+		"--ocr-backend",
+		dest="ocr_backend",
+		choices=list(OCR_BACKENDS),
+		default="auto",
+		help="OCR engine: in-process tesserocr, the tesseract binary via pytesseract, or auto (tesserocr when usable; naming tesserocr fails if it is not).",
+	)
+	parser.add_argument(
+		"--pdf-min-text-chars",
+		dest="pdf_min_text_chars",
+		type=int,
+		default=200,
+		help="Render a PDF page for OCR/captioning only when its extracted text is shorter than this (default 200).",
+	)
+	parser.add_argument(
+		"--max-concurrency",
+		dest="max_concurrency",
+		type=int,
+		default=4,
+		help="LLM calls in flight at once; files are planned concurrently up to this many (default 4).",
+	)
+	parser.add_argument(
+		"--extract-workers",
+		dest="extract_workers",
+		type=int,
+		default=1,
+		help="Threads extracting file metadata (OCR, captions, conversions) (default 1).",
+	)
+	parser.add_argument(
+		"--llm-workers",
+		dest="llm_workers",
+		type=int,
+		default=1,
+		help="Threads planning files with the LLM; raised to --max-concurrency when lower (default 1).",
+	)
+	parser.add_argument(
+		"--pipeline-queue-size",
+		dest="pipeline_queue_size",
+		type=int,
+		default=4,
+		help="Files queued ahead of the apply stage; raised to --max-concurrency when lower (default 4).",
+	)
+	cache_group = parser.add_mutually_exclusive_group()
+	cache_group.add_argument(
+		"--cache",
+		dest="cache_mode",
+		action="store_const",
+		const="on",
+		help="Reuse cached file metadata and LLM replies from earlier runs (default).",
+	)
+	cache_group.add_argument(
+		"--no-cache",
+		dest="cache_mode",
+		action="store_const",
+		const="off",
+		help="Do not read or write the metadata or LLM reply caches.",
+	)
+	cache_group.add_argument(
+		"--refresh-cache",
+		dest="cache_mode",
+		action="store_const",
+		const="refresh",
+		help="Re-extract metadata and re-ask the LLM, overwriting both caches.",
+	)
+	parser.set_defaults(
+		apply=False,
+		dry_run=True,
+		randomize=True,
+		sorted=False,
+		cache_mode="on",
+		ollama_stream=True,
+	)
 	return parser.parse_args()
 
 
@@ -158,6 +250,16 @@ def build_config(args: argparse.Namespace) -> AppConfig:
 		config.llm_backend = args.llm_backend
 	if args.context:
 		config.context = args.context
+	config.cache_mode = args.cache_mode
+	config.ollama_history_tokens = max(0, args.ollama_history_tokens)
+	config.ollama_stream = args.ollama_stream
+	config.sniff_content = args.sniff_content
+	config.pdf_min_text_chars = max(0, args.pdf_min_text_chars)
+	config.max_concurrency = max(1, args.max_concurrency)
+	config.extract_workers = max(1, args.extract_workers)
+	config.llm_workers = max(1, args.llm_workers)
+	config.pipeline_queue_size = max(1, args.pipeline_queue_size)
+	config.ocr_backend = args.ocr_backend
 	config.verbose = args.verbose
 	return config
 
@@ -177,22 +279,62 @@ def build_llm(config: AppConfig) -> LLMEngine:
 	"""
 	model = choose_model(config.model_override)
 	base_url = "http://localhost:11434"
+	cache = _build_response_cache(config)
 	transports = []
 	if config.llm_backend == "ollama":
 		if not _ollama_available(base_url):
 			raise RuntimeError("Ollama backend selected but service is not reachable.")
-		transports = [OllamaTransport(model=model, base_url=base_url)]
-		return LLMEngine(transports=transports, context=config.context)
-	if not apple_models_available():
+		transports = [_build_ollama(config, model, base_url)]
+	elif not apple_models_available():
+		if not _ollama_available(base_url):
+			raise RuntimeError("No available LLM backend (Apple Foundation Models or Ollama).")
+		logging.warning("Apple Foundation Models unavailable; using Ollama backup.")
+		transports = [_build_ollama(config, model, base_url)]
+	else:
+		transports.append(AppleTransport())
 		if _ollama_available(base_url):
-			logging.warning("Apple Foundation Models unavailable; using Ollama backup.")
-			transports = [OllamaTransport(model=model, base_url=base_url)]
-			return LLMEngine(transports=transports, context=config.context)
-		raise RuntimeError("No available LLM backend (Apple Foundation Models or Ollama).")
-	transports.append(AppleTransport())
-	if _ollama_available(base_url):
-		transports.append(OllamaTransport(model=model, base_url=base_url))
-	return LLMEngine(transports=transports, context=config.context)
+			transports.append(_build_ollama(config, model, base_url))
+	engine = LLMEngine(
+		transports=transports,
+		context=config.context,
+		response_cache=cache,
+		max_concurrency=config.max_concurrency,
+	)
+	return engine
+
+
+#============================================
+
+
+def _build_ollama(config: AppConfig, model: str, base_url: str) -> OllamaTransport:
+	"""
+	Create the Ollama transport with the configured history window and a
+	connection pool sized to the LLM concurrency.
+	"""
+	transport = OllamaTransport(
+		model=model,
+		base_url=base_url,
+		history_tokens=config.ollama_history_tokens,
+		pool_size=max(1, config.llm_workers, config.max_concurrency),
+		stream=config.ollama_stream,
+	)
+	return transport
+
+
+#============================================
+
+
+def _build_response_cache(config: AppConfig) -> LLMResponseCache | None:
+	"""
+	Open the LLM response cache unless caching is off.
+	"""
+	if config.cache_mode == "off":
+		return None
+	cache = LLMResponseCache(
+		config.normalized_cache_dir() / LLM_CACHE_FILENAME,
+		refresh=config.cache_mode == "refresh",
+	)
+	return cache
 
 
 #============================================
@@ -222,6 +364,18 @@ def _ollama_available(base_url: str) -> bool:
 #============================================
 
 
+def _count_extensions(paths: Iterable[Path], counter: Counter) -> Iterator[Path]:
+	"""
+	Pass paths through while tallying extensions for the scan summary.
+	"""
+	for path in paths:
+		counter[path.suffix.lower().lstrip(".")] += 1
+		yield path
+
+
+#============================================
+
+
 def main() -> None:
 	"""
 	Entry point for the CLI.
@@ -234,22 +388,20 @@ def main() -> None:
 		logging.basicConfig(level=logging.WARNING)
 	llm = build_llm(config)
 	organizer = Organizer(config=config, llm=llm)
-	files = iter_files(config)
-	print(f"{_color('[SCAN]', '34')} Found {len(files)} files to consider.")
-	if files:
-		ext_counter = Counter(p.suffix.lower().lstrip(".") for p in files)
+	ext_counter: Counter = Counter()
+	scanned = _count_extensions(iter_files(config), ext_counter)
+	limited_files = select_files(scanned, config)
+	total = sum(ext_counter.values())
+	print(f"{_color('[SCAN]', '34')} Found {total} files to consider.")
+	if total:
 		top_exts = ext_counter.most_common(8)
 		summary = ", ".join(f"{ext}:{count}" for ext, count in top_exts if ext)
 		if summary:
 			print(f"{_color('[SCAN]', '34')} Top extensions: {summary}")
-	limited_files = files
-	if config.randomize:
-		random.shuffle(limited_files)
-	else:
-		limited_files = sorted(limited_files)
-	if config.max_files:
-		limited_files = limited_files[: config.max_files]
-	organizer.process_one_by_one(limited_files)
+	try:
+		organizer.process_one_by_one(limited_files)
+	finally:
+		llm.close()
 
 
 #============================================
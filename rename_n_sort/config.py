@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 # Standard Library
+import os
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -15,6 +17,26 @@ def _default_roots() -> list[Path]:
 #============================================
 
 
+def default_cache_dir() -> Path:
+	"""
+	Per-user cache folder for persistent caches.
+
+	Returns:
+		~/Library/Caches/llm-file-rename-n-sort on macOS, otherwise
+		$XDG_CACHE_HOME (or ~/.cache)/llm-file-rename-n-sort.
+	"""
+	home = Path.home()
+	if sys.platform == "darwin":
+		base = home / "Library" / "Caches"
+	else:
+		base = Path(os.environ.get("XDG_CACHE_HOME") or home / ".cache")
+	cache_dir = base / "llm-file-rename-n-sort"
+	return cache_dir
+
+
+#============================================
+
+
 @dataclass(slots=True)
 class AppConfig:
 	"""
@@ -30,6 +52,22 @@ class AppConfig:
 		exclude_hidden: Skip dotfiles when True.
 		llm_backend: LLM backend selector ("macos" or "ollama").
 		model_override: Optional Ollama model name.
+		extract_workers: Threads for plugin metadata extraction (OCR, captions).
+		llm_workers: Threads issuing rename/stem_action/sort LLM calls.
+		pipeline_queue_size: Files queued ahead of the apply stage.
+		max_concurrency: LLM calls in flight at once on the shared engine (and files planned at once).
+		sniff_content: Route files by their leading bytes when the extension is missing,
+			unknown or contradicted by a confident signature.
+		soffice_workers: Concurrent LibreOffice processes converting DOC/PPT files.
+		soffice_timeout: Seconds allowed per file for a LibreOffice conversion.
+		ocr_backend: OCR engine: "auto" (tesserocr when installed), "tesserocr" or "pytesseract".
+		ocr_workers: OCR worker processes (0 uses every available core).
+		ocr_timeout: Seconds of OCR allowed per image before tesseract is killed.
+		pdf_min_text_chars: Extracted characters a PDF page needs to skip rendering for OCR/captions.
+		ollama_history_tokens: Token cap for Ollama chat history (0 sends each prompt alone).
+		ollama_stream: Stream Ollama replies and stop once the required tags close.
+		cache_mode: Metadata cache mode ("on", "off", "refresh"); the CLI defaults to "on".
+		cache_dir: Optional cache folder (default: per-user cache dir).
 	"""
 	roots: list[Path] = field(default_factory=_default_roots)
 	target_root: Path | None = None
@@ -43,6 +81,21 @@ class AppConfig:
 	model_override: str | None = None
 	verbose: bool = False
 	context: str | None = None
+	extract_workers: int = 1
+	llm_workers: int = 1
+	pipeline_queue_size: int = 4
+	max_concurrency: int = 4
+	sniff_content: bool = False
+	soffice_workers: int = 2
+	soffice_timeout: float = 30.0
+	ocr_backend: str = "auto"
+	ocr_workers: int = 0
+	ocr_timeout: float = 60.0
+	pdf_min_text_chars: int = 200
+	ollama_history_tokens: int = 0
+	ollama_stream: bool = True
+	cache_mode: str = "off"
+	cache_dir: Path | None = None
 
 	#============================================
 	def normalized_roots(self) -> list[Path]:
@@ -68,6 +121,19 @@ class AppConfig:
 		target: Path = self.target_root.expanduser().resolve()
 		return target
 
+	#============================================
+	def normalized_cache_dir(self) -> Path:
+		"""
+		Normalize cache folder.
+
+		Returns:
+			Cache folder Path.
+		"""
+		if self.cache_dir is None:
+			return default_cache_dir()
+		cache_dir: Path = self.cache_dir.expanduser().resolve()
+		return cache_dir
+
 
 #============================================
 def parse_exts(exts: list[str] | None) -> set[str] | None:
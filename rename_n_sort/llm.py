@@ -5,7 +5,7 @@ Compatibility exports for LLM utilities and engine.
 
 from __future__ import annotations
 
-from .llm_engine import LLMEngine
+from .llm_engine import AsyncLLMEngine, LLMEngine
 from .llm_parsers import KeepResult, RenameResult, SortResult, ParseError
 from .llm_prompts import KeepRequest, RenameRequest, SortItem, SortRequest
 from .llm_utils import (
@@ -60,6 +60,7 @@ def choose_model(model_override: str | None) -> str:
 
 
 __all__ = [
+	"AsyncLLMEngine",
 	"LLMEngine",
 	"KeepResult",
 	"RenameResult",
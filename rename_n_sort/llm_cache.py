@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Persistent content-addressed cache of LLM responses.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import time
+import hashlib
+from pathlib import Path
+
+# local repo modules
+from .sqlite_cache import SqliteLruCache
+
+#============================================
+
+
+LLM_CACHE_FILENAME = "llm_response_cache.sqlite3"
+DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+_SCHEMA = (
+	"CREATE TABLE IF NOT EXISTS responses ("
+	" transport TEXT NOT NULL,"
+	" model TEXT NOT NULL,"
+	" prompt_hash TEXT NOT NULL,"
+	" max_tokens INTEGER NOT NULL,"
+	" response TEXT NOT NULL,"
+	" response_bytes INTEGER NOT NULL,"
+	" created REAL NOT NULL,"
+	" last_access REAL NOT NULL,"
+	" PRIMARY KEY (transport, model, prompt_hash, max_tokens))"
+)
+_INDEX = "CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)"
+
+#============================================
+
+
+def prompt_hash(prompt: str) -> str:
+	"""
+	Hash a prompt for use as a cache key.
+
+	Args:
+		prompt: Prompt text.
+
+	Returns:
+		Hex SHA-256 digest.
+	"""
+	digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+	return digest
+
+
+#============================================
+
+
+class LLMResponseCache(SqliteLruCache):
+	"""
+	Cache of raw LLM replies keyed by (transport, model, prompt hash, max_tokens).
+
+	Callers only store replies that parsed successfully. Entries older than
+	ttl_seconds are treated as misses and purged; once stored replies pass
+	max_bytes the least recently used rows are evicted. Safe to share
+	across threads.
+	"""
+
+	#============================================
+	def __init__(
+		self,
+		db_path: Path,
+		ttl_seconds: float = DEFAULT_TTL_SECONDS,
+		max_bytes: int = DEFAULT_MAX_BYTES,
+		refresh: bool = False,
+	) -> None:
+		"""
+		Open (or create) the cache database.
+
+		Args:
+			db_path: SQLite file path.
+			ttl_seconds: Maximum entry age.
+			max_bytes: Response size budget before LRU eviction.
+			refresh: When True, ignore stored entries but still write new ones.
+		"""
+		super().__init__(
+			db_path,
+			(_SCHEMA, _INDEX),
+			table="responses",
+			size_column="response_bytes",
+			max_bytes=max_bytes,
+			refresh=refresh,
+		)
+		self.ttl_seconds = ttl_seconds
+
+	#============================================
+	def get(self, transport: str, model: str, prompt: str, max_tokens: int) -> str | None:
+		"""
+		Look up a cached reply.
+
+		Args:
+			transport: Transport name.
+			model: Model name ("" when the transport has none).
+			prompt: Exact prompt text.
+			max_tokens: Generation limit used for the call.
+
+		Returns:
+			Cached reply text, or None.
+		"""
+		if self.refresh:
+			self._count_miss()
+			return None
+		key = (transport, model, prompt_hash(prompt), max_tokens)
+		now = time.time()
+		with self._lock:
+			row = self._conn.execute(
+				"SELECT response, created FROM responses WHERE transport=? AND model=?"
+				" AND prompt_hash=? AND max_tokens=?",
+				key,
+			).fetchone()
+			if row is None:
+				self.misses += 1
+				return None
+			if now - row[1] > self.ttl_seconds:
+				self._conn.execute(
+					"DELETE FROM responses WHERE transport=? AND model=?"
+					" AND prompt_hash=? AND max_tokens=?",
+					key,
+				)
+				self._conn.commit()
+				self.misses += 1
+				return None
+			self._conn.execute(
+				"UPDATE responses SET last_access=? WHERE transport=? AND model=?"
+				" AND prompt_hash=? AND max_tokens=?",
+				(now,) + key,
+			)
+			self._conn.commit()
+			self.hits += 1
+		return row[0]
+
+	#============================================
+	def put(self, transport: str, model: str, prompt: str, max_tokens: int, response: str) -> None:
+		"""
+		Store a reply that parsed successfully.
+
+		Args:
+			transport: Transport name.
+			model: Model name ("" when the transport has none).
+			prompt: Exact prompt text.
+			max_tokens: Generation limit used for the call.
+			response: Raw reply text.
+		"""
+		key = (transport, model, prompt_hash(prompt), max_tokens)
+		now = time.time()
+		response_bytes = len(response.encode("utf-8"))
+		with self._lock:
+			self._conn.execute(
+				"INSERT OR REPLACE INTO responses (transport, model, prompt_hash, max_tokens,"
+				" response, response_bytes, created, last_access)"
+				" VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+				key + (response, response_bytes, now, now),
+			)
+			# expired rows go first, then least recently used over budget
+			self._conn.execute(
+				"DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,)
+			)
+			self._evict_locked()
+			self._conn.commit()
@@ -6,10 +6,17 @@ Backend-agnostic LLM engine with fallback and strict parsing.
 from __future__ import annotations
 
 # Standard Library
-from dataclasses import dataclass
+import asyncio
+import functools
+import threading
+import contextvars
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
 
 # local repo modules
+from .llm_cache import LLMResponseCache
 from .llm_parsers import ParseError, KeepResult, RenameResult, SortResult, parse_keep_response, parse_rename_response, parse_sort_response
+from .llm_parsers import file_blocks_closed, tags_closed
 from .llm_prompts import (
 	KeepRequest,
 	RenameRequest,
@@ -18,10 +25,12 @@ from .llm_prompts import (
 	RENAME_EXAMPLE_OUTPUT,
 	KEEP_EXAMPLE_OUTPUT,
 	SORT_EXAMPLE_OUTPUT,
+	SORT_BATCH_EXAMPLE_OUTPUT,
 	build_format_fix_prompt,
 	build_keep_prompt,
 	build_rename_prompt,
 	build_rename_prompt_minimal,
+	build_sort_batch_prompt,
 	build_sort_prompt,
 )
 from .llm_utils import (
@@ -33,41 +42,77 @@ from .llm_utils import (
 	normalize_reason,
 	sanitize_filename,
 )
+from .stem_rules import DEFAULT_STEM_RULES, StemRule, match_stem_rule
 from .transports.base import LLMTransport
 
+SORT_BATCH_SIZE = 50
+SORT_TOKENS_PER_FILE = 40
+DEFAULT_MAX_CONCURRENCY = 4
+
 #============================================
 
 
 @dataclass(slots=True)
-class LLMEngine:
+class _CallTrace:
+	"""
+	Records which transport produced the last reply of one engine call.
+	"""
+
+	transport: LLMTransport | None = None
+
+
+#============================================
+
+
+@dataclass(slots=True)
+class AsyncLLMEngine:
+	"""
+	Asyncio engine: rename, stem_action and sort with fallback and format fixes.
+
+	Transports that define agenerate() are awaited directly; plain
+	generate() transports run in a worker thread, or inline when
+	inline_sync_transports is set. At most max_concurrency transport calls
+	are in flight at once on the engine's event loop, so many files can be
+	planned concurrently without flooding the backend.
+	"""
+
 	transports: list[LLMTransport]
 	context: str | None = None
+	response_cache: LLMResponseCache | None = None
+	stem_rules: tuple[StemRule, ...] = DEFAULT_STEM_RULES
+	max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+	inline_sync_transports: bool = False
+	_semaphore: asyncio.Semaphore | None = field(default=None, init=False, repr=False)
+	_semaphore_loop: asyncio.AbstractEventLoop | None = field(default=None, init=False, repr=False)
 
 	#============================================
-	def rename(self, current_name: str, metadata: dict) -> RenameResult:
+	async def rename(self, current_name: str, metadata: dict) -> RenameResult:
 		req = RenameRequest(metadata=metadata, current_name=current_name, context=self.context)
 		prompt = build_rename_prompt(req)
-		raw = self._generate_with_fallback(
+		result = await self._ask(
 			prompt,
-			purpose="filename based on content",
-			max_tokens=200,
-			retry_prompt=build_rename_prompt_minimal(req),
-		)
-		result = self._parse_with_retry(
 			lambda text: parse_rename_response(text),
-			prompt,
 			RENAME_EXAMPLE_OUTPUT,
-			raw,
 			purpose="filename based on content",
 			max_tokens=200,
+			retry_prompt=build_rename_prompt_minimal(req),
+			stop_when=tags_closed("new_name", "reason"),
 		)
 		result.new_name = sanitize_filename(result.new_name)
 		result.reason = normalize_reason(result.reason)
 		return result
 
 	#============================================
-	def stem_action(self, original_stem: str, suggested_name: str, extension: str | None = None) -> KeepResult:
+	async def stem_action(self, original_stem: str, suggested_name: str, extension: str | None = None) -> KeepResult:
 		features = compute_stem_features(original_stem, suggested_name)
+		rule = match_stem_rule(features, self.stem_rules)
+		if rule is not None:
+			return KeepResult(
+				stem_action=rule.action,
+				reason=rule.reason,
+				raw_text="",
+				decided_by=f"rule:{rule.name}",
+			)
 		req = KeepRequest(
 			original_stem=original_stem,
 			suggested_name=suggested_name,
@@ -75,67 +120,197 @@ class LLMEngine:
 			features=features,
 		)
 		prompt = build_keep_prompt(req)
-		raw = self._generate_with_fallback(
+		result = await self._ask(
 			prompt,
-			purpose="how to handle the original filename stem",
-			max_tokens=120,
-			retry_prompt=None,
-		)
-		result = self._parse_with_retry(
 			lambda text: parse_keep_response(text, original_stem),
-			prompt,
 			KEEP_EXAMPLE_OUTPUT,
-			raw,
 			purpose="how to handle the original filename stem",
 			max_tokens=120,
+			retry_prompt=None,
+			stop_when=tags_closed("stem_action", "reason"),
 		)
 		result.reason = normalize_reason(result.reason)
 		return result
 
 	#============================================
-	def sort(self, files: list[SortItem]) -> SortResult:
+	async def sort(self, files: list[SortItem]) -> SortResult:
+		"""
+		Assign categories, asking about up to SORT_BATCH_SIZE files per prompt.
+
+		Batches are sent concurrently. Files missing from a batched reply,
+		or given an invalid category, are re-asked one at a time.
+		"""
 		if not files:
 			return SortResult(assignments={}, raw_text="")
+		batches = [
+			files[start : start + SORT_BATCH_SIZE]
+			for start in range(0, len(files), SORT_BATCH_SIZE)
+		]
+		# a lone file uses the single-file prompt directly
+		multi = [batch for batch in batches if len(batch) > 1]
+		batch_results = await asyncio.gather(*(self._sort_batch(batch) for batch in multi))
 		assignments: dict[str, str] = {}
 		reasons: dict[str, str] = {}
 		last_raw = ""
-		for item in files:
-			req = SortRequest(files=[item], context=self.context)
-			prompt = build_sort_prompt(req)
-			raw = self._generate_with_fallback(
+		pending: list[SortItem] = []
+		batch_iter = iter(batch_results)
+		for batch in batches:
+			if len(batch) == 1:
+				pending.extend(batch)
+				continue
+			result = next(batch_iter)
+			if result is not None:
+				assignments.update(result.assignments)
+				for path, reason in result.reasons.items():
+					reasons[path] = normalize_reason(reason)
+				last_raw = result.raw_text
+			pending.extend(item for item in batch if item.path not in assignments)
+		single_results = await asyncio.gather(*(self._sort_one(item) for item in pending))
+		for result in single_results:
+			assignments.update(result.assignments)
+			for path, reason in result.reasons.items():
+				reasons[path] = normalize_reason(reason)
+			last_raw = result.raw_text
+		return SortResult(assignments=assignments, reasons=reasons, raw_text=last_raw)
+
+	#============================================
+	async def _sort_batch(self, batch: list[SortItem]) -> SortResult | None:
+		"""
+		One batched category prompt; None when the reply is unusable.
+		"""
+		req = SortRequest(files=batch, context=self.context)
+		prompt = build_sort_batch_prompt(req)
+		paths = [item.path for item in batch]
+		try:
+			result = await self._ask(
 				prompt,
-				purpose="category assignment",
-				max_tokens=120,
+				lambda text: parse_sort_response(text, paths),
+				SORT_BATCH_EXAMPLE_OUTPUT,
+				purpose=f"category assignment ({len(batch)} files)",
+				max_tokens=SORT_TOKENS_PER_FILE * len(batch) + 40,
 				retry_prompt=None,
+				format_fix=False,
+				stop_when=file_blocks_closed(len(batch)),
 			)
-			result = self._parse_with_retry(
-				lambda text: parse_sort_response(text, [item.path]),
+		except ParseError:
+			return None
+		except Exception as exc:
+			# e.g. the batched prompt overflows the context window; one-file prompts may still fit
+			_print_llm(f"batched category assignment failed ({exc}); asking one file at a time")
+			return None
+		return result
+
+	#============================================
+	async def _sort_one(self, item: SortItem) -> SortResult:
+		req = SortRequest(files=[item], context=self.context)
+		prompt = build_sort_prompt(req)
+		result = await self._ask(
+			prompt,
+			lambda text: parse_sort_response(text, [item.path]),
+			SORT_EXAMPLE_OUTPUT,
+			purpose="category assignment",
+			max_tokens=120,
+			retry_prompt=None,
+			stop_when=tags_closed("category", "reason"),
+		)
+		return result
+
+	#============================================
+	async def _ask(
+		self,
+		prompt: str,
+		parser,
+		example_output: str,
+		*,
+		purpose: str,
+		max_tokens: int,
+		retry_prompt: str | None,
+		format_fix: bool = True,
+		stop_when: Callable[[str], bool] | None = None,
+	):
+		"""
+		Generate and parse a reply, consulting the response cache first.
+
+		Only replies that parsed (directly or after a format fix) are
+		stored, keyed by the transport that produced them. With
+		format_fix=False a parse failure is logged and raised immediately.
+		stop_when lets streaming transports stop once the needed tags close.
+		"""
+		cached = self._cached_reply(prompt, max_tokens)
+		if cached is not None:
+			transport_name, cached_text = cached
+			try:
+				result = parser(cached_text)
+			except ParseError:
+				result = None
+			if result is not None:
+				_print_llm(f"cached {transport_name} reply for {purpose}")
+				return result
+		trace = _CallTrace()
+		raw = await self._generate_with_fallback(
+			prompt,
+			purpose=purpose,
+			max_tokens=max_tokens,
+			retry_prompt=retry_prompt,
+			trace=trace,
+			stop_when=stop_when,
+		)
+		if format_fix:
+			result = await self._parse_with_retry(
+				parser,
 				prompt,
-				SORT_EXAMPLE_OUTPUT,
+				example_output,
 				raw,
-				purpose="category assignment",
-				max_tokens=120,
+				purpose=purpose,
+				max_tokens=max_tokens,
+				trace=trace,
+				stop_when=stop_when,
 			)
-			assignments.update(result.assignments)
-			for path, reason in result.reasons.items():
-				reasons[path] = normalize_reason(reason)
-			last_raw = result.raw_text
-		return SortResult(assignments=assignments, reasons=reasons, raw_text=last_raw)
+		else:
+			result = self._parse_once(parser, prompt, raw, purpose=purpose)
+		if self.response_cache is not None and trace.transport is not None:
+			self.response_cache.put(
+				trace.transport.name,
+				_transport_model(trace.transport),
+				prompt,
+				max_tokens,
+				result.raw_text,
+			)
+		return result
+
+	#============================================
+	def _cached_reply(self, prompt: str, max_tokens: int) -> tuple[str, str] | None:
+		"""
+		Return (transport name, reply) from the first transport with a cached reply.
+		"""
+		if self.response_cache is None:
+			return None
+		for transport in self.transports:
+			text = self.response_cache.get(
+				transport.name, _transport_model(transport), prompt, max_tokens
+			)
+			if text is not None:
+				return (transport.name, text)
+		return None
 
 	#============================================
-	def _generate_with_fallback(
+	async def _generate_with_fallback(
 		self,
 		prompt: str,
 		*,
 		purpose: str,
 		max_tokens: int,
 		retry_prompt: str | None,
+		trace: _CallTrace | None = None,
+		stop_when: Callable[[str], bool] | None = None,
 	) -> str:
 		last_exc: Exception | None = None
 		for idx, transport in enumerate(self.transports):
 			try:
 				_print_llm(f"asking {transport.name} for {purpose}")
-				return self._generate_on_transport(transport, prompt, purpose, max_tokens)
+				return await self._generate_on_transport(
+					transport, prompt, purpose, max_tokens, trace=trace, stop_when=stop_when
+				)
 			except Exception as exc:
 				last_exc = exc
 				if _is_guardrail_error(exc) or _is_context_window_error(exc):
@@ -144,8 +319,13 @@ class LLMEngine:
 							_print_llm(
 								f"retrying {transport.name} with minimal prompt for {purpose}"
 							)
-							return self._generate_on_transport(
-								transport, retry_prompt, purpose, max_tokens
+							return await self._generate_on_transport(
+								transport,
+								retry_prompt,
+								purpose,
+								max_tokens,
+								trace=trace,
+								stop_when=stop_when,
 							)
 						except Exception as retry_exc:
 							last_exc = retry_exc
@@ -159,7 +339,24 @@ class LLMEngine:
 		raise RuntimeError("No LLM transports available.")
 
 	#============================================
-	def _parse_with_retry(
+	def _parse_once(self, parser, prompt: str, raw_text: str, *, purpose: str):
+		"""
+		Parse without a format-fix retry, logging failures.
+		"""
+		try:
+			return parser(raw_text)
+		except ParseError as exc:
+			log_parse_failure(
+				purpose=purpose,
+				error=exc,
+				raw_text=exc.raw_text or raw_text,
+				prompt=prompt,
+				stage="initial (no format fix)",
+			)
+			raise
+
+	#============================================
+	async def _parse_with_retry(
 		self,
 		parser,
 		original_prompt: str,
@@ -168,6 +365,8 @@ class LLMEngine:
 		*,
 		purpose: str,
 		max_tokens: int,
+		trace: _CallTrace | None = None,
+		stop_when: Callable[[str], bool] | None = None,
 	):
 		try:
 			return parser(raw_text)
@@ -188,11 +387,13 @@ class LLMEngine:
 			for transport in self.transports:
 				try:
 					_print_llm(f"asking {transport.name} for {purpose} (format fix)")
-					fixed = self._generate_on_transport(
+					fixed = await self._generate_on_transport(
 						transport,
 						fix_prompt,
 						f"{purpose} (format fix)",
 						max_tokens,
+						trace=trace,
+						stop_when=stop_when,
 					)
 					last_fixed = fixed
 				except Exception as transport_exc:
@@ -221,11 +422,170 @@ class LLMEngine:
 			raise ParseError("Format-fix retry failed.")
 
 	#============================================
-	def _generate_on_transport(
+	async def _generate_on_transport(
 		self,
 		transport: LLMTransport,
 		prompt: str,
 		purpose: str,
 		max_tokens: int,
+		trace: _CallTrace | None = None,
+		stop_when: Callable[[str], bool] | None = None,
 	) -> str:
-		return transport.generate(prompt, purpose=purpose, max_tokens=max_tokens)
+		async with self._limit():
+			generate_until = getattr(transport, "generate_until", None)
+			agenerate = getattr(transport, "agenerate", None)
+			if stop_when is not None and generate_until is not None:
+				call = functools.partial(
+					generate_until,
+					prompt,
+					purpose=purpose,
+					max_tokens=max_tokens,
+					stop_when=stop_when,
+				)
+				text = call() if self.inline_sync_transports else await asyncio.to_thread(call)
+			elif agenerate is not None:
+				text = await agenerate(prompt, purpose=purpose, max_tokens=max_tokens)
+			elif self.inline_sync_transports:
+				text = transport.generate(prompt, purpose=purpose, max_tokens=max_tokens)
+			else:
+				text = await asyncio.to_thread(
+					transport.generate, prompt, purpose=purpose, max_tokens=max_tokens
+				)
+		if trace is not None:
+			trace.transport = transport
+		return text
+
+	#============================================
+	def _limit(self) -> asyncio.Semaphore:
+		"""
+		Semaphore bounding in-flight transport calls on the running loop.
+		"""
+		loop = asyncio.get_running_loop()
+		# asyncio primitives bind to one loop; LLMEngine keeps a single
+		# long-lived loop, but a direct asyncio.run() caller brings its own
+		if self._semaphore is None or self._semaphore_loop is not loop:
+			self._semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+			self._semaphore_loop = loop
+		return self._semaphore
+
+
+#============================================
+
+
+@dataclass(slots=True)
+class LLMEngine:
+	"""
+	Synchronous front end over one shared AsyncLLMEngine.
+
+	The async engine and its event loop are created on the first call and
+	the loop runs in a daemon thread for the life of the engine. Callers on
+	any thread submit coroutines to it with run_coroutine_threadsafe and
+	wait for the result, so every pipeline worker shares one
+	max_concurrency limit. Each call runs in a copy of the caller's
+	contextvars, so its prints (including those of sync transports, which
+	run in worker threads) land in the caller's captured output.
+	"""
+
+	transports: list[LLMTransport]
+	context: str | None = None
+	response_cache: LLMResponseCache | None = None
+	stem_rules: tuple[StemRule, ...] = DEFAULT_STEM_RULES
+	max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+	_engine: AsyncLLMEngine | None = field(default=None, init=False, repr=False)
+	_loop: asyncio.AbstractEventLoop | None = field(default=None, init=False, repr=False)
+	_thread: threading.Thread | None = field(default=None, init=False, repr=False)
+	_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+	#============================================
+	def as_async(self, inline_sync_transports: bool = False) -> AsyncLLMEngine:
+		"""
+		Build an AsyncLLMEngine sharing this engine's transports and cache.
+		"""
+		engine = AsyncLLMEngine(
+			transports=self.transports,
+			context=self.context,
+			response_cache=self.response_cache,
+			stem_rules=self.stem_rules,
+			max_concurrency=self.max_concurrency,
+			inline_sync_transports=inline_sync_transports,
+		)
+		return engine
+
+	#============================================
+	def rename(self, current_name: str, metadata: dict) -> RenameResult:
+		result = self._run(lambda engine: engine.rename(current_name, metadata))
+		return result
+
+	#============================================
+	def stem_action(self, original_stem: str, suggested_name: str, extension: str | None = None) -> KeepResult:
+		result = self._run(
+			lambda engine: engine.stem_action(original_stem, suggested_name, extension=extension)
+		)
+		return result
+
+	#============================================
+	def sort(self, files: list[SortItem]) -> SortResult:
+		result = self._run(lambda engine: engine.sort(files))
+		return result
+
+	#============================================
+	def close(self) -> None:
+		"""
+		Stop the event loop thread; the next call starts a fresh one.
+		"""
+		with self._lock:
+			loop = self._loop
+			thread = self._thread
+			self._engine = None
+			self._loop = None
+			self._thread = None
+		if loop is None or thread is None:
+			return
+		loop.call_soon_threadsafe(loop.stop)
+		thread.join()
+		loop.close()
+
+	#============================================
+	def _run(self, make_call: Callable[[AsyncLLMEngine], Coroutine]):
+		"""
+		Run one engine coroutine on the shared loop and wait for its result.
+		"""
+		with self._lock:
+			engine = self._engine
+			loop = self._loop
+			if engine is None or loop is None:
+				engine = self.as_async()
+				loop = asyncio.new_event_loop()
+				thread = threading.Thread(target=loop.run_forever, name="llm-loop", daemon=True)
+				thread.start()
+				self._engine = engine
+				self._loop = loop
+				self._thread = thread
+		context = contextvars.copy_context()
+		future = asyncio.run_coroutine_threadsafe(_in_context(context, make_call(engine)), loop)
+		result = future.result()
+		return result
+
+
+#============================================
+
+
+async def _in_context(context: contextvars.Context, coro: Coroutine):
+	"""
+	Await coro as a task running in context (a copy of the caller's).
+	"""
+	# a task copies the context that is current when it is created
+	task = context.run(asyncio.get_running_loop().create_task, coro)
+	result = await task
+	return result
+
+
+#============================================
+
+
+def _transport_model(transport: LLMTransport) -> str:
+	"""
+	Model name for cache keys; transports without one use "".
+	"""
+	model = getattr(transport, "model", "") or ""
+	return str(model)
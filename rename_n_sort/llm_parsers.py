@@ -6,11 +6,13 @@ Backend-agnostic response parsers.
 from __future__ import annotations
 
 # Standard Library
+from collections.abc import Callable
 from dataclasses import dataclass, field
 import html
 import re
 
 # local repo modules
+from .llm_utils import ALLOWED_CATEGORIES
 
 #============================================
 
@@ -37,6 +39,8 @@ class KeepResult:
 	stem_action: str
 	reason: str
 	raw_text: str
+	# "llm" or "rule:<name>" when a deterministic stem rule decided
+	decided_by: str = "llm"
 
 
 @dataclass(slots=True)
@@ -131,12 +135,21 @@ def parse_keep_response(
 	return KeepResult(stem_action=stem_action, reason=reason, raw_text=text)
 
 
+_FILE_BLOCK_RE = re.compile(
+	r"<file\b[^>]*?\bid\s*=\s*[\"']?([A-Za-z0-9_-]+)[\"']?[^>]*>(.*?)</file>",
+	flags=re.IGNORECASE | re.DOTALL,
+)
+_CANONICAL_CATEGORIES = {cat.lower(): cat for cat in ALLOWED_CATEGORIES}
+
+
 def parse_sort_response(text: str, expected_paths: list[str]) -> SortResult:
 	response_body = _coerce_response_body(text)
 	if not response_body:
 		raise ParseError("Missing required tags in sort response.", text)
+	if len(expected_paths) > 1:
+		return _parse_sort_batch(response_body, text, expected_paths)
 	if len(expected_paths) != 1:
-		raise ParseError("Sort responses only support a single file.", text)
+		raise ParseError("Sort responses need at least one file.", text)
 	categories = _find_tag_values(response_body, "category")
 	if not categories:
 		raise ParseError("Missing <category> in sort response.", text)
@@ -152,3 +165,69 @@ def parse_sort_response(text: str, expected_paths: list[str]) -> SortResult:
 		reasons={expected_paths[0]: reason} if reason else {},
 		raw_text=text,
 	)
+
+
+def _parse_sort_batch(response_body: str, text: str, expected_paths: list[str]) -> SortResult:
+	"""
+	Parse a batched sort reply with one <file id="Fn"> block per file.
+
+	IDs map positionally to expected_paths (F1 is the first path). Blocks
+	with unknown or repeated IDs, missing or duplicate <category> tags, or a
+	category outside ALLOWED_CATEGORIES are left out of the result so the
+	caller can re-ask for just those files.
+	"""
+	id_to_path = {f"f{idx}": path for idx, path in enumerate(expected_paths, start=1)}
+	blocks: dict[str, list[str]] = {}
+	for file_id, body in _FILE_BLOCK_RE.findall(response_body):
+		blocks.setdefault(file_id.lower(), []).append(body)
+	if not blocks:
+		raise ParseError("Missing <file> blocks in batched sort response.", text)
+	assignments: dict[str, str] = {}
+	reasons: dict[str, str] = {}
+	for file_id, bodies in blocks.items():
+		path = id_to_path.get(file_id)
+		if path is None or len(bodies) != 1:
+			continue
+		categories = _find_tag_values(bodies[0], "category")
+		if len(categories) != 1:
+			continue
+		category = _CANONICAL_CATEGORIES.get(categories[0].strip().lower())
+		if not category:
+			continue
+		assignments[path] = category
+		reason_values = _find_tag_values(bodies[0], "reason")
+		if len(reason_values) == 1 and reason_values[0].strip():
+			reasons[path] = reason_values[0].strip()
+	if not assignments:
+		raise ParseError("No valid <file> blocks in batched sort response.", text)
+	return SortResult(assignments=assignments, reasons=reasons, raw_text=text)
+
+
+def tags_closed(*tags: str) -> Callable[[str], bool]:
+	"""
+	Build a streaming stop check that passes once every tag has closed.
+
+	Args:
+		tags: Tag names the parser needs (e.g. "new_name", "reason").
+
+	Returns:
+		Predicate over the text generated so far.
+	"""
+	closers = [f"</{tag.lower()}>" for tag in tags]
+
+	def _check(text: str) -> bool:
+		lower = text.lower()
+		return all(closer in lower for closer in closers)
+
+	return _check
+
+
+def file_blocks_closed(count: int) -> Callable[[str], bool]:
+	"""
+	Build a streaming stop check for a batched sort reply with count files.
+	"""
+
+	def _check(text: str) -> bool:
+		return text.lower().count("</file>") >= count
+
+	return _check
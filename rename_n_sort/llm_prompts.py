@@ -61,6 +61,20 @@ SORT_EXAMPLE_OUTPUT = (
 	"<category>Document</category>\n"
 	"<reason>manual with model and year</reason>"
 )
+SORT_BATCH_EXAMPLE_OUTPUT = (
+	'<file id="F1"><category>Document</category>'
+	"<reason>manual with model and year</reason></file>\n"
+	'<file id="F2"><category>Image</category>'
+	"<reason>photo of a beach</reason></file>"
+)
+
+
+def sort_batch_ids(count: int) -> list[str]:
+	"""
+	Stable short IDs for files in a batched sort prompt (F1, F2, ...).
+	"""
+	ids = [f"F{idx}" for idx in range(1, count + 1)]
+	return ids
 
 
 def build_rename_prompt(req: RenameRequest) -> str:
@@ -180,6 +194,27 @@ def build_sort_prompt(req: SortRequest) -> str:
 	return "\n".join(lines)
 
 
+def build_sort_batch_prompt(req: SortRequest) -> str:
+	lines: list[str] = []
+	if req.context:
+		lines.append(f"Context: {req.context}")
+	lines.append("Assign one allowed category to each file below.")
+	lines.append("Give a short reason tied to the file details.")
+	lines.append("Allowed categories:")
+	for cat in ALLOWED_CATEGORIES:
+		lines.append(f"- {cat}")
+	lines.append("Files:")
+	for file_id, item in zip(sort_batch_ids(len(req.files)), req.files):
+		lines.append(
+			f"id={file_id} | path={item.path} | name={item.name} | ext={item.ext}"
+			f" | desc={item.description}"
+		)
+	lines.append("Return one <file> block per id, using only the tags shown below.")
+	lines.append("Example output:")
+	lines.append(SORT_BATCH_EXAMPLE_OUTPUT)
+	return "\n".join(lines)
+
+
 def build_format_fix_prompt(original_prompt: str, example_output: str) -> str:
 	lines = [
 		"Reply with tags only.",
@@ -47,6 +47,7 @@ _UUID_RE = re.compile(
 )
 _HEX_BLOB_RE = re.compile(r"\b[0-9a-fA-F]{8,}\b")
 _LONG_DIGIT_RUN_RE = re.compile(r"\d{8,}")
+_DIGIT_RUN_RE = re.compile(r"\d+")
 _TOKEN_SPLIT_RE = re.compile(r"[-_.\s]+")
 _GENERIC_LABEL_RE = re.compile(
 	r"^(img|dsc|scan|screenshot|document|download|file|image|photo|picture)[-_ .]*\d+$",
@@ -230,6 +231,7 @@ def compute_stem_features(original_stem: str, suggested_name: str) -> dict[str,
 	has_letter = letters > 0
 	is_numeric_only = bool(stem) and stem.isdigit()
 	long_digit_run = bool(_LONG_DIGIT_RUN_RE.search(stem))
+	max_digit_run = max((len(run) for run in _DIGIT_RUN_RE.findall(stem)), default=0)
 	uuid_like = bool(_UUID_RE.match(stem))
 	hex_blob = bool(_HEX_BLOB_RE.search(stem))
 	generic_label = bool(_GENERIC_LABEL_RE.match(stem))
@@ -240,6 +242,7 @@ def compute_stem_features(original_stem: str, suggested_name: str) -> dict[str,
 		"token_count": token_count,
 		"is_numeric_only": is_numeric_only,
 		"long_digit_run": long_digit_run,
+		"max_digit_run": max_digit_run,
 		"digit_ratio": round(digit_ratio, 3),
 		"uuid_like": uuid_like,
 		"hex_blob": hex_blob,
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Persistent SQLite cache for plugin FileMetadata.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import os
+import json
+import time
+from pathlib import Path
+
+# local repo modules
+from .plugins import FileMetadata, FileMetadataPlugin
+from .sqlite_cache import SqliteLruCache
+
+#============================================
+
+
+METADATA_CACHE_FILENAME = "metadata_cache.sqlite3"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# entries keyed without extraction settings can never be looked up again
+_DROP_V1 = "DROP TABLE IF EXISTS metadata"
+_SCHEMA = (
+	"CREATE TABLE IF NOT EXISTS metadata_v2 ("
+	" st_dev INTEGER NOT NULL,"
+	" st_ino INTEGER NOT NULL,"
+	" st_size INTEGER NOT NULL,"
+	" st_mtime_ns INTEGER NOT NULL,"
+	" plugin TEXT NOT NULL,"
+	" plugin_version TEXT NOT NULL,"
+	" settings TEXT NOT NULL,"
+	" payload TEXT NOT NULL,"
+	" payload_bytes INTEGER NOT NULL,"
+	" last_access REAL NOT NULL,"
+	" PRIMARY KEY (st_dev, st_ino, st_size, st_mtime_ns, plugin, plugin_version, settings))"
+)
+_INDEX = "CREATE INDEX IF NOT EXISTS metadata_v2_last_access ON metadata_v2 (last_access)"
+_WHERE_KEY = (
+	"st_dev=? AND st_ino=? AND st_size=? AND st_mtime_ns=? AND plugin=?"
+	" AND plugin_version=? AND settings=?"
+)
+
+#============================================
+
+
+class MetadataCache(SqliteLruCache):
+	"""
+	Cache of extracted FileMetadata keyed by stat identity and plugin version.
+
+	Entries are keyed on (device, inode, size, mtime_ns, plugin name,
+	plugin version, extraction settings), so edited files, moved-in
+	replacements, plugin upgrades and changed OCR/render settings all miss.
+	Degraded extractions (FileMetadata.degraded) are never stored. The
+	table is trimmed least-recently-used first once the stored payloads
+	exceed max_bytes. Safe to share across threads.
+	"""
+
+	#============================================
+	def __init__(
+		self,
+		db_path: Path,
+		max_bytes: int = DEFAULT_MAX_BYTES,
+		refresh: bool = False,
+		settings: str = "",
+	) -> None:
+		"""
+		Open (or create) the cache database.
+
+		Args:
+			db_path: SQLite file path.
+			max_bytes: Payload size budget before LRU eviction.
+			refresh: When True, ignore stored entries but still write new ones.
+			settings: Fingerprint of the settings that change plugin output.
+		"""
+		self.settings = settings
+		super().__init__(
+			db_path,
+			(_DROP_V1, _SCHEMA, _INDEX),
+			table="metadata_v2",
+			size_column="payload_bytes",
+			max_bytes=max_bytes,
+			refresh=refresh,
+		)
+
+	#============================================
+	def _key(self, path: Path, plugin: FileMetadataPlugin) -> tuple:
+		file_stat = os.stat(path)
+		key = (
+			file_stat.st_dev,
+			file_stat.st_ino,
+			file_stat.st_size,
+			file_stat.st_mtime_ns,
+			plugin.name,
+			str(plugin.version),
+			self.settings,
+		)
+		return key
+
+	#============================================
+	def get(self, path: Path, plugin: FileMetadataPlugin) -> FileMetadata | None:
+		"""
+		Look up cached metadata for a file.
+
+		Args:
+			path: File path.
+			plugin: Plugin that would extract the file.
+
+		Returns:
+			FileMetadata on a hit, otherwise None.
+		"""
+		if self.refresh:
+			self._count_miss()
+			return None
+		key = self._key(path, plugin)
+		with self._lock:
+			row = self._conn.execute(
+				f"SELECT payload FROM metadata_v2 WHERE {_WHERE_KEY}",
+				key,
+			).fetchone()
+			if row is None:
+				self.misses += 1
+				return None
+			self._conn.execute(
+				f"UPDATE metadata_v2 SET last_access=? WHERE {_WHERE_KEY}",
+				(time.time(),) + key,
+			)
+			self._conn.commit()
+			self.hits += 1
+		meta = _deserialize(path, plugin.name, row[0])
+		return meta
+
+	#============================================
+	def contains(self, path: Path, plugin: FileMetadataPlugin) -> bool:
+		"""
+		True when get() would hit, without counting it or touching last_access.
+		"""
+		if self.refresh:
+			return False
+		key = self._key(path, plugin)
+		with self._lock:
+			row = self._conn.execute(
+				f"SELECT 1 FROM metadata_v2 WHERE {_WHERE_KEY}",
+				key,
+			).fetchone()
+		return row is not None
+
+	#============================================
+	def put(self, path: Path, plugin: FileMetadataPlugin, meta: FileMetadata) -> None:
+		"""
+		Store metadata for a file and trim the cache if needed.
+
+		Degraded metadata is skipped so the next run extracts the file again.
+
+		Args:
+			path: File path.
+			plugin: Plugin that extracted the metadata.
+			meta: Extracted metadata.
+		"""
+		if meta.degraded:
+			return
+		key = self._key(path, plugin)
+		payload = _serialize(meta)
+		payload_bytes = len(payload.encode("utf-8"))
+		with self._lock:
+			self._conn.execute(
+				"INSERT OR REPLACE INTO metadata_v2 (st_dev, st_ino, st_size, st_mtime_ns, plugin,"
+				" plugin_version, settings, payload, payload_bytes, last_access)"
+				" VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+				key + (payload, payload_bytes, time.time()),
+			)
+			self._evict_locked()
+			self._conn.commit()
+
+
+#============================================
+
+
+def _serialize(meta: FileMetadata) -> str:
+	"""
+	Encode the cacheable FileMetadata fields as JSON.
+	"""
+	payload = {
+		"title": meta.title,
+		"keywords": list(meta.keywords),
+		"summary": meta.summary,
+		"extra": meta.extra,
+	}
+	# default=str keeps odd extra values (dates, paths) from failing the write
+	text = json.dumps(payload, default=str)
+	return text
+
+
+#============================================
+
+
+def _deserialize(path: Path, plugin_name: str, text: str) -> FileMetadata:
+	"""
+	Rebuild FileMetadata from a cached JSON payload.
+	"""
+	payload = json.loads(text)
+	meta = FileMetadata(
+		path=path,
+		title=payload.get("title"),
+		keywords=list(payload.get("keywords") or []),
+		summary=payload.get("summary"),
+		plugin_name=plugin_name,
+		extra=dict(payload.get("extra") or {}),
+	)
+	return meta
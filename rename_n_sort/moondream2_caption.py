@@ -18,6 +18,8 @@ import transformers.utils.logging as translogging
 
 
 MODEL_ID = "vikhyatk/moondream2"
+# this revision captions one image per caption()/query() call; it has no
+# batched encode or generate, so callers cannot group images per model call
 MODEL_REVISION = "2025-01-09"
 
 
@@ -102,7 +104,17 @@ def generate_caption(image_path: str, ai_components: dict) -> str:
 	"""
 	Generate a caption for an image using Moondream2.
 	"""
-	image = Image.open(image_path)
+	with Image.open(image_path) as image:
+		caption = caption_image(image, ai_components)
+	return caption
+
+
+def caption_image(image: Image.Image | str, ai_components: dict) -> str:
+	"""
+	Generate a caption for an image path or an already-open PIL image.
+	"""
+	if not isinstance(image, Image.Image):
+		return generate_caption(str(image), ai_components)
 	image = _resize_image(image, 1280)
 	model = ai_components["model"]
 	prompt = ai_components.get("prompt")
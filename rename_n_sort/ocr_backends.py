@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+OCR engines behind the shared OCR pool: in-process tesserocr or pytesseract.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import shutil
+import threading
+import importlib.util
+
+OCR_BACKENDS = ("auto", "tesserocr", "pytesseract")
+DEFAULT_LANG = "eng"
+
+# one tesserocr API handle per worker process (per thread under a thread pool)
+_LOCAL = threading.local()
+
+#============================================
+
+
+class PytesseractBackend:
+	"""
+	Run the tesseract binary through pytesseract.
+
+	Every call writes the image to a temp file, starts tesseract (which
+	reloads the language data) and reads the result back from disk. The
+	timeout kills the tesseract process.
+	"""
+
+	name = "pytesseract"
+
+	#============================================
+	def __init__(self, lang: str = DEFAULT_LANG) -> None:
+		self.lang = lang
+
+	#============================================
+	@staticmethod
+	def available() -> bool:
+		"""
+		True when pytesseract is installed and the tesseract binary is on PATH.
+		"""
+		found = importlib.util.find_spec("pytesseract") is not None
+		return found and shutil.which("tesseract") is not None
+
+	#============================================
+	def __call__(self, image: object, timeout_seconds: float) -> str:
+		"""
+		OCR a PIL image and return the raw text.
+
+		Raises:
+			TimeoutError: When tesseract runs past timeout_seconds.
+		"""
+		# imported here so pytesseract loads only in the OCR worker processes
+		import pytesseract
+		try:
+			text = pytesseract.image_to_string(image, lang=self.lang, timeout=timeout_seconds)
+		except RuntimeError as exc:
+			# pytesseract kills the tesseract process and raises RuntimeError
+			if "timeout" in str(exc).lower():
+				raise TimeoutError(f"OCR exceeded {timeout_seconds:.0f}s") from None
+			raise
+		return text
+
+
+#============================================
+
+
+class TesserocrBackend:
+	"""
+	Run Tesseract in process through a persistent tesserocr API handle.
+
+	The handle (and its language data) is created once per worker process
+	and reused for every image, which is handed over from memory with no
+	temp files or process start. The timeout is passed to Recognize() as a
+	deadline, since an in-process call cannot be killed. make_backend()
+	checks ready() first, so workers only build a backend that can load.
+	"""
+
+	name = "tesserocr"
+
+	#============================================
+	def __init__(self, lang: str = DEFAULT_LANG) -> None:
+		self.lang = lang
+
+	#============================================
+	@staticmethod
+	def available() -> bool:
+		"""
+		True when the tesserocr module is installed.
+		"""
+		return importlib.util.find_spec("tesserocr") is not None
+
+	#============================================
+	@staticmethod
+	def ready(lang: str = DEFAULT_LANG) -> bool:
+		"""
+		True when tesserocr imports and finds tessdata for every language in lang.
+		"""
+		if not TesserocrBackend.available():
+			return False
+		try:
+			import tesserocr
+			_, languages = tesserocr.get_languages()
+		except (ImportError, RuntimeError):
+			return False
+		return all(part in languages for part in lang.split("+"))
+
+	#============================================
+	def __call__(self, image: object, timeout_seconds: float) -> str:
+		"""
+		OCR a PIL image and return the raw text.
+
+		Raises:
+			TimeoutError: When recognition runs past timeout_seconds.
+		"""
+		api = _tesserocr_api(self.lang)
+		try:
+			api.SetImage(image)
+			if not api.Recognize(timeout=int(timeout_seconds * 1000)):
+				raise TimeoutError(f"OCR exceeded {timeout_seconds:.0f}s")
+			text = api.GetUTF8Text()
+		finally:
+			api.Clear()
+		return text
+
+
+#============================================
+
+
+def _tesserocr_api(lang: str) -> object:
+	handles = getattr(_LOCAL, "handles", None)
+	if handles is None:
+		handles = {}
+		_LOCAL.handles = handles
+	if lang not in handles:
+		# imported here so tesserocr loads only in the OCR worker processes
+		import tesserocr
+		handles[lang] = tesserocr.PyTessBaseAPI(lang=lang)
+	return handles[lang]
+
+
+#============================================
+
+
+def make_backend(name: str = "auto", lang: str = DEFAULT_LANG) -> PytesseractBackend | TesserocrBackend:
+	"""
+	Build an OCR backend by name.
+
+	Args:
+		name: "tesserocr", "pytesseract", or "auto" (tesserocr when it is
+			installed with tessdata for lang, else pytesseract).
+		lang: Tesseract language code(s), e.g. "eng" or "eng+deu".
+
+	Returns:
+		Picklable backend taking (image, timeout_seconds).
+
+	Raises:
+		ValueError: When name is not a known backend.
+		RuntimeError: When tesserocr is requested by name but cannot run.
+	"""
+	if name == "auto":
+		name = TesserocrBackend.name if TesserocrBackend.ready(lang) else PytesseractBackend.name
+	if name == TesserocrBackend.name:
+		if not TesserocrBackend.ready(lang):
+			raise RuntimeError(
+				f"OCR backend 'tesserocr' requested but tesserocr is not installed"
+				f" or has no tessdata for '{lang}'; install it or use --ocr-backend pytesseract."
+			)
+		return TesserocrBackend(lang)
+	if name == PytesseractBackend.name:
+		return PytesseractBackend(lang)
+	raise ValueError(f"Unknown OCR backend: {name}")
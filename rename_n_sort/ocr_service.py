@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Process-wide OCR pool shared by the image and PDF plugins.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import os
+import time
+import atexit
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections.abc import Callable
+
+# local repo modules
+from .ocr_backends import make_backend
+
+DEFAULT_TIMEOUT_SECONDS = 60.0
+
+#============================================
+
+
+def available_cores() -> int:
+	"""
+	Return the number of CPU cores this process may run on.
+	"""
+	if hasattr(os, "sched_getaffinity"):
+		return max(1, len(os.sched_getaffinity(0)))
+	return max(1, os.cpu_count() or 1)
+
+
+#============================================
+
+
+def _init_worker() -> None:
+	# one tesseract thread per process; the pool already uses every core
+	os.environ["OMP_THREAD_LIMIT"] = "1"
+
+
+#============================================
+
+
+def _process_pool(workers: int) -> Executor:
+	executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+	return executor
+
+
+#============================================
+
+
+class OcrService:
+	"""
+	Thread-safe OCR front end over a pool of worker processes.
+
+	Callers on any thread submit() decoded PIL images and get futures back,
+	so a PDF can OCR all of its pages at once and concurrent extract workers
+	share the same pool. The pool starts on the first submit() with one
+	process per available core. The OCR engine is picked by backend name
+	(see ocr_backends); each image gets timeout_seconds of OCR time, past
+	which the future raises TimeoutError. Counters track queue depth and
+	throughput for the run summary.
+	"""
+
+	#============================================
+	def __init__(
+		self,
+		backend: str = "auto",
+		run_ocr: Callable[[object, float], str] | None = None,
+		workers: int = 0,
+		timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+		executor_factory: Callable[[int], Executor] = _process_pool,
+	) -> None:
+		"""
+		Create an idle service; no process starts until the first submit().
+
+		Args:
+			backend: "auto", "tesserocr" or "pytesseract"; resolved when the
+				pool starts.
+			run_ocr: Picklable callable taking (image, timeout_seconds) and
+				returning raw OCR text, used instead of backend; it must
+				enforce the timeout itself.
+			workers: Worker processes (0 uses every available core).
+			timeout_seconds: OCR time allowed per image.
+			executor_factory: Builds the executor for a worker count (swap in
+				a thread pool for tests).
+		"""
+		self.backend = backend
+		self._run_ocr = run_ocr
+		self.workers = workers
+		self.timeout_seconds = timeout_seconds
+		self._executor_factory = executor_factory
+		self._executor: Executor | None = None
+		self._lock = threading.Lock()
+		self.submitted = 0
+		self.completed = 0
+		self.failures = 0
+		self.timeouts = 0
+		self.max_queue_depth = 0
+		self.busy_seconds = 0.0
+		self._busy_since: float | None = None
+
+	#============================================
+	@property
+	def queue_depth(self) -> int:
+		"""
+		Images submitted and not finished yet (queued or running).
+		"""
+		with self._lock:
+			return self.submitted - self.completed - self.failures
+
+	#============================================
+	def submit(self, image: object) -> Future:
+		"""
+		Queue a decoded image for OCR.
+
+		Args:
+			image: PIL image (sent to a worker process by pickling).
+
+		Returns:
+			Future resolving to the raw OCR text, or raising TimeoutError when
+			the image runs past timeout_seconds.
+		"""
+		with self._lock:
+			executor = self._ensure_executor()
+			try:
+				future = executor.submit(self._run_ocr, image, self.timeout_seconds)
+			except BrokenProcessPool:
+				# a crashed worker poisons the pool; start a fresh one
+				self._executor = None
+				executor = self._ensure_executor()
+				future = executor.submit(self._run_ocr, image, self.timeout_seconds)
+			self.submitted += 1
+			depth = self.submitted - self.completed - self.failures
+			self.max_queue_depth = max(self.max_queue_depth, depth)
+			if self._busy_since is None:
+				self._busy_since = time.monotonic()
+		future.add_done_callback(self._finished)
+		return future
+
+	#============================================
+	def ocr(self, image: object) -> str:
+		"""
+		OCR one image and wait for the text.
+		"""
+		text = self.submit(image).result()
+		return text
+
+	#============================================
+	def _ensure_executor(self) -> Executor:
+		if self._run_ocr is None:
+			self._run_ocr = make_backend(self.backend)
+		if self._executor is None:
+			workers = self.workers if self.workers > 0 else available_cores()
+			self._executor = self._executor_factory(workers)
+		return self._executor
+
+	#============================================
+	def _finished(self, future: Future) -> None:
+		error = None if future.cancelled() else future.exception()
+		with self._lock:
+			if error is None and not future.cancelled():
+				self.completed += 1
+			else:
+				self.failures += 1
+				if isinstance(error, TimeoutError):
+					self.timeouts += 1
+			if self.submitted == self.completed + self.failures and self._busy_since is not None:
+				self.busy_seconds += time.monotonic() - self._busy_since
+				self._busy_since = None
+
+	#============================================
+	def stats(self) -> dict[str, float | int | str]:
+		"""
+		Return queue depth and throughput counters.
+		"""
+		with self._lock:
+			busy = self.busy_seconds
+			if self._busy_since is not None:
+				busy += time.monotonic() - self._busy_since
+			rate = self.completed / busy if busy > 0 else 0.0
+			return {
+				"backend": getattr(self._run_ocr, "name", self.backend),
+				"submitted": self.submitted,
+				"completed": self.completed,
+				"failures": self.failures,
+				"timeouts": self.timeouts,
+				"queue_depth": self.submitted - self.completed - self.failures,
+				"max_queue_depth": self.max_queue_depth,
+				"busy_seconds": round(busy, 3),
+				"images_per_second": round(rate, 3),
+			}
+
+	#============================================
+	def close(self) -> None:
+		"""
+		Shut the worker pool down; a later submit() starts a new one.
+		"""
+		with self._lock:
+			executor = self._executor
+			self._executor = None
+		if executor is not None:
+			executor.shutdown(wait=True, cancel_futures=True)
+
+
+#============================================
+
+
+_SHARED: OcrService | None = None
+_SHARED_LOCK = threading.Lock()
+
+#============================================
+
+
+def get_ocr_service() -> OcrService:
+	"""
+	Return the process-wide OCR service, creating it (idle) on first use.
+	"""
+	global _SHARED
+	with _SHARED_LOCK:
+		if _SHARED is None:
+			_SHARED = OcrService()
+			atexit.register(_SHARED.close)
+		return _SHARED
+
+
+#============================================
+
+
+def set_ocr_service(service: OcrService | None) -> OcrService | None:
+	"""
+	Replace the process-wide OCR service (tests, alternate settings).
+
+	Returns:
+		The previous service.
+	"""
+	global _SHARED
+	with _SHARED_LOCK:
+		previous = _SHARED
+		_SHARED = service
+	return previous
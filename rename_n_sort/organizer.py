@@ -5,6 +5,7 @@ Core organizer: metadata -> LLM -> rename plan.
 
 # Standard Library
 import logging
+import contextlib
 import re
 from datetime import datetime, timezone
 from dataclasses import dataclass
@@ -13,11 +14,19 @@ import sys
 import os
 
 # local repo modules
+from .captioner import get_captioner
 from .config import AppConfig
 from .llm_engine import LLMEngine
 from .llm_prompts import SortItem
 from .llm_utils import normalize_reason, sanitize_filename
+from .metadata_cache import METADATA_CACHE_FILENAME, MetadataCache
+from .ocr_backends import make_backend
+from .ocr_service import get_ocr_service
+from .pipeline import StageResult, run_pipeline
 from .plugins import FileMetadata, PluginRegistry, build_registry
+from .plugins.mdls_utils import get_mdls_provider
+from .plugins.pdf_pages import get_pdf_page_router
+from .plugins.soffice_service import LEGACY_FORMATS, get_soffice_converter
 from .renamer import apply_move
 from .scanner import iter_files
 
@@ -49,6 +58,26 @@ class PlannedChange:
 #============================================
 
 
+@dataclass(slots=True)
+class _StagedFile:
+	"""
+	Per-file state handed between pipeline stages.
+	"""
+
+	path: Path
+	skip_error: str = ""
+	skip_action: str = ""
+	metadata: FileMetadata | None = None
+	plan: PlannedChange | None = None
+	summary: SortItem | None = None
+	sort_selection: str = "Other"
+	sort_reason: str = ""
+	sort_error: Exception | None = None
+
+
+#============================================
+
+
 class Organizer:
 	"""
 	Orchestrates scanning and renaming.
@@ -189,6 +218,57 @@ class Organizer:
 		except Exception:
 			return
 
+	#============================================
+	def _print_run_stats(self) -> None:
+		tag = self._color("[CACHE]", "36")
+		if self.metadata_cache is not None:
+			cache = self.metadata_cache
+			print(f"{tag} metadata hits={cache.hits} misses={cache.misses}")
+		response_cache = getattr(self.llm, "response_cache", None)
+		if response_cache is not None:
+			print(f"{tag} llm hits={response_cache.hits} misses={response_cache.misses}")
+		for transport in getattr(self.llm, "transports", []):
+			early_stops = getattr(transport, "early_stops", 0)
+			if early_stops:
+				print(
+					f"{self._color('[LLM]', '36')} {transport.name} streaming stopped early"
+					f" {early_stops} time(s), up to {transport.tokens_saved} tokens saved"
+				)
+		captioner = get_captioner()
+		if captioner.loaded:
+			stats = captioner.stats()
+			print(
+				f"{self._color('[CAPTION]', '35')} load={stats['load_seconds']:.2f}s"
+				f" captions={stats['captions']} avg={stats['avg_caption_seconds']:.2f}s"
+				f" max={stats['max_caption_seconds']:.2f}s"
+			)
+		ocr_stats = get_ocr_service().stats()
+		if ocr_stats["submitted"]:
+			print(
+				f"{self._color('[OCR]', '35')} backend={ocr_stats['backend']}"
+				f" images={ocr_stats['completed']}"
+				f" failed={ocr_stats['failures']} timeouts={ocr_stats['timeouts']}"
+				f" max_queue={ocr_stats['max_queue_depth']}"
+				f" rate={ocr_stats['images_per_second']:.2f}/s"
+			)
+		page_stats = get_pdf_page_router().stats()
+		if page_stats["pages_checked"]:
+			print(
+				f"{self._color('[PDF]', '35')} pages={page_stats['pages_checked']}"
+				f" rendered={page_stats['pages_rendered']}"
+				f" renders_skipped={page_stats['renders_skipped']}"
+				f" embedded={page_stats['embedded_images']}"
+			)
+		converter_stats = get_soffice_converter().stats()
+		if converter_stats["process_starts"] or converter_stats["cache_hits"]:
+			print(
+				f"{self._color('[SOFFICE]', '35')} converted={converter_stats['conversions']}"
+				f" failed={converter_stats['failures']} timeouts={converter_stats['timeouts']}"
+				f" starts={converter_stats['process_starts']}"
+				f" cache_hits={converter_stats['cache_hits']}"
+				f" time={converter_stats['convert_seconds']:.2f}s"
+			)
+
 	#============================================
 	def _log_run_metrics(self, plans: list[PlannedChange]) -> None:
 		if not plans:
@@ -292,6 +372,12 @@ class Organizer:
 	#============================================
 	def _plan_one(self, path: Path) -> tuple[PlannedChange, SortItem]:
 		metadata = self._collect_metadata(path)
+		return self._plan_from_metadata(path, metadata)
+
+	#============================================
+	def _plan_from_metadata(
+		self, path: Path, metadata: FileMetadata
+	) -> tuple[PlannedChange, SortItem]:
 		pdf_text = metadata.extra.get("pdf_text") if metadata else None
 		if pdf_text:
 			if self._normalize_text(metadata.summary) != self._normalize_text(pdf_text):
@@ -310,6 +396,10 @@ class Organizer:
 		stem_reason = keep_result.reason
 		stem_raw = keep_result.raw_text
 		stem_reason = normalize_reason(stem_reason)
+		decided_by = getattr(keep_result, "decided_by", "llm")
+		if stem_reason:
+			# tag only real reasons so an empty one still reads as unjustified
+			stem_reason = f"[{decided_by}] {stem_reason}"
 		stem_action, override_reason = self._apply_doc_type_safeguard(
 			path=path,
 			meta_payload=meta_payload,
@@ -355,13 +445,48 @@ class Organizer:
 	#============================================
 	def __init__(self, config: AppConfig, llm: LLMEngine | None = None) -> None:
 		self.config = config
-		self.registry: PluginRegistry = build_registry()
+		self.registry: PluginRegistry = build_registry(sniff=config.sniff_content)
 		self._supported_extensions = self._collect_supported_extensions()
+		converter = get_soffice_converter()
+		converter.workers = max(1, config.soffice_workers)
+		converter.timeout_seconds = config.soffice_timeout
+		get_pdf_page_router().min_text_chars = config.pdf_min_text_chars
+		ocr_service = get_ocr_service()
+		ocr_service.backend = config.ocr_backend
+		if config.ocr_backend != "auto":
+			# a named engine that cannot run fails here, not on the first image
+			make_backend(config.ocr_backend)
+		ocr_service.workers = max(0, config.ocr_workers)
+		ocr_service.timeout_seconds = config.ocr_timeout
 		if not llm:
 			raise RuntimeError("Organizer requires a configured LLM backend.")
 		self.llm = llm
+		self.metadata_cache: MetadataCache | None = None
+		if config.cache_mode != "off":
+			self.metadata_cache = MetadataCache(
+				config.normalized_cache_dir() / METADATA_CACHE_FILENAME,
+				refresh=config.cache_mode == "refresh",
+				settings=self._extraction_settings(),
+			)
 		self._reset_run_logs()
 
+	#============================================
+	def _extraction_settings(self) -> str:
+		"""
+		Fingerprint of the settings and tools that change extracted metadata.
+
+		Part of the metadata cache key, so a run with another OCR engine,
+		PDF render threshold or mdls availability re-extracts instead of
+		reusing entries made under different settings.
+		"""
+		ocr_engine = make_backend(self.config.ocr_backend).name
+		mdls = "on" if get_mdls_provider().available else "off"
+		settings = (
+			f"pdf_min_text_chars={self.config.pdf_min_text_chars}"
+			f";ocr={ocr_engine};mdls={mdls}"
+		)
+		return settings
+
 	#============================================
 	def _reset_run_logs(self) -> None:
 		start_line = f"RUN_START {datetime.now(timezone.utc).isoformat(timespec='seconds')}\n"
@@ -377,6 +502,26 @@ class Organizer:
 			except Exception:
 				continue
 
+	#============================================
+	def _prefetch_conversions(self, files: list[Path]) -> None:
+		"""
+		Queue soffice conversions for the legacy DOC/PPT files to be extracted.
+
+		Queued together, they convert in batches in the background instead
+		of one soffice start per file as each plugin reaches it. Files whose
+		metadata is already cached are skipped.
+		"""
+		pending: list[Path] = []
+		for path in files:
+			if path.suffix.lower().lstrip(".") not in LEGACY_FORMATS or not path.is_file():
+				continue
+			cache = self.metadata_cache
+			if cache is not None and cache.contains(path, self.registry.for_path(path)):
+				continue
+			pending.append(path)
+		if pending:
+			get_soffice_converter().prefetch(pending)
+
 	#============================================
 	def plan(self, files: list[Path] | None = None) -> list[PlannedChange]:
 		"""
@@ -388,6 +533,10 @@ class Organizer:
 		plans: list[PlannedChange] = []
 		summaries: list[SortItem] = []
 		candidates = files if files is not None else iter_files(self.config)
+		if files is not None:
+			# one multi-file mdls call per chunk instead of several per file
+			get_mdls_provider().prefetch(files)
+			self._prefetch_conversions(files)
 		first = True
 		for idx, path in enumerate(candidates):
 			if not first:
@@ -433,93 +582,160 @@ class Organizer:
 		if self.config.dry_run:
 			self._print_dry_run_summary(plans)
 		self._log_run_metrics(plans)
+		self._print_run_stats()
 		return plans
 
 	#============================================
 	def process_one_by_one(self, files: list[Path] | None = None) -> list[PlannedChange]:
 		"""
 		Process files to completion one by one (RENAME -> DEST -> DRY RUN/APPLY).
+
+		Metadata extraction, LLM planning and apply run as a pipeline: the
+		next files are extracted while the LLM works on the current one.
+		Console output and moves still happen per file in input order.
 		"""
 		plans: list[PlannedChange] = []
 		candidates = files if files is not None else iter_files(self.config)
+		if files is not None:
+			# one multi-file mdls call per chunk instead of several per file
+			get_mdls_provider().prefetch(files)
+			self._prefetch_conversions(files)
+		results = run_pipeline(
+			candidates,
+			self._extract_stage,
+			self._llm_stage,
+			first_workers=self.config.extract_workers,
+			# LLM-stage threads only wait on the shared engine loop, whose
+			# semaphore caps the calls; one thread per allowed call keeps it full
+			second_workers=max(self.config.llm_workers, self.config.max_concurrency),
+			max_in_flight=max(self.config.pipeline_queue_size, self.config.max_concurrency),
+		)
 		first = True
-		for path in candidates:
-			if not first:
-				self._print_separator()
-			first = False
-			print(f"{self._color('[FILE]', '34')} {self._display_path(path)}")
-			if not path.exists() or not path.is_file():
-				self._print_why("error", "Path is not a file")
-				self._print_why("action", "skipping path")
-				continue
-			if not self._is_supported_extension(path):
-				ext = path.suffix.lower().lstrip(".")
-				self._print_why("error", f"Unsupported extension: .{ext}")
-				self._print_why("action", "skipping file due to unsupported extension")
-				continue
-			try:
-				plan, summary = self._plan_one(path)
-			except Exception as exc:
-				self._print_why("error", f"{exc.__class__.__name__}: {exc}")
+		# closing() shuts the workers down and restores stdout if apply raises
+		with contextlib.closing(results):
+			for result in results:
+				if not first:
+					self._print_separator()
+				first = False
+				plan = self._apply_stage(result)
+				if plan is not None:
+					plans.append(plan)
+		if self.config.dry_run:
+			self._print_dry_run_summary(plans)
+		self._log_run_metrics(plans)
+		self._print_run_stats()
+		return plans
+
+	#============================================
+	def _extract_stage(self, path: Path) -> _StagedFile:
+		"""
+		Pipeline stage one: validate the path and collect plugin metadata.
+		"""
+		staged = _StagedFile(path=path)
+		if not path.exists() or not path.is_file():
+			staged.skip_error = "Path is not a file"
+			staged.skip_action = "skipping path"
+			return staged
+		if not self._is_supported_extension(path):
+			ext = path.suffix.lower().lstrip(".")
+			staged.skip_error = f"Unsupported extension: .{ext}"
+			staged.skip_action = "skipping file due to unsupported extension"
+			return staged
+		staged.metadata = self._collect_metadata(path)
+		return staged
+
+	#============================================
+	def _llm_stage(self, path: Path, staged: _StagedFile) -> _StagedFile:
+		"""
+		Pipeline stage two: rename, stem_action and sort LLM calls.
+		"""
+		if staged.skip_error or staged.metadata is None:
+			return staged
+		plan, summary = self._plan_from_metadata(path, staged.metadata)
+		staged.plan = plan
+		staged.summary = summary
+		try:
+			result = self.llm.sort([summary])
+			staged.sort_selection = result.assignments.get(summary.path, "Other")
+			staged.sort_reason = result.reasons.get(summary.path, "")
+		except Exception as exc:
+			staged.sort_error = exc
+		return staged
+
+	#============================================
+	def _apply_stage(self, result: StageResult) -> PlannedChange | None:
+		"""
+		Pipeline stage three: print the file report and apply the move.
+		"""
+		path = result.item
+		print(f"{self._color('[FILE]', '34')} {self._display_path(path)}")
+		if result.output:
+			sys.stdout.write(result.output)
+		if result.error is not None:
+			exc = result.error
+			self._print_why("error", f"{exc.__class__.__name__}: {exc}")
+			if result.failed_stage == "first":
+				self._print_why("action", "skipping file due to metadata extraction error")
+			else:
 				self._print_why("action", "skipping file due to LLM error")
-				continue
-			desc = summary.description or ""
-			self._print_meta("text sample", desc)
-			self._print_why("rename_reason", plan.rename_reason)
-			stem_detail = plan.stem_action
-			if plan.stem_reason:
-				stem_detail = f"{stem_detail} ({plan.stem_reason})"
-			elif plan.stem_action == "keep":
-				stem_detail = f"{stem_detail} (no justification provided)"
-			self._print_why("stem_action", stem_detail)
-			self._print_pair(
-				"RENAME",
-				self._display_path(plan.source),
-				plan.new_name,
-				f"(plugin={plan.plugin})",
-			)
-			try:
-				result = self.llm.sort([summary])
-				selection = result.assignments.get(summary.path, "Other")
-				sort_reason = result.reasons.get(summary.path, "")
-			except Exception as exc:
-				self._print_why("error", f"{exc.__class__.__name__}: {exc}")
-				self._print_why("action", "using fallback category Other")
-				selection = "Other"
-				sort_reason = ""
-			category = selection.split("/")[0] if selection else "Other"
-			plan.category = category
-			plan.category_reason = sort_reason
-			plan.target = self._target_path(plan.source, plan.new_name, category)
-			self._log_sort_decision(plan)
+			return None
+		staged = result.value
+		if staged.skip_error:
+			self._print_why("error", staged.skip_error)
+			self._print_why("action", staged.skip_action)
+			return None
+		plan = staged.plan
+		summary = staged.summary
+		desc = summary.description or ""
+		self._print_meta("text sample", desc)
+		self._print_why("rename_reason", plan.rename_reason)
+		stem_detail = plan.stem_action
+		if plan.stem_reason:
+			stem_detail = f"{stem_detail} ({plan.stem_reason})"
+		elif plan.stem_action == "keep":
+			stem_detail = f"{stem_detail} (no justification provided)"
+		self._print_why("stem_action", stem_detail)
+		self._print_pair(
+			"RENAME",
+			self._display_path(plan.source),
+			plan.new_name,
+			f"(plugin={plan.plugin})",
+		)
+		selection = staged.sort_selection
+		if staged.sort_error is not None:
+			exc = staged.sort_error
+			self._print_why("error", f"{exc.__class__.__name__}: {exc}")
+			self._print_why("action", "using fallback category Other")
+			selection = "Other"
+		category = selection.split("/")[0] if selection else "Other"
+		plan.category = category
+		plan.category_reason = staged.sort_reason
+		plan.target = self._target_path(plan.source, plan.new_name, category)
+		self._log_sort_decision(plan)
+		self._print_pair(
+			"DEST",
+			self._display_path(plan.source),
+			self._display_target(plan.target),
+			f"(category={plan.category}, plugin={plan.plugin})",
+		)
+		self._print_why("category_reason", plan.category_reason)
+		if self.config.dry_run:
 			self._print_pair(
-				"DEST",
+				"DRY RUN",
 				self._display_path(plan.source),
 				self._display_target(plan.target),
 				f"(category={plan.category}, plugin={plan.plugin})",
 			)
-			self._print_why("category_reason", plan.category_reason)
-			if self.config.dry_run:
+		else:
+			plan.target = apply_move(plan.source, plan.target, dry_run=False)
+			if plan.target.exists():
 				self._print_pair(
-					"DRY RUN",
+					"APPLY",
 					self._display_path(plan.source),
 					self._display_target(plan.target),
 					f"(category={plan.category}, plugin={plan.plugin})",
 				)
-			else:
-				plan.target = apply_move(plan.source, plan.target, dry_run=False)
-				if plan.target.exists():
-					self._print_pair(
-						"APPLY",
-						self._display_path(plan.source),
-						self._display_target(plan.target),
-						f"(category={plan.category}, plugin={plan.plugin})",
-					)
-			plans.append(plan)
-		if self.config.dry_run:
-			self._print_dry_run_summary(plans)
-		self._log_run_metrics(plans)
-		return plans
+		return plan
 
 	#============================================
 	def _assign_categories(self, plans: list[PlannedChange], summaries: list[SortItem]) -> None:
@@ -583,7 +799,15 @@ class Organizer:
 			FileMetadata object.
 		"""
 		plugin = self.registry.for_path(path)
-		meta = plugin.extract_metadata(path)
+		meta = None
+		if self.metadata_cache is not None:
+			meta = self.metadata_cache.get(path, plugin)
+			if meta is not None:
+				self._print_meta("cache", f"metadata hit ({plugin.name})")
+		if meta is None:
+			meta = plugin.extract_metadata(path)
+			if self.metadata_cache is not None:
+				self.metadata_cache.put(path, plugin, meta)
 		meta.plugin_name = plugin.name
 		meta.extra["extension"] = path.suffix.lstrip(".")
 		if "filetype_hint" not in meta.extra and getattr(plugin, "filetype_hint", None):
@@ -597,20 +821,17 @@ class Organizer:
 
 	#============================================
 	def _collect_supported_extensions(self) -> set[str]:
-		supported: set[str] = set()
-		for plugin in self.registry.plugins():
-			if plugin.name == "generic":
-				continue
-			for ext in plugin.supported_suffixes:
-				supported.add(ext.lower())
-		return supported
+		return self.registry.suffixes()
 
 	#============================================
 	def _is_supported_extension(self, path: Path) -> bool:
 		ext = path.suffix.lower().lstrip(".")
 		if not ext:
 			return True
-		return ext in self._supported_extensions
+		if ext in self._supported_extensions:
+			return True
+		# a .bin that is really a PDF still gets the PDF plugin
+		return self.registry.sniff and self.registry.lookup(path) is not None
 
 	#============================================
 	def _to_payload(self, meta: FileMetadata, path: Path) -> dict:
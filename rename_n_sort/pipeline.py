@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Two-stage worker pipeline with ordered, per-item console output.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import io
+import sys
+import contextlib
+import contextvars
+from collections import deque
+from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+#============================================
+
+
+@dataclass(slots=True)
+class StageResult:
+	"""
+	Outcome of running one item through the pipeline.
+
+	Attributes:
+		item: Input item.
+		value: Return value of the last stage that ran.
+		error: Exception raised by a stage, if any.
+		failed_stage: "first" or "second" when error is set.
+		output: Console text printed by the stages for this item.
+	"""
+	item: object
+	value: object = None
+	error: Exception | None = None
+	failed_stage: str | None = None
+	output: str = ""
+
+
+# buffer capturing the current stage's prints; a context variable rather
+# than a thread-local so work the stage hands to the shared LLM event loop
+# (which runs in a copy of the caller's context) is captured too
+_CAPTURE: contextvars.ContextVar[io.StringIO | None] = contextvars.ContextVar(
+	"pipeline_capture", default=None
+)
+
+#============================================
+
+
+class _ContextRoutedStream:
+	"""
+	stdout proxy that sends writes from a capturing stage to its buffer.
+	"""
+
+	def __init__(self, stream) -> None:
+		self._stream = stream
+
+	def write(self, text: str) -> int:
+		buffer = _CAPTURE.get()
+		if buffer is None:
+			return self._stream.write(text)
+		return buffer.write(text)
+
+	def flush(self) -> None:
+		if _CAPTURE.get() is None:
+			self._stream.flush()
+
+	def __getattr__(self, name: str):
+		# isatty, encoding, fileno and friends come from the real stream
+		return getattr(self._stream, name)
+
+
+#============================================
+
+
+@contextlib.contextmanager
+def _routed_stdout() -> Iterator[_ContextRoutedStream]:
+	"""
+	Install the routing proxy as sys.stdout for the life of the worker pools.
+	"""
+	original_stdout = sys.stdout
+	router = _ContextRoutedStream(original_stdout)
+	sys.stdout = router
+	try:
+		yield router
+	finally:
+		# leave a stream someone else installed in the meantime alone
+		if sys.stdout is router:
+			sys.stdout = original_stdout
+
+
+#============================================
+
+
+def _run_captured(func: Callable, *args) -> tuple[object, Exception | None, str]:
+	"""
+	Run func with its prints captured into a string.
+	"""
+	buffer = io.StringIO()
+	token = _CAPTURE.set(buffer)
+	value: object = None
+	error: Exception | None = None
+	try:
+		value = func(*args)
+	except Exception as exc:
+		error = exc
+	finally:
+		_CAPTURE.reset(token)
+	return value, error, buffer.getvalue()
+
+
+#============================================
+
+
+def _run_second_stage(
+	second_stage: Callable,
+	item: object,
+	first_future: Future,
+) -> StageResult:
+	"""
+	Wait for an item's first stage, then run its second stage.
+	"""
+	first_value, first_error, first_output = first_future.result()
+	if first_error is not None:
+		result = StageResult(
+			item=item, error=first_error, failed_stage="first", output=first_output
+		)
+		return result
+	value, error, output = _run_captured(second_stage, item, first_value)
+	result = StageResult(
+		item=item,
+		value=value,
+		error=error,
+		failed_stage="second" if error is not None else None,
+		output=first_output + output,
+	)
+	return result
+
+
+#============================================
+
+
+def run_pipeline(
+	items: Iterable,
+	first_stage: Callable,
+	second_stage: Callable,
+	*,
+	first_workers: int = 1,
+	second_workers: int = 1,
+	max_in_flight: int = 4,
+) -> Iterator[StageResult]:
+	"""
+	Run items through two worker pools and yield results in input order.
+
+	first_stage(item) runs on the first pool; second_stage(item, value)
+	runs on the second pool once that item's first stage is done. At most
+	max_in_flight items are queued ahead of the consumer, which acts as the
+	third (apply) stage. Anything the stages print is buffered per item and
+	returned in StageResult.output so console output stays grouped by file.
+	sys.stdout is swapped for a routing proxy only while the worker pools
+	are alive; close the generator (contextlib.closing) when stopping early
+	so the real stream comes back right away.
+
+	Args:
+		items: Input items.
+		first_stage: Callable for stage one (e.g. metadata extraction).
+		second_stage: Callable for stage two (e.g. LLM planning).
+		first_workers: Stage one worker threads.
+		second_workers: Stage two worker threads.
+		max_in_flight: Bound on items submitted but not yet consumed.
+
+	Yields:
+		StageResult per item, in input order.
+	"""
+	# (first, second) future pairs, oldest first
+	in_flight: deque[tuple[Future, Future]] = deque()
+	with _routed_stdout(), ThreadPoolExecutor(
+		max_workers=max(1, first_workers), thread_name_prefix="extract"
+	) as first_pool, ThreadPoolExecutor(
+		max_workers=max(1, second_workers), thread_name_prefix="llm"
+	) as second_pool:
+		try:
+			for item in items:
+				first_future = first_pool.submit(_run_captured, first_stage, item)
+				second_future = second_pool.submit(
+					_run_second_stage, second_stage, item, first_future
+				)
+				in_flight.append((first_future, second_future))
+				if len(in_flight) >= max(1, max_in_flight):
+					yield in_flight.popleft()[1].result()
+			while in_flight:
+				yield in_flight.popleft()[1].result()
+		finally:
+			# stopping early: drop queued work in both pools so they shut down
+			# promptly; stages already running finish on their own
+			for first_future, second_future in in_flight:
+				second_future.cancel()
+				first_future.cancel()
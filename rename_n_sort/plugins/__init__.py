@@ -1,56 +1,90 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-from .base import FileMetadata, FileMetadataPlugin, PluginRegistry
-from .audio_plugin import AudioPlugin
-from .code_plugin import CodePlugin
-from .csv_plugin import CSVPlugin
-from .document_plugin import DocumentPlugin
-from .docx_plugin import DocxPlugin
-from .epub_plugin import EpubPlugin
-from .generic import GenericPlugin
-from .html_plugin import HtmlPlugin
-from .image_plugin import ImagePlugin
-from .odt_plugin import OdtPlugin
-from .pdf import PDFPlugin
-from .presentation_plugin import PresentationPlugin
-from .spreadsheet_plugin import SpreadsheetPlugin
-from .text import TextDocumentPlugin
-from .video_plugin import VideoPlugin
-from .vector_image_plugin import VectorImagePlugin
-from .zip_plugin import ZipPlugin
+from .base import FileMetadata, FileMetadataPlugin, PluginDescriptor, PluginRegistry
 
 __all__ = [
 	"FileMetadata",
 	"FileMetadataPlugin",
+	"PluginDescriptor",
 	"PluginRegistry",
 	"build_registry",
 ]
 
 
-def build_registry() -> PluginRegistry:
+def _lazy(name: str, module: str, class_name: str, *suffixes: str) -> PluginDescriptor:
+	# suffixes must match the class's supported_suffixes (checked in tests)
+	descriptor = PluginDescriptor(
+		name=name,
+		suffixes=frozenset(suffixes),
+		module=module,
+		class_name=class_name,
+	)
+	return descriptor
+
+
+def build_registry(sniff: bool = False) -> PluginRegistry:
 	"""
 	Build default plugin registry.
 
+	Plugins are registered by descriptor, so pypdf, PIL, python-docx and the
+	other parser libraries are imported only when a matching file shows up.
+
+	Args:
+		sniff: Route files with no or unknown suffix by their leading bytes.
+
 	Returns:
 		PluginRegistry with registered plugins.
 	"""
-	registry = PluginRegistry()
-	registry.register(PDFPlugin())
-	registry.register(DocxPlugin())
-	registry.register(EpubPlugin())
-	registry.register(HtmlPlugin())
-	registry.register(OdtPlugin())
-	registry.register(DocumentPlugin())
-	registry.register(PresentationPlugin())
-	registry.register(SpreadsheetPlugin())
-	registry.register(ImagePlugin())
-	registry.register(VectorImagePlugin())
-	registry.register(AudioPlugin())
-	registry.register(VideoPlugin())
-	registry.register(CSVPlugin())
-	registry.register(CodePlugin())
-	registry.register(ZipPlugin())
-	registry.register(TextDocumentPlugin())
-	registry.register(GenericPlugin())
+	registry = PluginRegistry(sniff=sniff)
+	registry.register(_lazy("pdf", ".pdf", "PDFPlugin", "pdf"))
+	# single-format parsers beat DocumentPlugin on docx/odt
+	registry.register(_lazy("docx", ".docx_plugin", "DocxPlugin", "docx"), priority=20)
+	registry.register(_lazy("epub", ".epub_plugin", "EpubPlugin", "epub"))
+	registry.register(_lazy("html", ".html_plugin", "HtmlPlugin", "html", "htm"))
+	registry.register(_lazy("odt", ".odt_plugin", "OdtPlugin", "odt"), priority=20)
+	# DocumentPlugin owns txt/md/rtf over TextDocumentPlugin
+	registry.register(
+		_lazy(
+			"document", ".document_plugin", "DocumentPlugin",
+			"doc", "docx", "odt", "rtf", "pages", "txt", "md",
+		),
+		priority=10,
+	)
+	registry.register(
+		_lazy("presentation", ".presentation_plugin", "PresentationPlugin", "ppt", "pptx", "odp")
+	)
+	# SpreadsheetPlugin owns csv/tsv over CSVPlugin
+	registry.register(
+		_lazy(
+			"spreadsheet", ".spreadsheet_plugin", "SpreadsheetPlugin",
+			"xls", "xlsx", "ods", "csv", "tsv",
+		),
+		priority=10,
+	)
+	registry.register(
+		_lazy(
+			"image", ".image_plugin", "ImagePlugin",
+			"jpg", "jpeg", "png", "gif", "heic", "tif", "tiff", "bmp",
+		)
+	)
+	registry.register(
+		_lazy("vector_image", ".vector_image_plugin", "VectorImagePlugin", "svg", "svgz", "odg")
+	)
+	registry.register(
+		_lazy("audio", ".audio_plugin", "AudioPlugin", "mp3", "wav", "flac", "aiff", "ogg")
+	)
+	registry.register(
+		_lazy("video", ".video_plugin", "VideoPlugin", "mp4", "mov", "mkv", "webm", "avi")
+	)
+	registry.register(_lazy("csv", ".csv_plugin", "CSVPlugin", "csv", "tsv"))
+	registry.register(
+		_lazy(
+			"code", ".code_plugin", "CodePlugin",
+			"py", "m", "cpp", "js", "sh", "pl", "rb", "php",
+		)
+	)
+	registry.register(_lazy("zip", ".zip_plugin", "ZipPlugin", "zip"))
+	registry.register(_lazy("text", ".text", "TextDocumentPlugin", "txt", "md", "rtf"))
+	registry.register(_lazy("generic", ".generic", "GenericPlugin"))
 	return registry
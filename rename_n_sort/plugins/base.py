@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+# Standard Library
+import importlib
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 
+# local repo modules
+from .sniff import CONFIDENT_SUFFIXES, sniff_suffix
+
 #============================================
 
 
@@ -19,6 +25,8 @@ class FileMetadata:
 		summary: Short text preview.
 		plugin_name: Name of plugin used.
 		extra: Extra metadata.
+		degraded: Why extraction was partial (OCR timeout, failed conversion);
+			degraded results are not written to the metadata cache.
 	"""
 	path: Path
 	title: str | None = None
@@ -26,6 +34,7 @@ class FileMetadata:
 	summary: str | None = None
 	plugin_name: str = "generic"
 	extra: dict[str, object] = field(default_factory=dict)
+	degraded: list[str] = field(default_factory=list)
 
 	#============================================
 	def safe_title(self) -> str:
@@ -46,6 +55,8 @@ class FileMetadataPlugin:
 	"""
 
 	name: str = "base"
+	# bump when extraction output changes so cached metadata is invalidated
+	version: str = "1"
 	supported_suffixes: set[str] = set()
 	filetype_hint: str | None = None
 
@@ -76,29 +87,169 @@ class FileMetadataPlugin:
 		return FileMetadata(path=path, plugin_name=self.name)
 
 
+@dataclass(slots=True)
+class PluginDescriptor:
+	"""
+	Lightweight registry entry; the plugin module is imported on first load().
+
+	Attributes:
+		name: Plugin name (matches the plugin class name attribute).
+		suffixes: Suffixes the plugin claims, lowercase without dots.
+		module: Module path, relative to this package when it starts with ".".
+		class_name: Plugin class inside that module.
+		plugin: Instance once loaded.
+	"""
+	name: str
+	suffixes: frozenset[str]
+	module: str
+	class_name: str
+	plugin: FileMetadataPlugin | None = None
+
+	#============================================
+	@classmethod
+	def from_plugin(cls, plugin: FileMetadataPlugin) -> PluginDescriptor:
+		"""
+		Wrap an already-built plugin instance.
+		"""
+		plugin_type = type(plugin)
+		descriptor = cls(
+			name=plugin.name,
+			suffixes=frozenset(plugin.supported_suffixes),
+			module=plugin_type.__module__,
+			class_name=plugin_type.__name__,
+			plugin=plugin,
+		)
+		return descriptor
+
+	#============================================
+	def load(self) -> FileMetadataPlugin:
+		"""
+		Import the plugin module and build the plugin (once).
+
+		Returns:
+			Plugin instance.
+		"""
+		if self.plugin is None:
+			module = importlib.import_module(self.module, __package__)
+			self.plugin = getattr(module, self.class_name)()
+		return self.plugin
+
+
 class PluginRegistry:
 	"""
 	Registry for metadata plugins.
+
+	Files are dispatched through a suffix -> plugin index built once on
+	first lookup. When several plugins claim a suffix, the one registered
+	with the highest priority wins, then the one registered first. Plugins
+	without suffixes (the generic fallback) are asked via supports(), in
+	registration order, for anything the index does not cover. With sniff
+	enabled, files whose suffix is missing or unknown are routed by their
+	leading bytes before falling back, and a file whose leading bytes carry
+	a confident signature for another plugin's format (a PDF saved as .txt,
+	a DOCX saved as .doc) goes to that plugin. Entries registered as
+	descriptors import their plugin module only when a file first
+	dispatches to them.
 	"""
 
 	#============================================
-	def __init__(self) -> None:
-		self._plugins: list[FileMetadataPlugin] = []
+	def __init__(self, sniff: bool = False) -> None:
+		"""
+		Create an empty registry.
+
+		Args:
+			sniff: Route files by content when the suffix is missing, unknown
+				or contradicted by a confident signature.
+		"""
+		self.sniff = sniff
+		self._descriptors: list[PluginDescriptor] = []
+		self._priorities: list[int] = []
+		self._index: dict[str, PluginDescriptor] | None = None
+		self._fallbacks: list[PluginDescriptor] = []
+		self._load_lock = threading.Lock()
 
 	#============================================
-	def register(self, plugin: FileMetadataPlugin) -> None:
+	def register(self, plugin: FileMetadataPlugin | PluginDescriptor, priority: int = 0) -> None:
 		"""
-		Register a plugin.
+		Register a plugin instance or a lazily loaded descriptor.
 
 		Args:
-			plugin: Plugin instance.
+			plugin: Plugin instance or descriptor.
+			priority: Wins suffix conflicts against lower priorities.
 		"""
-		self._plugins.append(plugin)
+		if not isinstance(plugin, PluginDescriptor):
+			plugin = PluginDescriptor.from_plugin(plugin)
+		self._descriptors.append(plugin)
+		self._priorities.append(priority)
+		self._index = None
+
+	#============================================
+	def _build_index(self) -> dict[str, PluginDescriptor]:
+		index: dict[str, PluginDescriptor] = {}
+		ranks: dict[str, int] = {}
+		fallbacks: list[PluginDescriptor] = []
+		for descriptor, priority in zip(self._descriptors, self._priorities):
+			if not descriptor.suffixes:
+				fallbacks.append(descriptor)
+				continue
+			for suffix in descriptor.suffixes:
+				key = suffix.lower().lstrip(".")
+				# strictly greater keeps the earlier plugin on ties
+				if key not in index or priority > ranks[key]:
+					index[key] = descriptor
+					ranks[key] = priority
+		self._fallbacks = fallbacks
+		self._index = index
+		return index
+
+	#============================================
+	def _load(self, descriptor: PluginDescriptor) -> FileMetadataPlugin:
+		plugin = descriptor.plugin
+		if plugin is not None:
+			return plugin
+		# extraction threads may hit a new suffix at the same time
+		with self._load_lock:
+			return descriptor.load()
+
+	#============================================
+	def suffixes(self) -> set[str]:
+		"""
+		Return every suffix some plugin claims, without loading any plugin.
+
+		Returns:
+			Lowercase suffixes without the dot.
+		"""
+		index = self._index if self._index is not None else self._build_index()
+		return set(index)
+
+	#============================================
+	def lookup(self, path: Path) -> FileMetadataPlugin | None:
+		"""
+		Find the plugin indexed for the path's suffix (or sniffed content).
+
+		Args:
+			path: File path.
+
+		Returns:
+			Plugin instance, or None when only a fallback plugin applies.
+		"""
+		index = self._index if self._index is not None else self._build_index()
+		descriptor = index.get(path.suffix.lower().lstrip("."))
+		if self.sniff:
+			sniffed = sniff_suffix(path)
+			if descriptor is None and sniffed is not None:
+				descriptor = index.get(sniffed)
+			elif sniffed in CONFIDENT_SUFFIXES:
+				# the content disagrees with a mislabeled suffix
+				descriptor = index.get(sniffed, descriptor)
+		if descriptor is None:
+			return None
+		return self._load(descriptor)
 
 	#============================================
 	def for_path(self, path: Path) -> FileMetadataPlugin:
 		"""
-		Find the first plugin that supports the path.
+		Find the plugin that handles the path.
 
 		Args:
 			path: File path.
@@ -106,17 +257,31 @@ class PluginRegistry:
 		Returns:
 			Plugin instance.
 		"""
-		for plugin in self._plugins:
-			if plugin.supports(path):
-				return plugin
+		plugin = self.lookup(path)
+		if plugin is not None:
+			return plugin
+		for descriptor in self._fallbacks:
+			fallback = self._load(descriptor)
+			if fallback.supports(path):
+				return fallback
 		raise LookupError(f"No plugin registered for {path.suffix or 'unknown'}")
 
+	#============================================
+	def descriptors(self) -> list[PluginDescriptor]:
+		"""
+		Return all registry entries without loading them.
+
+		Returns:
+			List of descriptors.
+		"""
+		return list(self._descriptors)
+
 	#============================================
 	def plugins(self) -> list[FileMetadataPlugin]:
 		"""
-		Return all plugins.
+		Return all plugins, loading any not loaded yet.
 
 		Returns:
 			List of plugins.
 		"""
-		return list(self._plugins)
+		return [self._load(descriptor) for descriptor in self._descriptors]
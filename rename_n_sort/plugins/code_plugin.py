@@ -6,6 +6,7 @@ from pathlib import Path
 
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from .text_reader import read_head_lines
 
 #============================================
 
@@ -16,6 +17,8 @@ class CodePlugin(FileMetadataPlugin):
 	"""
 
 	name = "code"
+	# 2: bounded reader, non-UTF-8 text decoded as cp1252
+	version = "2"
 	filetype_hint = "Source code"
 	supported_suffixes: set[str] = {
 		"py",
@@ -49,11 +52,10 @@ class CodePlugin(FileMetadataPlugin):
 		Read first chunk of code for context.
 		"""
 		try:
-			text_blob = path.read_text(encoding="utf-8", errors="ignore")
-		except Exception:
+			lines = read_head_lines(path, 10)
+		except OSError:
 			return None
-		lines = text_blob.splitlines()
-		head = "\n".join(lines[:10])
+		head = "\n".join(lines)
 		flat = " ".join(head.split())
 		if not flat:
 			return None
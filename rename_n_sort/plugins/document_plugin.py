@@ -3,19 +3,13 @@ from __future__ import annotations
 
 # Standard Library
 from pathlib import Path
-import shutil
-import subprocess
-import tempfile
-
-# PIP3 modules
-try:
-	import docx
-except Exception:
-	docx = None
 
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
 from .mdls_utils import mdls_field
+from .office_xml import head_tail_summary, iter_docx_paragraphs
+from .soffice_service import get_soffice_converter
+from .text_reader import read_head_text
 
 #============================================
 
@@ -26,6 +20,8 @@ class DocumentPlugin(FileMetadataPlugin):
 	"""
 
 	name = "document"
+	# 3: DOC text streamed from the converted docx (2: bounded text reader)
+	version = "3"
 	supported_suffixes: set[str] = {"doc", "docx", "odt", "rtf", "pages", "txt", "md"}
 
 	#============================================
@@ -51,7 +47,7 @@ class DocumentPlugin(FileMetadataPlugin):
 		title = mdls_field(path, "kMDItemTitle")
 		if title:
 			meta.title = title
-		snippet = self._read_preview(path)
+		snippet = self._read_preview(path, meta)
 		if snippet:
 			meta.summary = snippet
 		return meta
@@ -61,72 +57,40 @@ class DocumentPlugin(FileMetadataPlugin):
 		print(f"[WHY] {path.name}: {message}")
 
 	#============================================
-	def _read_preview(self, path: Path) -> str | None:
+	def _read_preview(self, path: Path, meta: FileMetadata) -> str | None:
 		"""
 		Read a short preview for text-like documents.
 		"""
 		ext = path.suffix.lower().lstrip(".")
 		if ext == "doc":
-			return self._read_doc_via_soffice(path)
+			return self._read_doc_via_soffice(path, meta)
 		if ext not in {"txt", "md", "rtf"}:
 			return None
 		try:
-			text_blob = path.read_text(encoding="utf-8", errors="ignore")
-		except Exception:
+			flattened = read_head_text(path, 800)
+		except OSError:
 			return None
-		flattened = " ".join(text_blob.split())
 		if not flattened:
 			return None
-		return flattened[:800]
+		return flattened
 
-	def _read_doc_via_soffice(self, path: Path) -> str | None:
-		if not docx:
-			self._print_why(path, "python-docx not installed; skipping DOC conversion")
-			return None
-		soffice = shutil.which("soffice")
-		if not soffice:
+	def _read_doc_via_soffice(self, path: Path, meta: FileMetadata) -> str | None:
+		converter = get_soffice_converter()
+		if not converter.available:
 			self._print_why(path, "LibreOffice not found; skipping DOC conversion")
+			meta.degraded.append("LibreOffice not found")
 			return None
-		with tempfile.TemporaryDirectory() as tmp_dir:
-			output_path = Path(tmp_dir) / f"{path.stem}.docx"
-			try:
-				subprocess.run(
-					[
-						soffice,
-						"--headless",
-						"--convert-to",
-						"docx",
-						"--outdir",
-						tmp_dir,
-						str(path),
-					],
-					check=True,
-					stdout=subprocess.DEVNULL,
-					stderr=subprocess.DEVNULL,
-					timeout=30,
-				)
-			except Exception as exc:
-				self._print_why(path, f"LibreOffice conversion failed ({exc.__class__.__name__})")
-				return None
-			if not output_path.exists():
-				self._print_why(path, "LibreOffice conversion produced no output")
-				return None
-			return self._extract_docx_summary(output_path)
+		try:
+			output_path = converter.convert(path, "docx")
+		except (OSError, RuntimeError) as exc:
+			self._print_why(path, f"LibreOffice conversion failed ({exc})")
+			meta.degraded.append("LibreOffice conversion failed")
+			return None
+		return self._extract_docx_summary(output_path)
 
 	def _extract_docx_summary(self, path: Path) -> str | None:
-		if not docx:
-			return None
 		try:
-			document = docx.Document(path)
+			summary = head_tail_summary(iter_docx_paragraphs(path))
 		except Exception:
 			return None
-		all_text: list[str] = []
-		for paragraph in document.paragraphs:
-			if paragraph.text:
-				all_text.append(paragraph.text.strip())
-		if not all_text:
-			return None
-		full = " ".join(all_text)
-		head = full[:256]
-		tail = full[-256:] if len(full) > 256 else ""
-		return f"{head} ... {tail}".strip() if tail else head
+		return summary
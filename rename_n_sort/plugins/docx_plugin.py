@@ -2,14 +2,9 @@
 # Standard Library
 from pathlib import Path
 
-# PIP3 modules
-try:
-	import docx
-except Exception:
-	docx = None
-
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from .office_xml import head_tail_summary, iter_docx_paragraphs, read_docx_properties
 
 #============================================
 
@@ -20,6 +15,8 @@ class DocxPlugin(FileMetadataPlugin):
 	"""
 
 	name = "docx"
+	# 2: streamed from word/document.xml, table text included
+	version = "2"
 	filetype_hint = "Word Processing Document"
 	supported_suffixes: set[str] = {"docx"}
 
@@ -50,23 +47,15 @@ class DocxPlugin(FileMetadataPlugin):
 		meta = FileMetadata(path=path, plugin_name=self.name)
 		meta.extra["size_bytes"] = path.stat().st_size
 		meta.extra["extension"] = path.suffix.lstrip(".")
-		if not docx:
-			return meta
 		try:
-			document = docx.Document(path)
-			if document.core_properties.title:
-				meta.title = document.core_properties.title
-			if document.core_properties.author:
-				meta.keywords.append(document.core_properties.author)
-			all_text: list[str] = []
-			for paragraph in document.paragraphs:
-				if paragraph.text:
-					all_text.append(paragraph.text.strip())
-			if all_text:
-				full = " ".join(all_text)
-				head = full[:256]
-				tail = full[-256:] if len(full) > 256 else ""
-				meta.summary = f"{head} ... {tail}".strip()
+			properties = read_docx_properties(path)
+			if properties.get("title"):
+				meta.title = properties["title"]
+			if properties.get("author"):
+				meta.keywords.append(properties["author"])
+			summary = head_tail_summary(iter_docx_paragraphs(path))
+			if summary:
+				meta.summary = summary
 		except Exception:
 			return meta
 		return meta
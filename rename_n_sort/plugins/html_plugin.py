@@ -3,15 +3,88 @@ from __future__ import annotations
 
 # Standard Library
 from pathlib import Path
-
-# PIP3 modules
-try:
-	from bs4 import BeautifulSoup
-except Exception:
-	BeautifulSoup = None
+from html.parser import HTMLParser
 
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from .text_reader import iter_text
+
+SUMMARY_CHARS = 800
+MAX_HEADINGS = 10
+# script/style bodies can be huge; stop scanning a page after this much
+HTML_SCAN_BYTES = 16 * 1024 * 1024
+
+_SKIP_TAGS = {"script", "style", "noscript", "template"}
+_HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+
+#============================================
+
+
+class _HtmlTextParser(HTMLParser):
+	"""
+	Collect visible text, the title and headings from fed HTML chunks.
+
+	No tree is built: script/style/noscript/template content is dropped as
+	it streams past and text words are kept only up to the summary limit.
+	"""
+
+	def __init__(self, limit: int = SUMMARY_CHARS) -> None:
+		super().__init__(convert_charrefs=True)
+		self.limit = limit
+		self.words: list[str] = []
+		self.size = 0
+		self.title: str | None = None
+		self.headings: list[str] = []
+		self._skip_depth = 0
+		self._title_parts: list[str] | None = None
+		self._heading_parts: list[str] | None = None
+
+	#============================================
+	@property
+	def full(self) -> bool:
+		return self.size >= self.limit
+
+	#============================================
+	def text(self) -> str:
+		return " ".join(self.words)[: self.limit]
+
+	#============================================
+	def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+		if tag in _SKIP_TAGS:
+			self._skip_depth += 1
+		elif tag == "title" and self.title is None:
+			self._title_parts = []
+		elif tag in _HEADING_TAGS and self._heading_parts is None:
+			self._heading_parts = []
+
+	#============================================
+	def handle_endtag(self, tag: str) -> None:
+		if tag in _SKIP_TAGS:
+			self._skip_depth = max(0, self._skip_depth - 1)
+		elif tag == "title" and self._title_parts is not None:
+			self.title = " ".join("".join(self._title_parts).split()) or None
+			self._title_parts = None
+		elif tag in _HEADING_TAGS and self._heading_parts is not None:
+			heading = " ".join("".join(self._heading_parts).split())
+			if heading and len(self.headings) < MAX_HEADINGS:
+				self.headings.append(heading)
+			self._heading_parts = None
+
+	#============================================
+	def handle_data(self, data: str) -> None:
+		if self._skip_depth:
+			return
+		if self._title_parts is not None:
+			self._title_parts.append(data)
+		if self._heading_parts is not None:
+			self._heading_parts.append(data)
+		# text nodes are joined with spaces, like get_text(separator=" ")
+		for word in data.split():
+			if self.size >= self.limit:
+				break
+			self.size += len(word) + (1 if self.words else 0)
+			self.words.append(word)
+
 
 #============================================
 
@@ -22,6 +95,7 @@ class HtmlPlugin(FileMetadataPlugin):
 	"""
 
 	name = "html"
+	version = "2"
 	filetype_hint = "HTML page"
 	supported_suffixes: set[str] = {"html", "htm"}
 
@@ -34,32 +108,32 @@ class HtmlPlugin(FileMetadataPlugin):
 		meta = FileMetadata(path=path, plugin_name=self.name)
 		meta.extra["size_bytes"] = path.stat().st_size
 		meta.extra["extension"] = path.suffix.lstrip(".")
-		text, title = self._read_html_text(path)
+		text, title, headings = self._read_html_text(path)
 		if title:
 			meta.title = title
 		if text:
 			meta.summary = text
+		if headings:
+			meta.extra["headings"] = headings
 		return meta
 
 	#============================================
-	def _read_html_text(self, path: Path) -> tuple[str | None, str | None]:
-		if not BeautifulSoup:
-			return (None, None)
-		try:
-			raw = path.read_text(encoding="utf-8", errors="ignore")
-		except Exception:
-			return (None, None)
+	def _read_html_text(self, path: Path) -> tuple[str | None, str | None, list[str]]:
+		"""
+		Stream the page through _HtmlTextParser until the summary is full.
+
+		Returns:
+			Tuple of (summary text, title, headings).
+		"""
+		parser = _HtmlTextParser(SUMMARY_CHARS)
 		try:
-			soup = BeautifulSoup(raw, "html.parser")
+			for chunk in iter_text(path, max_bytes=HTML_SCAN_BYTES):
+				parser.feed(chunk)
+				if parser.full:
+					break
+			else:
+				parser.close()
 		except Exception:
-			return (None, None)
-		for tag in soup(["script", "style", "noscript"]):
-			tag.decompose()
-		title = None
-		if soup.title and soup.title.string:
-			title = " ".join(soup.title.string.split())
-		text = soup.get_text(separator=" ")
-		flattened = " ".join(text.split())
-		if not flattened:
-			return (None, title)
-		return (flattened[:800], title)
+			return (None, None, [])
+		text = parser.text()
+		return (text or None, parser.title, parser.headings)
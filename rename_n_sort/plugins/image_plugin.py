@@ -10,10 +10,11 @@ import time
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
 from .mdls_utils import mdls_field
+from ..captioner import get_captioner
+from ..ocr_service import get_ocr_service
 
 import pillow_heif
 from PIL import Image
-import pytesseract
 
 pillow_heif.register_heif_opener()
 
@@ -109,9 +110,24 @@ class ImagePlugin(FileMetadataPlugin):
 		Extract OCR text for bitmap images using Tesseract.
 		"""
 		with Image.open(path) as image:
-			text = pytesseract.image_to_string(image)
-		text = " ".join(text.split())
-		return text or None
+			text = self._ocr_image(image)
+		return text
+
+	#============================================
+	def _ocr_image(self, image: Image.Image) -> str | None:
+		"""
+		Run Tesseract on an already-decoded image in the shared OCR pool.
+		"""
+		text = get_ocr_service().ocr(image)
+		return self._clean_ocr_text(text)
+
+	#============================================
+	def _clean_ocr_text(self, text: str | None) -> str | None:
+		"""
+		Collapse whitespace in raw OCR output; None when nothing was read.
+		"""
+		cleaned = " ".join((text or "").split())
+		return cleaned or None
 
 	#============================================
 	def _try_caption(self, path: Path) -> str | None:
@@ -121,19 +137,12 @@ class ImagePlugin(FileMetadataPlugin):
 		ext = path.suffix.lower().lstrip(".")
 		if ext in {"svg", "svgz"}:
 			return None
-		if not hasattr(self, "_moondream2_module"):
-			from rename_n_sort import moondream2_caption
-			self._moondream2_module = moondream2_caption
-		moondream2 = self._moondream2_module
-		if not hasattr(self, "_ai_components"):
-			try:
-				self._ai_components = moondream2.setup_ai_components()
-			except Exception as exc:
-				raise RuntimeError(f"Failed to initialize Moondream2: {exc}") from exc
+		captioner = get_captioner()
+		captioner.load()
 		start = time.monotonic()
 		print(f"\033[35m[CAPTION]\033[0m {path.name}: running Moondream2...")
 		try:
-			caption = moondream2.generate_caption(str(path), self._ai_components)
+			caption = captioner.caption(path)
 		except Exception as exc:
 			duration = time.monotonic() - start
 			print(
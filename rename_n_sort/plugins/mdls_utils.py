@@ -2,8 +2,252 @@
 from __future__ import annotations
 
 # Standard Library
+import os
+import shutil
+import threading
 import subprocess
 from pathlib import Path
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+
+# fields most plugins ask for; prefetched for whole file lists in one call
+PREFETCH_FIELDS = (
+	"kMDItemTitle",
+	"kMDItemAuthors",
+	"kMDItemKeywords",
+	"kMDItemPageCount",
+	"kMDItemKind",
+	"kMDItemContentType",
+	"kMDItemWhereFroms",
+)
+PREFETCH_CHUNK = 64
+DEFAULT_CACHE_ENTRIES = 4096
+
+#============================================
+
+
+class MdlsProvider:
+	"""
+	Spotlight metadata reader with one mdls call per file (or file batch).
+
+	The mdls binary is looked up once per provider; when it is missing every
+	read returns nothing without spawning a process. Results are cached per
+	(path, mtime_ns) so repeated reads for the same file cost a stat call.
+	Safe to share across threads.
+	"""
+
+	#============================================
+	def __init__(
+		self,
+		binary: str = "mdls",
+		runner: Callable[..., subprocess.CompletedProcess] = subprocess.run,
+		max_entries: int = DEFAULT_CACHE_ENTRIES,
+	) -> None:
+		"""
+		Create a provider.
+
+		Args:
+			binary: mdls executable name or path.
+			runner: subprocess.run-compatible callable (swap in a fake for tests).
+			max_entries: Files kept in the result cache.
+		"""
+		self.binary = binary
+		self.runner = runner
+		self.max_entries = max_entries
+		self._available: bool | None = None
+		self._cache: OrderedDict[tuple[str, int], dict[str, str | None]] = OrderedDict()
+		self._lock = threading.Lock()
+		self.calls = 0
+
+	#============================================
+	@property
+	def available(self) -> bool:
+		"""
+		True when the mdls binary exists (probed once).
+		"""
+		if self._available is None:
+			self._available = shutil.which(self.binary) is not None
+		return self._available
+
+	#============================================
+	def fields(self, path: Path, names: list[str] | tuple[str, ...]) -> dict[str, str]:
+		"""
+		Read several fields for one file.
+
+		Args:
+			path: File path.
+			names: Field names.
+
+		Returns:
+			Field -> value for fields that have a value.
+		"""
+		results = self.fields_many([path], names)
+		return results.get(path, {})
+
+	#============================================
+	def fields_many(
+		self,
+		paths: Iterable[Path],
+		names: list[str] | tuple[str, ...],
+	) -> dict[Path, dict[str, str]]:
+		"""
+		Read several fields for several files, one mdls call for the misses.
+
+		Args:
+			paths: File paths.
+			names: Field names.
+
+		Returns:
+			Path -> {field: value} for fields that have a value.
+		"""
+		path_list = list(paths)
+		results: dict[Path, dict[str, str]] = {path: {} for path in path_list}
+		if not self.available or not names:
+			return results
+		keyed: list[tuple[Path, tuple[str, int]]] = []
+		for path in path_list:
+			key = _cache_key(path)
+			if key is not None:
+				keyed.append((path, key))
+		missing: list[tuple[Path, tuple[str, int]]] = []
+		with self._lock:
+			for path, key in keyed:
+				cached = self._cache.get(key)
+				if cached is None or any(name not in cached for name in names):
+					missing.append((path, key))
+		if missing:
+			fetched = self._run([path for path, _key in missing], list(names))
+			with self._lock:
+				for path, key in missing:
+					entry = self._cache.setdefault(key, {})
+					entry.update(fetched.get(path, {name: None for name in names}))
+				self._trim_locked()
+		with self._lock:
+			for path, key in keyed:
+				entry = self._cache.get(key, {})
+				if key in self._cache:
+					self._cache.move_to_end(key)
+				values = {name: entry.get(name) for name in names}
+				results[path] = {name: value for name, value in values.items() if value}
+		return results
+
+	#============================================
+	def prefetch(
+		self,
+		paths: Iterable[Path],
+		names: list[str] | tuple[str, ...] = PREFETCH_FIELDS,
+		chunk_size: int = PREFETCH_CHUNK,
+	) -> None:
+		"""
+		Warm the cache for many files, chunk_size files per mdls call.
+		"""
+		if not self.available:
+			return
+		chunk: list[Path] = []
+		for path in paths:
+			chunk.append(path)
+			if len(chunk) >= chunk_size:
+				self.fields_many(chunk, names)
+				chunk = []
+		if chunk:
+			self.fields_many(chunk, names)
+
+	#============================================
+	def _run(self, paths: list[Path], names: list[str]) -> dict[Path, dict[str, str | None]]:
+		"""
+		Run mdls -raw once; values come back NUL-separated, file by file.
+		"""
+		command = [self.binary, "-raw"]
+		for name in names:
+			command.extend(["-name", name])
+		command.extend(str(path) for path in paths)
+		self.calls += 1
+		try:
+			result = self.runner(command, capture_output=True, text=True, check=False)
+		except FileNotFoundError:
+			self._available = False
+			return {}
+		values = result.stdout.split("\0") if result.stdout else []
+		expected = len(paths) * len(names)
+		# a trailing separator is harmless; anything else means a file failed
+		if len(values) == expected + 1 and values[-1] == "":
+			values = values[:-1]
+		if len(values) != expected:
+			if len(paths) > 1:
+				merged: dict[Path, dict[str, str | None]] = {}
+				for path in paths:
+					merged.update(self._run([path], names))
+				return merged
+			return {}
+		parsed: dict[Path, dict[str, str | None]] = {}
+		for idx, path in enumerate(paths):
+			row = values[idx * len(names) : (idx + 1) * len(names)]
+			parsed[path] = {name: _clean_value(value) for name, value in zip(names, row)}
+		return parsed
+
+	#============================================
+	def _trim_locked(self) -> None:
+		while len(self._cache) > self.max_entries:
+			self._cache.popitem(last=False)
+
+
+#============================================
+
+
+def _cache_key(path: Path) -> tuple[str, int] | None:
+	try:
+		mtime_ns = os.stat(path).st_mtime_ns
+	except OSError:
+		return None
+	return (str(path), mtime_ns)
+
+
+#============================================
+
+
+def _clean_value(value: str) -> str | None:
+	value = value.strip()
+	if not value or value == "(null)":
+		return None
+	return value
+
+
+#============================================
+
+
+_PROVIDER: MdlsProvider | None = None
+_PROVIDER_LOCK = threading.Lock()
+
+#============================================
+
+
+def get_mdls_provider() -> MdlsProvider:
+	"""
+	Return the process-wide mdls provider.
+	"""
+	global _PROVIDER
+	with _PROVIDER_LOCK:
+		if _PROVIDER is None:
+			_PROVIDER = MdlsProvider()
+		return _PROVIDER
+
+
+#============================================
+
+
+def set_mdls_provider(provider: MdlsProvider | None) -> MdlsProvider | None:
+	"""
+	Replace the process-wide mdls provider (tests, fakes).
+
+	Returns:
+		The previous provider.
+	"""
+	global _PROVIDER
+	with _PROVIDER_LOCK:
+		previous = _PROVIDER
+		_PROVIDER = provider
+	return previous
+
 
 #============================================
 
@@ -19,26 +263,13 @@ def mdls_field(path: Path, field: str) -> str | None:
 	Returns:
 		Value string or None.
 	"""
-	try:
-		result = subprocess.run(
-			["mdls", "-name", field, "-raw", str(path)],
-			capture_output=True,
-			text=True,
-			check=False,
-		)
-	except FileNotFoundError:
-		return None
-	if result.returncode != 0:
-		return None
-	value = result.stdout.strip()
-	if not value or value == "(null)":
-		return None
-	return value
+	data = get_mdls_provider().fields(path, [field])
+	return data.get(field)
 
 
 def mdls_fields(path: Path, fields: list[str]) -> dict[str, str]:
 	"""
-	Read multiple mdls fields.
+	Read multiple mdls fields with one mdls call.
 
 	Args:
 		path: File path.
@@ -47,9 +278,5 @@ def mdls_fields(path: Path, fields: list[str]) -> dict[str, str]:
 	Returns:
 		Dictionary of field values.
 	"""
-	data: dict[str, str] = {}
-	for field in fields:
-		val = mdls_field(path, field)
-		if val:
-			data[field] = val
+	data = get_mdls_provider().fields(path, fields)
 	return data
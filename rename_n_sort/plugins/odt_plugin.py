@@ -2,18 +2,9 @@
 # Standard Library
 from pathlib import Path
 
-# PIP3 modules
-try:
-	from odf import text
-	from odf.opendocument import load
-	from odf import teletype
-except Exception:
-	text = None
-	load = None
-	teletype = None
-
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from .office_xml import head_tail_summary, iter_odt_paragraphs, read_odt_properties
 
 #============================================
 
@@ -24,6 +15,8 @@ class OdtPlugin(FileMetadataPlugin):
 	"""
 
 	name = "odt"
+	# 2: streamed from content.xml, headings and meta.xml properties included
+	version = "2"
 	filetype_hint = "Word Processing Document"
 	supported_suffixes: set[str] = {"odt"}
 
@@ -43,7 +36,7 @@ class OdtPlugin(FileMetadataPlugin):
 	#============================================
 	def extract_metadata(self, path: Path) -> FileMetadata:
 		"""
-		Extract preview text when odf is installed.
+		Extract properties and a head/tail preview.
 
 		Args:
 			path: File path.
@@ -54,21 +47,15 @@ class OdtPlugin(FileMetadataPlugin):
 		meta = FileMetadata(path=path, plugin_name=self.name)
 		meta.extra["size_bytes"] = path.stat().st_size
 		meta.extra["extension"] = path.suffix.lstrip(".")
-		if not load or not text or not teletype:
-			return meta
 		try:
-			document = load(str(path))
-			paras = document.getElementsByType(text.P)
-			snippets: list[str] = []
-			for para in paras:
-				para_text = teletype.extractText(para).strip()
-				if para_text:
-					snippets.append(para_text)
-			if snippets:
-				full = " ".join(snippets)
-				head = full[:256]
-				tail = full[-256:] if len(full) > 256 else ""
-				meta.summary = f"{head} ... {tail}".strip()
+			properties = read_odt_properties(path)
+			if properties.get("title"):
+				meta.title = properties["title"]
+			if properties.get("author"):
+				meta.keywords.append(properties["author"])
+			summary = head_tail_summary(iter_odt_paragraphs(path))
+			if summary:
+				meta.summary = summary
 		except Exception:
 			return meta
 		return meta
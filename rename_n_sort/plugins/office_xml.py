@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Streaming paragraph and property readers for DOCX and ODT packages.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import zipfile
+from pathlib import Path
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+import xml.etree.ElementTree as ET
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+_TEXT = "{urn:oasis:names:tc:opendocument:xmlns:text:1.0}"
+_OFFICE_ANNOTATION = "{urn:oasis:names:tc:opendocument:xmlns:office:1.0}annotation"
+_DC = "{http://purl.org/dc/elements/1.1/}"
+_META = "{urn:oasis:names:tc:opendocument:xmlns:meta:1.0}"
+
+DOCX_BODY = "word/document.xml"
+DOCX_CORE = "docProps/core.xml"
+ODT_BODY = "content.xml"
+ODT_META = "meta.xml"
+SUMMARY_CHARS = 256
+
+#============================================
+
+
+def iter_docx_paragraphs(path: Path) -> Iterator[str]:
+	"""
+	Yield the non-empty text of each w:p in word/document.xml, in order.
+	"""
+	yield from _iter_paragraphs(path, DOCX_BODY, {f"{_W}p"}, _docx_text)
+
+
+#============================================
+
+
+def iter_odt_paragraphs(path: Path) -> Iterator[str]:
+	"""
+	Yield the non-empty text of each text:p and text:h in content.xml, in order.
+	"""
+	yield from _iter_paragraphs(path, ODT_BODY, {f"{_TEXT}p", f"{_TEXT}h"}, _odt_text)
+
+
+#============================================
+
+
+def _iter_paragraphs(
+	path: Path,
+	member: str,
+	paragraph_tags: set[str],
+	render: Callable[[ET.Element], str],
+) -> Iterator[str]:
+	with zipfile.ZipFile(path) as archive:
+		with archive.open(member) as stream:
+			# open elements, so finished ones can be detached from their parent
+			stack: list[ET.Element] = []
+			open_paragraphs = 0
+			for event, element in ET.iterparse(stream, events=("start", "end")):
+				if event == "start":
+					stack.append(element)
+					if element.tag in paragraph_tags:
+						open_paragraphs += 1
+					continue
+				stack.pop()
+				text = ""
+				if element.tag in paragraph_tags:
+					open_paragraphs -= 1
+					text = render(element).strip()
+				elif open_paragraphs:
+					# still needed by the enclosing paragraph
+					continue
+				element.clear()
+				if stack:
+					stack[-1].remove(element)
+				if text:
+					yield text
+
+
+#============================================
+
+
+def _docx_text(paragraph: ET.Element) -> str:
+	parts: list[str] = []
+	_docx_collect(paragraph, parts)
+	return "".join(parts)
+
+
+def _docx_collect(element: ET.Element, parts: list[str]) -> None:
+	for child in element:
+		tag = child.tag
+		if tag == f"{_W}t":
+			parts.append(child.text or "")
+		elif tag == f"{_W}tab":
+			parts.append("\t")
+		elif tag in (f"{_W}br", f"{_W}cr"):
+			parts.append("\n")
+		elif tag == _MC_FALLBACK or tag == f"{_W}delText":
+			# Fallback repeats the mc:Choice content; deleted text is not shown
+			continue
+		else:
+			_docx_collect(child, parts)
+
+
+#============================================
+
+
+def _odt_text(paragraph: ET.Element) -> str:
+	parts: list[str] = []
+	_odt_collect(paragraph, parts)
+	return "".join(parts)
+
+
+def _odt_collect(element: ET.Element, parts: list[str]) -> None:
+	parts.append(element.text or "")
+	for child in element:
+		tag = child.tag
+		if tag == f"{_TEXT}s":
+			parts.append(" " * int(child.get(f"{_TEXT}c", "1")))
+		elif tag == f"{_TEXT}tab":
+			parts.append("\t")
+		elif tag == f"{_TEXT}line-break":
+			parts.append("\n")
+		elif tag != _OFFICE_ANNOTATION:
+			_odt_collect(child, parts)
+		parts.append(child.tail or "")
+
+
+#============================================
+
+
+def head_tail_summary(paragraphs: Iterable[str], chars: int = SUMMARY_CHARS) -> str | None:
+	"""
+	Summarize paragraphs as "head ... tail" without holding the whole text.
+
+	Same result as joining every paragraph with spaces and keeping the
+	first and last chars characters, but only a head buffer and a bounded
+	tail deque are kept.
+
+	Args:
+		paragraphs: Paragraph texts in document order.
+		chars: Characters kept from each end.
+
+	Returns:
+		Summary text, or None when there is no text.
+	"""
+	head_parts: list[str] = []
+	head_size = 0
+	tail: deque[str] = deque()
+	tail_size = 0
+	total = 0
+	for text in paragraphs:
+		piece = f" {text}" if total else text
+		total += len(piece)
+		if head_size < chars:
+			taken = piece[: chars - head_size]
+			head_parts.append(taken)
+			head_size += len(taken)
+		tail.append(piece)
+		tail_size += len(piece)
+		while tail_size - len(tail[0]) >= chars:
+			tail_size -= len(tail.popleft())
+	if not total:
+		return None
+	head = "".join(head_parts)
+	if total <= chars:
+		return head
+	tail_text = "".join(tail)[-chars:]
+	return f"{head} ... {tail_text}".strip()
+
+
+#============================================
+
+
+def read_docx_properties(path: Path) -> dict[str, str]:
+	"""
+	Read title and author from docProps/core.xml.
+
+	Returns:
+		Dict with "title" and/or "author" when present.
+	"""
+	return _read_properties(
+		path, DOCX_CORE, {f"{_DC}title": "title", f"{_DC}creator": "author"}
+	)
+
+
+#============================================
+
+
+def read_odt_properties(path: Path) -> dict[str, str]:
+	"""
+	Read title and author from meta.xml.
+
+	Returns:
+		Dict with "title" and/or "author" when present.
+	"""
+	return _read_properties(
+		path,
+		ODT_META,
+		{
+			f"{_DC}title": "title",
+			f"{_META}initial-creator": "author",
+			f"{_DC}creator": "author",
+		},
+	)
+
+
+#============================================
+
+
+def _read_properties(path: Path, member: str, fields: dict[str, str]) -> dict[str, str]:
+	properties: dict[str, str] = {}
+	try:
+		with zipfile.ZipFile(path) as archive:
+			root = ET.fromstring(archive.read(member))
+	except (OSError, KeyError, zipfile.BadZipFile, ET.ParseError):
+		return properties
+	found: dict[str, str] = {}
+	for element in root.iter():
+		value = " ".join((element.text or "").split())
+		if element.tag in fields and value:
+			found.setdefault(element.tag, value)
+	# fields are listed in preference order (initial creator before editor)
+	for tag, key in fields.items():
+		if tag in found and key not in properties:
+			properties[key] = found[tag]
+	return properties
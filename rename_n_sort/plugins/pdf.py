@@ -2,16 +2,41 @@
 from __future__ import annotations
 # Standard Library
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from collections.abc import Sequence
 import sys
+import struct
+import logging
 
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
 from .mdls_utils import mdls_fields
+from .pdf_images import RENDER_DPI, embedded_page_image
+from .pdf_pages import get_pdf_page_router
 from .image_plugin import ImagePlugin
+from ..captioner import get_captioner
+from ..ocr_service import get_ocr_service
 
-from pypdf import PdfReader
+from PIL import Image
+from pypdf import PageObject, PdfReader
+from pypdf.errors import PyPdfError
 from pdf2image import convert_from_path
+from pdf2image.exceptions import (
+	PDFInfoNotInstalledError,
+	PDFPageCountError,
+	PDFPopplerTimeoutError,
+	PDFSyntaxError,
+)
+
+# poppler failures for one page; the rest of the preview still runs
+_RENDER_ERRORS = (
+	PDFInfoNotInstalledError,
+	PDFPageCountError,
+	PDFPopplerTimeoutError,
+	PDFSyntaxError,
+)
+
+# pypdf raises these besides PyPdfError on malformed trailers, xrefs and streams
+_PARSE_ERRORS = (PyPdfError, ValueError, KeyError, TypeError, struct.error)
 
 #============================================
 
@@ -22,6 +47,7 @@ class PDFPlugin(FileMetadataPlugin):
 	"""
 
 	name = "pdf"
+	version = "3"
 	filetype_hint = "PDF document"
 	supported_suffixes: set[str] = {"pdf"}
 
@@ -74,67 +100,111 @@ class PDFPlugin(FileMetadataPlugin):
 		return meta
 
 	#============================================
-	def _read_preview(self, path: Path, meta: FileMetadata) -> None:
+	def _read_preview(self, path: Path, meta: FileMetadata, max_pages: int = 2) -> None:
 		"""
-		Read first couple pages when pypdf exists.
+		Read the first couple of pages, rendering only the text-sparse ones.
+
+		Each page goes through the shared PdfPageRouter: pages with enough
+		extracted text are used as is, the rest are rendered for OCR and
+		captioning. A PDF that pypdf cannot parse keeps only the mdls
+		fields.
 
 		Args:
 			path: File path.
 			meta: Metadata object to populate.
+			max_pages: Pages previewed from the start of the document.
 		"""
-		try:
-			with path.open("rb") as handle:
+		with path.open("rb") as handle:
+			router = get_pdf_page_router()
+			text_bits: list[str] = []
+			dense_bits: list[str] = []
+			render_pages: list[int] = []
+			try:
 				reader = PdfReader(handle)
 				pages = reader.pages
-				text_bits: list[str] = []
-				for page in pages[:2]:
-					extracted = page.extract_text()
-					if extracted:
-						text_bits.append(extracted.strip())
-				joined = ""
-				if text_bits:
-					joined = " ".join(text_bits)
-					meta.extra["pdf_text"] = joined[:2000]
 				page_count = len(pages)
-				meta.extra["page_count"] = page_count
-				if page_count > 0:
-					self._summarize_with_images(path, page_count, meta, max_pages=2)
-				if not meta.summary and joined:
-					meta.summary = joined[:1500]
-		except Exception:
-			return
+				for page_idx, page in enumerate(pages[:max_pages], start=1):
+					extracted = (page.extract_text() or "").strip()
+					if extracted:
+						text_bits.append(extracted)
+					if router.needs_render(extracted):
+						render_pages.append(page_idx)
+					else:
+						dense_bits.append(extracted)
+			except _PARSE_ERRORS as exc:
+				logging.warning("%s: unreadable PDF (%s); skipping the preview", path.name, exc)
+				return
+			joined = ""
+			if text_bits:
+				joined = " ".join(text_bits)
+				meta.extra["pdf_text"] = joined[:2000]
+			meta.extra["page_count"] = page_count
+			if render_pages:
+				self._summarize_with_images(path, render_pages, meta, pages=pages)
+				if meta.summary and dense_bits:
+					# mixed document: digital pages first, then OCR/captions
+					meta.summary = f"{' '.join(dense_bits)} | {meta.summary}"[:1500]
+			if not meta.summary and joined:
+				meta.summary = joined[:1500]
 
 	#============================================
 	def _summarize_with_images(
-		self, path: Path, page_count: int, meta: FileMetadata, max_pages: int = 2
+		self,
+		path: Path,
+		page_numbers: list[int],
+		meta: FileMetadata,
+		pages: Sequence[PageObject] | None = None,
 	) -> None:
 		"""
-		Render PDF pages to images and run OCR/captioning.
+		Image the given PDF pages (1-based) and run OCR/captioning.
+
+		When pages are given, scanned pages use their embedded image and
+		only the rest are rendered through poppler. A page that fails to
+		render, caption or OCR is logged and left out of the summary.
 		"""
-		render_pages = min(page_count, max_pages)
-		if render_pages <= 0:
+		if not page_numbers:
 			return
+		render_pages = len(page_numbers)
 		self._print_meta("pdf_render", f"rendering {render_pages} page(s) for OCR/captioning")
 		image_plugin = ImagePlugin()
+		captioner = get_captioner()
 		captions: list[str] = []
 		ocr_bits: list[str] = []
-		with TemporaryDirectory() as tmp_dir:
-			tmp_path = Path(tmp_dir)
-			images = convert_from_path(
-				str(path),
-				first_page=1,
-				last_page=render_pages,
-				dpi=200,
-			)
-			for page_idx, image in enumerate(images, start=1):
-				out_path = tmp_path / f"{path.stem}_page{page_idx}.png"
-				image.save(out_path)
-				ocr_text = image_plugin._extract_ocr_text(out_path)
-				if ocr_text:
-					ocr_bits.append(f"Page {page_idx}: {ocr_text}")
-				caption = image_plugin._try_caption(out_path)
-				if caption:
-					captions.append(f"Page {page_idx}: {caption}")
+		ocr_futures = []
+		ocr_service = get_ocr_service()
+		for page_idx in page_numbers:
+			try:
+				image = self._page_image(path, page_idx, pages)
+			except _RENDER_ERRORS as exc:
+				logging.warning("%s page %d: render failed (%s)", path.name, page_idx, exc)
+				meta.degraded.append(f"page {page_idx} render failed")
+				continue
+			if image is None:
+				continue
+			# the pool pickles its image on a feeder thread while this thread
+			# captions, so OCR gets its own fully decoded copy
+			image.load()
+			ocr_futures.append((page_idx, ocr_service.submit(image.copy())))
+			try:
+				caption = captioner.caption(image)
+			except Exception as exc:
+				logging.warning("%s page %d: caption failed (%s)", path.name, page_idx, exc)
+				meta.degraded.append(f"page {page_idx} caption failed")
+				caption = None
+			# release the bitmap before the next page is imaged
+			del image
+			if caption:
+				captions.append(f"Page {page_idx}: {caption}")
+		for page_idx, future in ocr_futures:
+			try:
+				raw_text = future.result()
+			except Exception as exc:
+				logging.warning("%s page %d: OCR failed (%s)", path.name, page_idx, exc)
+				meta.degraded.append(f"page {page_idx} OCR failed")
+				continue
+			ocr_text = image_plugin._clean_ocr_text(raw_text)
+			if ocr_text:
+				ocr_bits.append(f"Page {page_idx}: {ocr_text}")
 		caption_text = " | ".join(captions).strip()
 		ocr_text = " | ".join(ocr_bits).strip()
 		if caption_text:
@@ -155,6 +225,37 @@ class PDFPlugin(FileMetadataPlugin):
 		if parts:
 			meta.summary = " | ".join(parts)[:1500]
 
+	#============================================
+	def _page_image(
+		self, path: Path, page_idx: int, pages: Sequence[PageObject] | None
+	) -> Image.Image | None:
+		"""
+		Return one page as an image: the embedded scan, else a poppler render.
+		"""
+		if pages is not None:
+			try:
+				image = embedded_page_image(pages[page_idx - 1], dpi=RENDER_DPI)
+			except PyPdfError as exc:
+				# unparsable content stream; poppler may still render the page
+				logging.warning(
+					"%s page %d: embedded image lookup failed (%s); rendering instead",
+					path.name, page_idx, exc,
+				)
+				image = None
+			if image is not None:
+				get_pdf_page_router().count_embedded()
+				return image
+		# one page per call so only the current page bitmap is held for OCR
+		rendered = convert_from_path(
+			str(path),
+			first_page=page_idx,
+			last_page=page_idx,
+			dpi=RENDER_DPI,
+		)
+		if not rendered:
+			return None
+		return rendered[0]
+
 	#============================================
 	def _color(self, text: str, code: str) -> str:
 		if sys.stdout.isatty():
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Pull the embedded scan out of image-only PDF pages, skipping a poppler render.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import io
+
+# PIP3 modules
+from PIL import Image
+from pypdf import PageObject
+from pypdf.generic import DictionaryObject
+
+RENDER_DPI = 200
+# placed image must cover this much of the page to count as a scan
+MIN_PAGE_COVERAGE = 0.9
+
+# path construction/painting, shading, text and inline image operators
+_VECTOR_OPERATORS = {
+	b"m", b"l", b"c", b"v", b"y", b"h", b"re",
+	b"S", b"s", b"f", b"F", b"f*", b"B", b"B*", b"b", b"b*", b"sh",
+	b"BT", b"Tj", b"TJ", b"'", b'"', b"BI", b"INLINE IMAGE",
+}
+_IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+#============================================
+
+
+def embedded_page_image(page: PageObject, dpi: int = RENDER_DPI) -> Image.Image | None:
+	"""
+	Return a scanned page's embedded image, decoded near dpi, or None.
+
+	A page qualifies when its content stream draws exactly one image XObject
+	covering (almost) the whole page and nothing else: no paths, no text,
+	no inline images. Anything else has vector content and needs a real
+	render.
+
+	JPEG scans are decoded with Image.draft, which lets libjpeg scale by
+	1/2, 1/4 or 1/8 while decoding. Other filters (CCITT, Flate, JPX) go
+	through pypdf and are then reduced by an integer factor. Images are
+	never upscaled.
+
+	Args:
+		page: pypdf page.
+		dpi: Resolution the poppler render would have used.
+
+	Returns:
+		RGB image oriented like a rendered page, or None when the page must
+		be rendered.
+	"""
+	placed = _single_placed_image(page)
+	if placed is None:
+		return None
+	name, xobject, width_pt, height_pt = placed
+	target = (
+		max(1, round(width_pt / 72 * dpi)),
+		max(1, round(height_pt / 72 * dpi)),
+	)
+	image = _decode_reduced(page, name, xobject, target)
+	if image is None:
+		return None
+	if image.mode != "RGB":
+		image = image.convert("RGB")
+	rotation = page.rotation % 360
+	if rotation:
+		# /Rotate is clockwise, PIL rotates counter-clockwise
+		image = image.rotate(-rotation, expand=True)
+	return image
+
+
+#============================================
+
+
+def _single_placed_image(
+	page: PageObject,
+) -> tuple[str, DictionaryObject, float, float] | None:
+	resources = page.get("/Resources")
+	if resources is None:
+		return None
+	xobjects = resources.get_object().get("/XObject")
+	if xobjects is None:
+		return None
+	xobjects = xobjects.get_object()
+	contents = page.get_contents()
+	if contents is None:
+		return None
+	ctm = _IDENTITY
+	stack: list[tuple[float, ...]] = []
+	placed: tuple[str, DictionaryObject, float, float] | None = None
+	for operands, operator in contents.operations:
+		if operator in _VECTOR_OPERATORS:
+			return None
+		if operator == b"q":
+			stack.append(ctm)
+		elif operator == b"Q":
+			ctm = stack.pop() if stack else _IDENTITY
+		elif operator == b"cm":
+			ctm = _multiply(tuple(float(value) for value in operands), ctm)
+		elif operator == b"Do":
+			if placed is not None:
+				return None
+			name = str(operands[0])
+			xobject = xobjects.get(name)
+			if xobject is None:
+				return None
+			xobject = xobject.get_object()
+			a, b, c, d, _e, _f = ctm
+			# skewed, rotated or mirrored placement: let poppler handle it
+			if xobject.get("/Subtype") != "/Image" or b or c or a <= 0 or d <= 0:
+				return None
+			placed = (name, xobject, a, d)
+	if placed is None:
+		return None
+	box = page.mediabox
+	page_area = float(box.width) * float(box.height)
+	if page_area <= 0 or placed[2] * placed[3] < MIN_PAGE_COVERAGE * page_area:
+		return None
+	return placed
+
+
+#============================================
+
+
+def _multiply(first: tuple[float, ...], second: tuple[float, ...]) -> tuple[float, ...]:
+	a1, b1, c1, d1, e1, f1 = first
+	a2, b2, c2, d2, e2, f2 = second
+	product = (
+		a1 * a2 + b1 * c2,
+		a1 * b2 + b1 * d2,
+		c1 * a2 + d1 * c2,
+		c1 * b2 + d1 * d2,
+		e1 * a2 + f1 * c2 + e2,
+		e1 * b2 + f1 * d2 + f2,
+	)
+	return product
+
+
+#============================================
+
+
+def _decode_reduced(
+	page: PageObject,
+	name: str,
+	xobject: DictionaryObject,
+	target: tuple[int, int],
+) -> Image.Image | None:
+	filters = xobject.get("/Filter")
+	if not isinstance(filters, list):
+		filters = [filters]
+	try:
+		if filters == ["/DCTDecode"]:
+			image = Image.open(io.BytesIO(xobject.get_data()))
+			if image.mode in ("L", "RGB"):
+				image.draft(image.mode, target)
+			image.load()
+		else:
+			image = page.images[name].image
+	except Exception:
+		return None
+	if image is None:
+		return None
+	if image.mode in ("1", "P"):
+		# Image.reduce does not take bilevel or palette images
+		image = image.convert("L" if image.mode == "1" else "RGB")
+	factor = min(image.width // target[0], image.height // target[1])
+	if factor >= 2:
+		image = image.reduce(factor)
+	return image
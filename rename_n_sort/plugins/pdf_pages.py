@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Per-page routing for PDF previews: keep extracted text or render for OCR.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import threading
+
+DEFAULT_MIN_TEXT_CHARS = 200
+
+#============================================
+
+
+class PdfPageRouter:
+	"""
+	Decide page by page whether a PDF page needs rendering.
+
+	A page whose extracted text has at least min_text_chars non-whitespace
+	characters is treated as digital and used as is; sparser pages (scans,
+	slides, forms) are rendered for OCR and captioning. Counters cover the
+	whole process so the run summary can report the renders saved.
+	"""
+
+	#============================================
+	def __init__(self, min_text_chars: int = DEFAULT_MIN_TEXT_CHARS) -> None:
+		"""
+		Create a router.
+
+		Args:
+			min_text_chars: Non-whitespace characters of extracted text a page
+				needs to skip rendering.
+		"""
+		self.min_text_chars = min_text_chars
+		self._lock = threading.Lock()
+		self.pages_checked = 0
+		self.pages_rendered = 0
+		self.renders_skipped = 0
+		self.embedded_images = 0
+
+	#============================================
+	def needs_render(self, text: str | None) -> bool:
+		"""
+		Return True when a page's extracted text is too sparse to use alone.
+
+		Args:
+			text: Text pypdf extracted from the page.
+
+		Returns:
+			True when the page should be rendered for OCR/captioning.
+		"""
+		density = sum(len(word) for word in (text or "").split())
+		render = density < self.min_text_chars
+		with self._lock:
+			self.pages_checked += 1
+			if render:
+				self.pages_rendered += 1
+			else:
+				self.renders_skipped += 1
+		return render
+
+	#============================================
+	def count_embedded(self) -> None:
+		"""
+		Record a page imaged from its embedded scan instead of a render.
+		"""
+		with self._lock:
+			self.embedded_images += 1
+
+	#============================================
+	def stats(self) -> dict:
+		"""
+		Return page routing counters.
+		"""
+		with self._lock:
+			stats = {
+				"pages_checked": self.pages_checked,
+				"pages_rendered": self.pages_rendered,
+				"renders_skipped": self.renders_skipped,
+				"embedded_images": self.embedded_images,
+				"min_text_chars": self.min_text_chars,
+			}
+		return stats
+
+
+#============================================
+
+
+_SHARED: PdfPageRouter | None = None
+_SHARED_LOCK = threading.Lock()
+
+#============================================
+
+
+def get_pdf_page_router() -> PdfPageRouter:
+	"""
+	Return the process-wide page router, creating it on first use.
+	"""
+	global _SHARED
+	with _SHARED_LOCK:
+		if _SHARED is None:
+			_SHARED = PdfPageRouter()
+		return _SHARED
+
+
+#============================================
+
+
+def set_pdf_page_router(router: PdfPageRouter | None) -> PdfPageRouter | None:
+	"""
+	Replace the process-wide page router (tests, alternate settings).
+
+	Returns:
+		The previous router.
+	"""
+	global _SHARED
+	with _SHARED_LOCK:
+		previous = _SHARED
+		_SHARED = router
+	return previous
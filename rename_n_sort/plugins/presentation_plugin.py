@@ -3,9 +3,6 @@ from __future__ import annotations
 
 # Standard Library
 from pathlib import Path
-import shutil
-import subprocess
-import tempfile
 
 # PIP3 modules
 try:
@@ -25,6 +22,7 @@ except Exception:
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
 from .mdls_utils import mdls_field
+from .soffice_service import get_soffice_converter
 
 #============================================
 
@@ -50,7 +48,7 @@ class PresentationPlugin(FileMetadataPlugin):
 		title = mdls_field(path, "kMDItemTitle")
 		if title:
 			meta.title = title
-		summary = self._read_preview(path)
+		summary = self._read_preview(path, meta)
 		if summary:
 			meta.summary = summary
 		else:
@@ -62,12 +60,12 @@ class PresentationPlugin(FileMetadataPlugin):
 		print(f"[WHY] {path.name}: {message}")
 
 	#============================================
-	def _read_preview(self, path: Path) -> str | None:
+	def _read_preview(self, path: Path, meta: FileMetadata) -> str | None:
 		ext = path.suffix.lower().lstrip(".")
 		if ext == "pptx":
 			return self._read_pptx_preview(path)
 		if ext == "ppt":
-			return self._read_ppt_via_soffice(path)
+			return self._read_ppt_via_soffice(path, meta)
 		if ext == "odp" and odf_load and odf_text and odf_teletype:
 			try:
 				document = odf_load(str(path))
@@ -110,36 +108,19 @@ class PresentationPlugin(FileMetadataPlugin):
 		flat = " ".join(full.split())
 		return flat[:1200] if flat else None
 
-	def _read_ppt_via_soffice(self, path: Path) -> str | None:
+	def _read_ppt_via_soffice(self, path: Path, meta: FileMetadata) -> str | None:
 		if not Presentation:
 			self._print_why(path, "python-pptx not installed; skipping PPT conversion")
 			return None
-		soffice = shutil.which("soffice")
-		if not soffice:
+		converter = get_soffice_converter()
+		if not converter.available:
 			self._print_why(path, "LibreOffice not found; skipping PPT conversion")
+			meta.degraded.append("LibreOffice not found")
 			return None
-		with tempfile.TemporaryDirectory() as tmp_dir:
-			output_path = Path(tmp_dir) / f"{path.stem}.pptx"
-			try:
-				subprocess.run(
-					[
-						soffice,
-						"--headless",
-						"--convert-to",
-						"pptx",
-						"--outdir",
-						tmp_dir,
-						str(path),
-					],
-					check=True,
-					stdout=subprocess.DEVNULL,
-					stderr=subprocess.DEVNULL,
-					timeout=30,
-				)
-			except Exception as exc:
-				self._print_why(path, f"LibreOffice conversion failed ({exc.__class__.__name__})")
-				return None
-			if not output_path.exists():
-				self._print_why(path, "LibreOffice conversion produced no output")
-				return None
-			return self._read_pptx_preview(output_path)
+		try:
+			output_path = converter.convert(path, "pptx")
+		except (OSError, RuntimeError) as exc:
+			self._print_why(path, f"LibreOffice conversion failed ({exc})")
+			meta.degraded.append("LibreOffice conversion failed")
+			return None
+		return self._read_pptx_preview(output_path)
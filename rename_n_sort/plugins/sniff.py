@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Guess a file's real extension from its first few KB.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import zipfile
+from pathlib import Path
+
+SNIFF_BYTES = 4096
+
+# (leading bytes, suffix); checked in order
+_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+	(b"\x89PNG\r\n\x1a\n", "png"),
+	(b"\xff\xd8\xff", "jpg"),
+	(b"GIF87a", "gif"),
+	(b"GIF89a", "gif"),
+	(b"II*\x00", "tiff"),
+	(b"MM\x00*", "tiff"),
+	(b"fLaC", "flac"),
+	(b"OggS", "ogg"),
+	(b"ID3", "mp3"),
+	(b"\x1a\x45\xdf\xa3", "mkv"),
+	(b"{\\rtf", "rtf"),
+)
+
+# ODF and EPUB store an uncompressed "mimetype" member first
+_ZIP_MIMETYPES = {
+	"application/epub+zip": "epub",
+	"application/vnd.oasis.opendocument.text": "odt",
+	"application/vnd.oasis.opendocument.presentation": "odp",
+	"application/vnd.oasis.opendocument.spreadsheet": "ods",
+	"application/vnd.oasis.opendocument.graphics": "odg",
+}
+
+# first path component of an OOXML package member
+_OOXML_PARTS = {"word": "docx", "ppt": "pptx", "xl": "xlsx"}
+
+_HEIF_BRANDS = {b"heic", b"heix", b"mif1", b"msf1", b"hevc"}
+
+# signatures that name exactly one format, so they may override a file's own
+# suffix; containers (zip, ftyp, tiff, ogg, mkv) and text guesses are shared
+# by several formats and only fill in for a missing or unknown suffix
+CONFIDENT_SUFFIXES = frozenset({
+	"pdf", "png", "jpg", "gif", "bmp", "heic", "flac", "mp3", "wav", "avi", "aiff", "rtf",
+	"docx", "pptx", "xlsx", "doc", "ppt", "xls", "epub", "odt", "odp", "ods", "odg",
+})
+
+#============================================
+
+
+def sniff_suffix(path: Path, limit: int = SNIFF_BYTES) -> str | None:
+	"""
+	Guess a lowercase suffix (no dot) from the file's leading bytes.
+
+	Args:
+		path: File path.
+		limit: Bytes to read.
+
+	Returns:
+		Suffix such as "pdf" or "docx", or None when the content is unknown.
+	"""
+	try:
+		with open(path, "rb") as handle:
+			head = handle.read(limit)
+	except OSError:
+		return None
+	if not head:
+		return None
+	suffix = sniff_bytes(head)
+	if suffix == "zip":
+		suffix = _sniff_zip(path, head)
+	return suffix
+
+
+#============================================
+
+
+def sniff_bytes(head: bytes) -> str | None:
+	"""
+	Guess a suffix from leading bytes alone (zip containers report "zip").
+	"""
+	# PDF readers accept junk before the header, so look a little further in
+	if b"%PDF-" in head[:1024]:
+		return "pdf"
+	for signature, suffix in _SIGNATURES:
+		if head.startswith(signature):
+			return suffix
+	# BMP: "BM" then reserved fields that are always zero
+	if head.startswith(b"BM") and head[6:10] == b"\x00\x00\x00\x00":
+		return "bmp"
+	if head.startswith(b"PK\x03\x04"):
+		return "zip"
+	if head.startswith(b"RIFF") and len(head) >= 12:
+		riff_type = head[8:12]
+		if riff_type == b"WAVE":
+			return "wav"
+		if riff_type == b"AVI ":
+			return "avi"
+	if head.startswith(b"FORM") and head[8:12] in (b"AIFF", b"AIFC"):
+		return "aiff"
+	if head[4:8] == b"ftyp":
+		brand = head[8:12]
+		if brand in _HEIF_BRANDS:
+			return "heic"
+		if brand == b"qt  ":
+			return "mov"
+		return "mp4"
+	if head.startswith(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"):
+		return _sniff_ole(head)
+	return _sniff_text(head)
+
+
+#============================================
+
+
+def _sniff_zip(path: Path, head: bytes) -> str:
+	# local header: name length at 26, extra length at 28, name at 30
+	name_len = int.from_bytes(head[26:28], "little")
+	extra_len = int.from_bytes(head[28:30], "little")
+	name = head[30 : 30 + name_len]
+	if name == b"mimetype":
+		start = 30 + name_len + extra_len
+		mimetype = head[start : start + 80].split(b"PK", 1)[0].decode("ascii", errors="ignore")
+		for prefix, suffix in _ZIP_MIMETYPES.items():
+			if mimetype.startswith(prefix):
+				return suffix
+	try:
+		with zipfile.ZipFile(path) as archive:
+			names = archive.namelist()
+	except (OSError, zipfile.BadZipFile):
+		return "zip"
+	for name_text in names:
+		part = name_text.split("/", 1)[0]
+		if part in _OOXML_PARTS:
+			return _OOXML_PARTS[part]
+	return "zip"
+
+
+#============================================
+
+
+def _sniff_ole(head: bytes) -> str | None:
+	# legacy Office: the stream names sit in the UTF-16 directory
+	for stream, suffix in (
+		("WordDocument", "doc"),
+		("PowerPoint Document", "ppt"),
+		("Workbook", "xls"),
+	):
+		if stream.encode("utf-16-le") in head:
+			return suffix
+	return None
+
+
+#============================================
+
+
+def _sniff_text(head: bytes) -> str | None:
+	if b"\x00" in head:
+		return None
+	try:
+		text = head.decode("utf-8")
+	except UnicodeDecodeError as exc:
+		# a multi-byte character cut at the end of the sample is fine
+		if exc.start < len(head) - 3:
+			return None
+		text = head[: exc.start].decode("utf-8")
+	lowered = text.lstrip("\ufeff \t\r\n").lower()
+	if lowered.startswith("<!doctype html") or lowered.startswith("<html"):
+		return "html"
+	if lowered.startswith("<?xml") or lowered.startswith("<svg"):
+		return "svg" if "<svg" in lowered else None
+	return "txt"
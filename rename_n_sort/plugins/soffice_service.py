@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+Shared LibreOffice conversion service for legacy DOC/PPT files.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import os
+import time
+import atexit
+import queue
+import shutil
+import hashlib
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+from concurrent.futures import Future
+from collections.abc import Callable, Iterable
+
+DEFAULT_WORKERS = 2
+DEFAULT_BATCH_SIZE = 8
+DEFAULT_TIMEOUT_SECONDS = 30.0
+DEFAULT_MAX_WAIT_SECONDS = 0.1
+_HASH_CHUNK = 1024 * 1024
+# legacy suffix -> format the plugins read after conversion
+LEGACY_FORMATS = {"doc": "docx", "ppt": "pptx"}
+
+#============================================
+
+
+def content_digest(path: Path) -> str:
+	"""
+	Return the sha256 hex digest of a file's bytes.
+	"""
+	digest = hashlib.sha256()
+	with open(path, "rb") as handle:
+		while True:
+			chunk = handle.read(_HASH_CHUNK)
+			if not chunk:
+				break
+			digest.update(chunk)
+	return digest.hexdigest()
+
+
+#============================================
+
+
+class SofficeConverter:
+	"""
+	Thread-safe headless LibreOffice converter with batching and a content cache.
+
+	Callers submit() files from any thread; a fixed set of worker threads
+	groups queued files into batches and converts each batch with a single
+	soffice start. Batches only form when files are queued together, so the
+	organizer prefetch()es a run's legacy files before extraction starts and
+	the plugins' convert() calls then wait on those conversions. Each worker
+	owns its own profile directory, so workers never fight over the profile
+	lock and the profile is only created once.
+	Converted outputs are cached by content hash and target format, so
+	duplicate files are converted once. A batch gets timeout_seconds per
+	file; when a batch fails or times out, the files without output are
+	retried one at a time with their own timeout.
+	"""
+
+	#============================================
+	def __init__(
+		self,
+		binary: str = "soffice",
+		runner: Callable[..., subprocess.CompletedProcess] = subprocess.run,
+		workers: int = DEFAULT_WORKERS,
+		batch_size: int = DEFAULT_BATCH_SIZE,
+		timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+		max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+		work_dir: Path | None = None,
+	) -> None:
+		"""
+		Create an idle converter; nothing starts until the first submit().
+
+		Args:
+			binary: soffice executable name or path.
+			runner: subprocess.run-compatible callable (swap in a fake for tests).
+			workers: Concurrent soffice processes.
+			batch_size: Files per soffice start.
+			timeout_seconds: Conversion time allowed per file.
+			max_wait_seconds: How long a worker waits for more files before
+				converting a partial batch.
+			work_dir: Folder for profiles and converted outputs (default: a
+				temporary folder removed by close()).
+		"""
+		self.binary = binary
+		self.runner = runner
+		self.workers = max(1, workers)
+		self.batch_size = max(1, batch_size)
+		self.timeout_seconds = timeout_seconds
+		self.max_wait_seconds = max_wait_seconds
+		self._work_dir = work_dir
+		self._owns_work_dir = work_dir is None
+		self._available: bool | None = None
+		self._queue: queue.Queue[tuple[Path, str, str, Future]] = queue.Queue()
+		self._threads: list[threading.Thread] = []
+		self._lock = threading.Lock()
+		# (digest, fmt) -> finished or in-flight conversion
+		self._results: dict[tuple[str, str], Future] = {}
+		# prefetched keys whose first convert() is not a cache hit
+		self._prefetched: set[tuple[str, str]] = set()
+		self.conversions = 0
+		self.failures = 0
+		self.timeouts = 0
+		self.batches = 0
+		self.process_starts = 0
+		self.cache_hits = 0
+		self.convert_seconds = 0.0
+
+	#============================================
+	@property
+	def available(self) -> bool:
+		"""
+		True when the soffice binary exists (probed once).
+		"""
+		if self._available is None:
+			self._available = shutil.which(self.binary) is not None
+		return self._available
+
+	#============================================
+	def submit(self, path: Path, fmt: str) -> Future:
+		"""
+		Queue a file for conversion.
+
+		Args:
+			path: Source document.
+			fmt: Target format extension (e.g. "docx", "pptx").
+
+		Returns:
+			Future resolving to the converted file path, or raising
+			RuntimeError when the conversion fails.
+		"""
+		future = self._submit(path, fmt, prefetch=False)
+		return future
+
+	#============================================
+	def prefetch(self, paths: Iterable[Path]) -> int:
+		"""
+		Queue every legacy DOC/PPT file in paths without waiting.
+
+		The files reach the queue together, so workers convert them in full
+		batches; later convert() calls pick up the finished or in-flight
+		conversion.
+
+		Returns:
+			Number of files queued.
+		"""
+		if not self.available:
+			return 0
+		queued = 0
+		for path in paths:
+			fmt = LEGACY_FORMATS.get(path.suffix.lower().lstrip("."))
+			if fmt is None:
+				continue
+			try:
+				self._submit(path, fmt, prefetch=True)
+			except OSError:
+				# unreadable now; the plugin reports it when it gets there
+				continue
+			queued += 1
+		return queued
+
+	#============================================
+	def _submit(self, path: Path, fmt: str, prefetch: bool) -> Future:
+		digest = content_digest(path)
+		key = (digest, fmt)
+		with self._lock:
+			existing = self._results.get(key)
+			if existing is not None:
+				if key in self._prefetched and not prefetch:
+					self._prefetched.discard(key)
+				else:
+					self.cache_hits += 1
+				return existing
+			future: Future = Future()
+			self._results[key] = future
+			if prefetch:
+				self._prefetched.add(key)
+			self._ensure_workers_locked()
+		self._queue.put((path, fmt, digest, future))
+		return future
+
+	#============================================
+	def convert(self, path: Path, fmt: str) -> Path:
+		"""
+		Convert one file and wait for the result.
+
+		Raises:
+			RuntimeError: When soffice is missing, fails, or times out.
+		"""
+		if not self.available:
+			raise RuntimeError("LibreOffice not found")
+		output = self.submit(path, fmt).result()
+		return output
+
+	#============================================
+	def convert_many(self, paths: list[Path], fmt: str) -> list[Path | None]:
+		"""
+		Convert several files through the shared queue.
+
+		Returns:
+			Converted path per input, or None where the conversion failed.
+		"""
+		if not self.available:
+			return [None for _path in paths]
+		futures = [self.submit(path, fmt) for path in paths]
+		outputs: list[Path | None] = []
+		for future in futures:
+			try:
+				outputs.append(future.result())
+			except RuntimeError:
+				outputs.append(None)
+		return outputs
+
+	#============================================
+	def _root(self) -> Path:
+		with self._lock:
+			if self._work_dir is None:
+				self._work_dir = Path(tempfile.mkdtemp(prefix="rename_n_sort_soffice_"))
+			return self._work_dir
+
+	#============================================
+	def _ensure_workers_locked(self) -> None:
+		self._threads = [thread for thread in self._threads if thread.is_alive()]
+		for slot in range(len(self._threads), self.workers):
+			thread = threading.Thread(
+				target=self._worker_loop, args=(slot,), name=f"soffice-{slot}", daemon=True
+			)
+			thread.start()
+			self._threads.append(thread)
+
+	#============================================
+	def _worker_loop(self, slot: int) -> None:
+		while True:
+			pending = [self._queue.get()]
+			deadline = time.monotonic() + self.max_wait_seconds
+			while len(pending) < self.batch_size:
+				remaining = deadline - time.monotonic()
+				if remaining <= 0:
+					break
+				try:
+					pending.append(self._queue.get(timeout=remaining))
+				except queue.Empty:
+					break
+			by_format: dict[str, list[tuple[Path, str, str, Future]]] = {}
+			for item in pending:
+				by_format.setdefault(item[1], []).append(item)
+			for fmt, items in by_format.items():
+				try:
+					self._convert_batch(slot, fmt, items)
+				except Exception as exc:
+					for _path, _fmt, _digest, future in items:
+						if not future.done():
+							future.set_exception(RuntimeError(str(exc)))
+
+	#============================================
+	def _convert_batch(self, slot: int, fmt: str, items: list[tuple[Path, str, str, Future]]) -> None:
+		root = self._root()
+		profile_dir = root / f"profile-{slot}"
+		out_dir = root / "out"
+		stage_dir = root / f"stage-{slot}"
+		out_dir.mkdir(parents=True, exist_ok=True)
+		stage_dir.mkdir(parents=True, exist_ok=True)
+		staged: list[tuple[Path, Path, Future]] = []
+		for path, _fmt, digest, future in items:
+			output_path = out_dir / f"{digest}.{fmt}"
+			if output_path.exists():
+				# converted earlier into a persistent work_dir
+				self._finish(future, output_path)
+				continue
+			# digest-named inputs keep outputs unique when stems collide
+			staged_path = stage_dir / f"{digest}{path.suffix.lower()}"
+			_link_or_copy(path, staged_path)
+			staged.append((staged_path, output_path, future))
+		if not staged:
+			return
+		error = self._run(profile_dir, out_dir, fmt, [item[0] for item in staged])
+		with self._lock:
+			self.batches += 1
+		errors: dict[Path, str | None] = {}
+		if error and len(staged) > 1:
+			# one bad file should not cost the whole batch; retry each alone
+			for staged_path, output_path, _future in staged:
+				if not output_path.exists():
+					errors[output_path] = self._run(profile_dir, out_dir, fmt, [staged_path])
+		for staged_path, output_path, future in staged:
+			staged_path.unlink(missing_ok=True)
+			if output_path.exists():
+				self._finish(future, output_path)
+				continue
+			with self._lock:
+				self.failures += 1
+			_fail(future, errors.get(output_path) or error or "produced no output")
+
+	#============================================
+	def _finish(self, future: Future, output_path: Path) -> None:
+		with self._lock:
+			self.conversions += 1
+		future.set_result(output_path)
+
+	#============================================
+	def _run(self, profile_dir: Path, out_dir: Path, fmt: str, inputs: list[Path]) -> str | None:
+		"""
+		Run one soffice conversion.
+
+		Returns:
+			None on success, otherwise a short error description.
+		"""
+		command = [
+			self.binary,
+			f"-env:UserInstallation={profile_dir.resolve().as_uri()}",
+			"--headless",
+			"--norestore",
+			"--convert-to",
+			fmt,
+			"--outdir",
+			str(out_dir),
+		]
+		command.extend(str(path) for path in inputs)
+		timeout = self.timeout_seconds * len(inputs)
+		with self._lock:
+			self.process_starts += 1
+		start = time.monotonic()
+		try:
+			result = self.runner(
+				command,
+				stdout=subprocess.DEVNULL,
+				stderr=subprocess.DEVNULL,
+				timeout=timeout,
+				check=False,
+			)
+		except subprocess.TimeoutExpired:
+			with self._lock:
+				self.timeouts += 1
+			return f"timed out after {timeout:.0f}s"
+		except OSError as exc:
+			return exc.__class__.__name__
+		finally:
+			with self._lock:
+				self.convert_seconds += time.monotonic() - start
+		if result.returncode != 0:
+			return f"exit status {result.returncode}"
+		return None
+
+	#============================================
+	def stats(self) -> dict[str, float | int]:
+		"""
+		Return conversion, batch, cache and timeout counters.
+		"""
+		return {
+			"conversions": self.conversions,
+			"failures": self.failures,
+			"timeouts": self.timeouts,
+			"batches": self.batches,
+			"process_starts": self.process_starts,
+			"cache_hits": self.cache_hits,
+			"convert_seconds": round(self.convert_seconds, 3),
+		}
+
+	#============================================
+	def close(self) -> None:
+		"""
+		Remove the temporary work folder if this converter created it.
+		"""
+		with self._lock:
+			work_dir = self._work_dir
+			self._results.clear()
+			self._prefetched.clear()
+		if self._owns_work_dir and work_dir is not None:
+			shutil.rmtree(work_dir, ignore_errors=True)
+			with self._lock:
+				self._work_dir = None
+
+
+#============================================
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+	target.unlink(missing_ok=True)
+	try:
+		os.symlink(source.resolve(), target)
+	except OSError:
+		shutil.copyfile(source, target)
+
+
+#============================================
+
+
+def _fail(future: Future, reason: str) -> None:
+	if not future.done():
+		future.set_exception(RuntimeError(reason))
+
+
+#============================================
+
+
+_SHARED: SofficeConverter | None = None
+_SHARED_LOCK = threading.Lock()
+
+#============================================
+
+
+def get_soffice_converter() -> SofficeConverter:
+	"""
+	Return the process-wide converter, creating it (idle) on first use.
+	"""
+	global _SHARED
+	with _SHARED_LOCK:
+		if _SHARED is None:
+			_SHARED = SofficeConverter()
+			atexit.register(_SHARED.close)
+		return _SHARED
+
+
+#============================================
+
+
+def set_soffice_converter(service: SofficeConverter | None) -> SofficeConverter | None:
+	"""
+	Replace the process-wide converter (tests, alternate settings).
+
+	Returns:
+		The previous converter.
+	"""
+	global _SHARED
+	with _SHARED_LOCK:
+		previous = _SHARED
+		_SHARED = service
+	return previous
@@ -7,6 +7,7 @@ from pathlib import Path
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
 from .mdls_utils import mdls_field
+from .text_reader import read_head_text
 
 #============================================
 
@@ -17,6 +18,8 @@ class TextDocumentPlugin(FileMetadataPlugin):
 	"""
 
 	name = "text"
+	# 2: bounded reader, non-UTF-8 text decoded as cp1252
+	version = "2"
 	filetype_hint = "Plain-text Document"
 	supported_suffixes: set[str] = {"txt", "md", "rtf"}
 
@@ -67,10 +70,9 @@ class TextDocumentPlugin(FileMetadataPlugin):
 			Text snippet or None.
 		"""
 		try:
-			text_blob = path.read_text(encoding="utf-8", errors="ignore")
-		except Exception:
+			cleaned = read_head_text(path, 1800)
+		except OSError:
 			return None
-		cleaned = " ".join(text_blob.split())
 		if not cleaned:
 			return None
-		return cleaned[:1800]
+		return cleaned
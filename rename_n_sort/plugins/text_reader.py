@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Bounded head/tail readers for text previews.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import os
+import codecs
+from pathlib import Path
+from collections.abc import Iterable, Iterator
+
+CHUNK_BYTES = 64 * 1024
+# hard cap on bytes read for one preview, however sparse the text is
+MAX_SCAN_BYTES = 1024 * 1024
+
+_BOMS = (
+	(codecs.BOM_UTF8, "utf-8"),
+	(codecs.BOM_UTF16_LE, "utf-16-le"),
+	(codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+
+#============================================
+
+
+def detect_encoding(sample: bytes) -> str:
+	"""
+	Pick a codec for a file from its first bytes.
+
+	Args:
+		sample: Leading bytes of the file.
+
+	Returns:
+		Codec name: the BOM's UTF-8/UTF-16 variant, UTF-8 when the sample
+		decodes cleanly, otherwise cp1252.
+	"""
+	for bom, encoding in _BOMS:
+		if sample.startswith(bom):
+			return encoding
+	try:
+		sample.decode("utf-8")
+	except UnicodeDecodeError as exc:
+		# a multi-byte character cut off at the end of the sample is fine
+		if exc.start < len(sample) - 3:
+			return "cp1252"
+	return "utf-8"
+
+
+#============================================
+
+
+def iter_text(
+	path: Path,
+	offset: int = 0,
+	max_bytes: int = MAX_SCAN_BYTES,
+	chunk_bytes: int = CHUNK_BYTES,
+) -> Iterator[str]:
+	"""
+	Decode a file region chunk by chunk.
+
+	The encoding is detected on the first chunk of the file. Undecodable
+	bytes are dropped.
+
+	Args:
+		path: File path.
+		offset: Byte offset to start at.
+		max_bytes: Bytes to read at most.
+		chunk_bytes: Read size.
+
+	Yields:
+		Decoded text chunks.
+	"""
+	with open(path, "rb") as handle:
+		sample = handle.read(chunk_bytes)
+		encoding = detect_encoding(sample)
+		bom_size = next((len(bom) for bom, _name in _BOMS if sample.startswith(bom)), 0)
+		offset = max(offset, bom_size)
+		if encoding.startswith("utf-16"):
+			# stay on a code unit boundary
+			offset -= (offset - bom_size) % 2
+		handle.seek(offset)
+		decoder = codecs.getincrementaldecoder(encoding)(errors="ignore")
+		remaining = max_bytes
+		while remaining > 0:
+			data = handle.read(min(chunk_bytes, remaining))
+			if not data:
+				break
+			remaining -= len(data)
+			text = decoder.decode(data)
+			if text:
+				yield text
+		tail = decoder.decode(b"", final=True)
+		if tail:
+			yield tail
+
+
+#============================================
+
+
+def collapse_whitespace(chunks: Iterable[str], limit: int) -> str:
+	"""
+	Join chunks with runs of whitespace collapsed to one space.
+
+	Matches " ".join(text.split())[:limit] but stops consuming chunks as
+	soon as limit characters are collected.
+
+	Args:
+		chunks: Text pieces in order.
+		limit: Characters to keep.
+
+	Returns:
+		Collapsed text, at most limit characters.
+	"""
+	parts: list[str] = []
+	size = 0
+	gap = False
+	for chunk in chunks:
+		words = chunk.split()
+		if not words:
+			gap = gap or bool(chunk)
+			continue
+		if chunk[0].isspace():
+			gap = True
+		for idx, word in enumerate(words):
+			if (gap or idx) and size:
+				parts.append(" ")
+				size += 1
+			parts.append(word)
+			size += len(word)
+			gap = False
+			if size >= limit:
+				return "".join(parts)[:limit]
+		gap = chunk[-1].isspace()
+	return "".join(parts)[:limit]
+
+
+#============================================
+
+
+def read_head_text(path: Path, max_chars: int, max_bytes: int = MAX_SCAN_BYTES) -> str:
+	"""
+	Read the first max_chars whitespace-collapsed characters of a file.
+	"""
+	text = collapse_whitespace(iter_text(path, max_bytes=max_bytes), max_chars)
+	return text
+
+
+#============================================
+
+
+def read_tail_text(path: Path, max_chars: int, max_bytes: int = CHUNK_BYTES) -> str:
+	"""
+	Read the last max_chars whitespace-collapsed characters of a file.
+
+	Seeks to the final max_bytes, so a partial first word may be dropped.
+	"""
+	size = os.path.getsize(path)
+	offset = max(0, size - max_bytes)
+	# a few spare bytes cover the code unit realignment in iter_text
+	chunks = iter_text(path, offset=offset, max_bytes=max_bytes + 4)
+	text = " ".join("".join(chunks).split())
+	if offset and " " in text:
+		# the seek probably landed mid-word
+		text = text.split(" ", 1)[1]
+	return text[-max_chars:]
+
+
+#============================================
+
+
+def read_head_lines(path: Path, max_lines: int, max_bytes: int = CHUNK_BYTES) -> list[str]:
+	"""
+	Read up to max_lines lines from the first max_bytes of a file.
+	"""
+	text = "".join(iter_text(path, max_bytes=max_bytes))
+	lines = text.splitlines()[:max_lines]
+	return lines
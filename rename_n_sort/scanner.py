@@ -4,7 +4,11 @@ Directory scanner for cleanup.
 """
 
 # Standard Library
+import os
+import heapq
+import random
 from pathlib import Path
+from collections.abc import Iterable, Iterator
 
 # local repo modules
 from .config import AppConfig
@@ -12,35 +16,140 @@ from .config import AppConfig
 #============================================
 
 
-def iter_files(config: AppConfig) -> list[Path]:
+def iter_files(config: AppConfig) -> Iterator[Path]:
 	"""
 	Iterate over files according to config.
 
+	Directories are walked with os.scandir and never descended past
+	config.max_depth, so shallow scans of huge trees stay cheap. Paths are
+	yielded lazily in walk order.
+
 	Args:
 		config: Application configuration.
 
-	Returns:
-		List of file paths.
+	Yields:
+		File paths.
 	"""
-	paths: list[Path] = []
 	for root in config.normalized_roots():
 		if not root.exists():
 			continue
-		for path in root.rglob("*"):
-			if not path.is_file():
-				continue
-			try:
-				rel = path.relative_to(root)
-			except Exception:
-				rel = path
-			depth = max(len(rel.parts) - 1, 0)
-			if depth > config.max_depth:
-				continue
-			if config.exclude_hidden and path.name.startswith("."):
-				continue
-			if config.include_extensions:
-				ext = path.suffix.lower().lstrip(".")
-				if ext not in config.include_extensions:
+		yield from _walk_root(root, config)
+
+
+#============================================
+
+
+def _walk_root(root: Path, config: AppConfig) -> Iterator[Path]:
+	"""
+	Depth-pruned walk of a single root.
+
+	Args:
+		root: Normalized scan root.
+		config: Application configuration.
+
+	Yields:
+		File paths under root.
+	"""
+	# stack of (directory, depth of files inside it); root files are depth 0
+	stack: list[tuple[str, int]] = [(str(root), 0)]
+	while stack:
+		directory, depth = stack.pop()
+		subdirs: list[str] = []
+		try:
+			scan_iter = os.scandir(directory)
+		except OSError:
+			continue
+		with scan_iter:
+			for entry in scan_iter:
+				if config.exclude_hidden and entry.name.startswith("."):
+					continue
+				# DirEntry caches the d_type from the directory read
+				try:
+					is_dir = entry.is_dir(follow_symlinks=False)
+					is_file = not is_dir and entry.is_file()
+				except OSError:
+					continue
+				if is_dir:
+					if depth < config.max_depth:
+						subdirs.append(entry.path)
 					continue
-			paths.append(path)
-	return paths
+				if not is_file:
+					continue
+				if config.include_extensions:
+					ext = os.path.splitext(entry.name)[1].lower().lstrip(".")
+					if ext not in config.include_extensions:
+						continue
+				yield Path(entry.path)
+		# reverse so the first listed subdirectory is walked first
+		for subdir in reversed(subdirs):
+			stack.append((subdir, depth + 1))
+
+
+#============================================
+
+
+def select_files(
+	paths: Iterable[Path],
+	config: AppConfig,
+	rng: random.Random | None = None,
+) -> list[Path]:
+	"""
+	Choose the files to process from a path stream.
+
+	With max_files set, memory stays at O(max_files): randomized runs use
+	reservoir sampling and sorted runs keep a bounded heap of the smallest
+	paths. Without a limit the whole stream is shuffled or sorted.
+
+	Args:
+		paths: Candidate paths, usually from iter_files.
+		config: Application configuration.
+		rng: Optional random generator for reproducible sampling.
+
+	Returns:
+		Selected paths in processing order.
+	"""
+	if rng is None:
+		rng = random.Random()
+	limit = config.max_files
+	if not limit:
+		selected = list(paths)
+		if config.randomize:
+			rng.shuffle(selected)
+		else:
+			selected.sort()
+		return selected
+	if config.randomize:
+		selected = _reservoir_sample(paths, limit, rng)
+		# reservoir slots keep arrival order, so shuffle for processing order
+		rng.shuffle(selected)
+		return selected
+	# heapq.nsmallest keeps only `limit` items on its heap
+	selected = heapq.nsmallest(limit, paths)
+	return selected
+
+
+#============================================
+
+
+def _reservoir_sample(paths: Iterable[Path], limit: int, rng: random.Random) -> list[Path]:
+	"""
+	Uniformly sample up to limit paths in one pass (Algorithm R).
+
+	Args:
+		paths: Candidate paths.
+		limit: Reservoir size.
+		rng: Random generator.
+
+	Returns:
+		Sampled paths.
+	"""
+	reservoir: list[Path] = []
+	for seen, path in enumerate(paths):
+		if seen < limit:
+			reservoir.append(path)
+			continue
+		# replace a slot with probability limit / (seen + 1)
+		slot = rng.randint(0, seen)
+		if slot < limit:
+			reservoir[slot] = path
+	return reservoir
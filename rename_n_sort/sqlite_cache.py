@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Shared SQLite plumbing for the persistent caches: open, LRU trim, counters.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import sqlite3
+import threading
+from pathlib import Path
+
+#============================================
+
+
+class SqliteLruCache:
+	"""
+	Base for thread-safe, size-bounded SQLite caches.
+
+	Subclasses own the table layout and key columns; this class opens the
+	database, applies the schema, keeps hit/miss counters and trims the
+	table least-recently-used first once the summed size_column passes
+	max_bytes. The table needs a last_access REAL column. Every counter
+	update and query runs under one lock so a cache can be shared across
+	threads.
+	"""
+
+	#============================================
+	def __init__(
+		self,
+		db_path: Path,
+		schema: tuple[str, ...],
+		table: str,
+		size_column: str,
+		max_bytes: int,
+		refresh: bool = False,
+	) -> None:
+		"""
+		Open (or create) the cache database.
+
+		Args:
+			db_path: SQLite file path.
+			schema: CREATE TABLE / CREATE INDEX statements to run.
+			table: Table holding the entries.
+			size_column: Column with each entry's payload size in bytes.
+			max_bytes: Payload size budget before LRU eviction.
+			refresh: When True, ignore stored entries but still write new ones.
+		"""
+		db_path.parent.mkdir(parents=True, exist_ok=True)
+		self.db_path = db_path
+		self.max_bytes = max_bytes
+		self.refresh = refresh
+		self.hits = 0
+		self.misses = 0
+		self._table = table
+		self._size_column = size_column
+		self._lock = threading.Lock()
+		self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+		with self._lock:
+			for statement in schema:
+				self._conn.execute(statement)
+			self._conn.commit()
+
+	#============================================
+	def _count_miss(self) -> None:
+		"""
+		Record a miss that happened outside a locked lookup.
+		"""
+		with self._lock:
+			self.misses += 1
+
+	#============================================
+	def _evict_locked(self) -> None:
+		"""
+		Drop least-recently-used rows until payloads fit max_bytes.
+
+		Call with the lock held; the caller commits.
+		"""
+		total_row = self._conn.execute(
+			f"SELECT COALESCE(SUM({self._size_column}), 0) FROM {self._table}"
+		)
+		excess = total_row.fetchone()[0] - self.max_bytes
+		if excess <= 0:
+			return
+		doomed: list[int] = []
+		rows = self._conn.execute(
+			f"SELECT rowid, {self._size_column} FROM {self._table} ORDER BY last_access, rowid"
+		)
+		for rowid, size in rows:
+			if excess <= 0:
+				break
+			doomed.append(rowid)
+			excess -= size
+		doomed_rows = [(rowid,) for rowid in doomed]
+		self._conn.executemany(f"DELETE FROM {self._table} WHERE rowid=?", doomed_rows)
+
+	#============================================
+	def entry_count(self) -> int:
+		"""
+		Return the number of cached entries.
+		"""
+		with self._lock:
+			count = self._conn.execute(f"SELECT COUNT(*) FROM {self._table}").fetchone()[0]
+		return count
+
+	#============================================
+	def close(self) -> None:
+		"""
+		Close the database connection.
+		"""
+		with self._lock:
+			self._conn.close()
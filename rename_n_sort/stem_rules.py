@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Deterministic stem_action rules over compute_stem_features output.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+from dataclasses import dataclass, field
+
+#============================================
+
+
+@dataclass(slots=True)
+class StemRule:
+	"""
+	One stem_action rule.
+
+	Attributes:
+		name: Short rule id recorded in the decision reason.
+		action: stem_action to apply ("drop", "normalize" or "keep").
+		reason: Human-readable justification.
+		conditions: Feature name -> required value. A value may also be an
+			(operator, number) tuple using one of <, <=, >, >=, ==, !=.
+			Every condition must hold for the rule to match.
+	"""
+	name: str
+	action: str
+	reason: str
+	conditions: dict[str, object] = field(default_factory=dict)
+
+	#============================================
+	def matches(self, features: dict[str, object]) -> bool:
+		"""
+		Check every condition against the stem features.
+
+		Args:
+			features: Output of compute_stem_features.
+
+		Returns:
+			True when all conditions hold.
+		"""
+		if not self.conditions:
+			return False
+		for key, expected in self.conditions.items():
+			if key not in features:
+				return False
+			if not _condition_holds(features[key], expected):
+				return False
+		return True
+
+
+#============================================
+
+
+# first match wins; only unambiguous stems belong here, the LLM handles the rest
+DEFAULT_STEM_RULES: tuple[StemRule, ...] = (
+	StemRule(
+		name="uuid_like",
+		action="drop",
+		reason="stem is a UUID",
+		conditions={"uuid_like": True},
+	),
+	StemRule(
+		name="generic_label",
+		action="drop",
+		reason="stem is a generic camera or download label",
+		conditions={"generic_label": True},
+	),
+	StemRule(
+		name="hex_blob",
+		action="drop",
+		reason="stem is a single hex hash token",
+		# a letter keeps all-digit stems such as 20240115 out of this rule
+		conditions={"hex_blob": True, "token_count": 1, "has_letter": True},
+	),
+	# years, dates, form and invoice numbers are digits too; only runs
+	# longer than any of those (epoch-ms timestamps, message IDs) are dropped
+	StemRule(
+		name="long_digit_run",
+		action="drop",
+		reason="stem is a 13+ digit timestamp or ID with no words",
+		conditions={"max_digit_run": (">=", 13), "alpha_token_count": 0},
+	),
+)
+
+_OPERATORS = {
+	"<": lambda left, right: left < right,
+	"<=": lambda left, right: left <= right,
+	">": lambda left, right: left > right,
+	">=": lambda left, right: left >= right,
+	"==": lambda left, right: left == right,
+	"!=": lambda left, right: left != right,
+}
+
+#============================================
+
+
+def _condition_holds(actual: object, expected: object) -> bool:
+	"""
+	Evaluate one rule condition.
+	"""
+	if isinstance(expected, tuple) and len(expected) == 2 and expected[0] in _OPERATORS:
+		compare = _OPERATORS[expected[0]]
+		result = bool(compare(actual, expected[1]))
+		return result
+	return actual == expected
+
+
+#============================================
+
+
+def match_stem_rule(
+	features: dict[str, object],
+	rules: list[StemRule] | tuple[StemRule, ...],
+) -> StemRule | None:
+	"""
+	Return the first rule that matches the stem features.
+
+	Args:
+		features: Output of compute_stem_features.
+		rules: Ordered rule table.
+
+	Returns:
+		Matching StemRule or None when the stem is ambiguous.
+	"""
+	for rule in rules:
+		if rule.matches(features):
+			return rule
+	return None
@@ -6,6 +6,7 @@ Transport interface for LLM backends.
 from __future__ import annotations
 
 from typing import Protocol
+from collections.abc import Callable
 
 
 class LLMTransport(Protocol):
@@ -16,3 +17,24 @@ class LLMTransport(Protocol):
 		Send a prompt and return raw model text.
 		"""
 
+
+
+class AsyncLLMTransport(LLMTransport, Protocol):
+	async def agenerate(self, prompt: str, *, purpose: str, max_tokens: int) -> str:
+		"""
+		Send a prompt without blocking the event loop and return raw model text.
+		"""
+
+
+class StreamingLLMTransport(LLMTransport, Protocol):
+	def generate_until(
+		self,
+		prompt: str,
+		*,
+		purpose: str,
+		max_tokens: int,
+		stop_when: Callable[[str], bool],
+	) -> str:
+		"""
+		Stream a reply and return as soon as stop_when(text so far) is True.
+		"""
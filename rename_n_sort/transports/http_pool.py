@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Small thread-safe pool of persistent HTTP/1.1 connections.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+import queue
+import socket
+import threading
+import http.client
+import urllib.parse
+
+# errors that mean a reused keep-alive socket was closed by the server
+_STALE_ERRORS = (
+	http.client.RemoteDisconnected,
+	http.client.BadStatusLine,
+	BrokenPipeError,
+	ConnectionResetError,
+	ConnectionAbortedError,
+)
+
+#============================================
+
+
+class HTTPConnectionPool:
+	"""
+	Pool of keep-alive connections to one host.
+
+	At most size connections exist at once; callers block until one is
+	free. Idle connections are reused most-recently-released first. A
+	connection is dropped instead of reused when the server asked to close
+	it or the caller did not read the whole response.
+	"""
+
+	#============================================
+	def __init__(
+		self,
+		base_url: str,
+		size: int = 4,
+		connect_timeout: float = 5.0,
+		read_timeout: float = 120.0,
+	) -> None:
+		"""
+		Create an empty pool.
+
+		Args:
+			base_url: Scheme, host and optional port (e.g. http://localhost:11434).
+			size: Maximum open connections.
+			connect_timeout: Seconds allowed for the TCP connect.
+			read_timeout: Seconds allowed between reads once connected.
+		"""
+		parts = urllib.parse.urlsplit(base_url)
+		if parts.scheme not in ("http", "https"):
+			raise ValueError(f"Unsupported URL scheme: {base_url}")
+		self.scheme = parts.scheme
+		self.host = parts.hostname or "localhost"
+		self.port = parts.port
+		self.size = max(1, size)
+		self.connect_timeout = connect_timeout
+		self.read_timeout = read_timeout
+		self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue()
+		self._slots = threading.BoundedSemaphore(self.size)
+		self._lock = threading.Lock()
+		self.connections_opened = 0
+
+	#============================================
+	def _new_connection(self) -> http.client.HTTPConnection:
+		if self.scheme == "https":
+			conn: http.client.HTTPConnection = http.client.HTTPSConnection(
+				self.host, self.port, timeout=self.connect_timeout
+			)
+		else:
+			conn = http.client.HTTPConnection(self.host, self.port, timeout=self.connect_timeout)
+		conn.connect()
+		# connect used connect_timeout; generation can take much longer
+		if conn.sock is not None:
+			conn.sock.settimeout(self.read_timeout)
+			conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+		with self._lock:
+			self.connections_opened += 1
+		return conn
+
+	#============================================
+	def acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+		"""
+		Take a connection, opening one if none are idle.
+
+		Returns:
+			(connection, reused) where reused is True for a kept-alive socket.
+		"""
+		self._slots.acquire()
+		try:
+			conn = self._idle.get_nowait()
+			return conn, True
+		except queue.Empty:
+			pass
+		try:
+			conn = self._new_connection()
+		except Exception:
+			self._slots.release()
+			raise
+		return conn, False
+
+	#============================================
+	def release(self, conn: http.client.HTTPConnection, reuse: bool = True) -> None:
+		"""
+		Return a connection to the pool, or close it when reuse is False.
+		"""
+		if reuse:
+			self._idle.put(conn)
+		else:
+			conn.close()
+		self._slots.release()
+
+	#============================================
+	def open_response(
+		self,
+		method: str,
+		path: str,
+		body: bytes | None = None,
+		headers: dict[str, str] | None = None,
+	) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+		"""
+		Send one request and return the connection with its unread response.
+
+		A reused connection that turns out to be closed by the server is
+		replaced once, transparently; other errors propagate. The caller
+		must pass the connection back to release(), with reuse=False unless
+		the response was read to the end.
+
+		Returns:
+			(connection, response).
+		"""
+		send_headers = {"Connection": "keep-alive"}
+		send_headers.update(headers or {})
+		while True:
+			conn, reused = self.acquire()
+			try:
+				conn.request(method, path, body=body, headers=send_headers)
+				response = conn.getresponse()
+			except _STALE_ERRORS:
+				self.release(conn, reuse=False)
+				if reused:
+					continue
+				raise
+			except BaseException:
+				self.release(conn, reuse=False)
+				raise
+			return conn, response
+
+	#============================================
+	def request(
+		self,
+		method: str,
+		path: str,
+		body: bytes | None = None,
+		headers: dict[str, str] | None = None,
+	) -> tuple[int, bytes]:
+		"""
+		Send one request and read the whole response.
+
+		Returns:
+			(status, body bytes).
+		"""
+		conn, response = self.open_response(method, path, body=body, headers=headers)
+		try:
+			data = response.read()
+		except BaseException:
+			self.release(conn, reuse=False)
+			raise
+		self.release(conn, reuse=not response.will_close)
+		return response.status, data
+
+	#============================================
+	def close(self) -> None:
+		"""
+		Close every idle connection.
+		"""
+		while True:
+			try:
+				conn = self._idle.get_nowait()
+			except queue.Empty:
+				return
+			conn.close()
@@ -8,11 +8,60 @@ from __future__ import annotations
 # Standard Library
 import json
 import random
+import asyncio
+import http.client
 import time
-import urllib.request
+import threading
+from collections import deque
+from collections.abc import Callable
+
+# local repo modules
+from ..llm_utils import _print_llm
+from .http_pool import HTTPConnectionPool
+
+# rough chars-per-token ratio used to size the history window
+_CHARS_PER_TOKEN = 4
+
+
+class OllamaHTTPError(RuntimeError):
+	"""
+	Non-success HTTP status from the Ollama server.
+	"""
+
+	def __init__(self, status: int, body: bytes) -> None:
+		detail = body.decode("utf-8", errors="replace")[:200]
+		super().__init__(f"Ollama chat error: status {status} {detail}".strip())
+		self.status = status
+
+
+def estimate_tokens(text: str) -> int:
+	"""
+	Cheap token estimate for history budgeting.
+	"""
+	return max(1, len(text) // _CHARS_PER_TOKEN)
 
 
 class OllamaTransport:
+	"""
+	Ollama /api/chat transport.
+
+	By default every call is stateless: the request carries only the system
+	message and the current prompt, so prompt size (and prefill time) stays
+	flat across a long run. Setting history_tokens > 0 keeps a sliding window
+	of the most recent prompt/reply turns that fits within that many
+	estimated tokens.
+
+	Requests go over a shared pool of keep-alive connections, so one
+	transport can serve several worker threads. Connection errors and 5xx
+	replies are retried up to max_retries times with jittered exponential
+	backoff; successful calls never sleep.
+
+	With stream=True, generate_until() streams the reply and hangs up as
+	soon as stop_when(text) holds, which makes Ollama cancel the rest of the
+	generation. Early stops and the unused part of each token budget are
+	counted in early_stops and tokens_saved.
+	"""
+
 	name = "Ollama"
 
 	def __init__(
@@ -20,35 +69,200 @@ class OllamaTransport:
 		model: str,
 		base_url: str = "http://localhost:11434",
 		system_message: str = "",
+		history_tokens: int = 0,
+		pool_size: int = 4,
+		connect_timeout: float = 5.0,
+		read_timeout: float = 120.0,
+		max_retries: int = 2,
+		backoff_seconds: float = 0.5,
+		stream: bool = True,
 	) -> None:
 		self.model = model
 		self.base_url = base_url.rstrip("/")
-		self.messages: list[dict[str, str]] = []
-		if system_message:
-			self.messages.append({"role": "system", "content": system_message})
+		self.pool = HTTPConnectionPool(
+			self.base_url,
+			size=pool_size,
+			connect_timeout=connect_timeout,
+			read_timeout=read_timeout,
+		)
+		self.max_retries = max(0, max_retries)
+		self.backoff_seconds = backoff_seconds
+		self.stream = stream
+		self.early_stops = 0
+		self.tokens_saved = 0
+		self._stats_lock = threading.Lock()
+		self.system_message = system_message
+		self.history_tokens = max(0, history_tokens)
+		self.history: deque[tuple[str, str]] = deque()
+		self._history_lock = threading.Lock()
 
-	def generate(self, prompt: str, *, purpose: str, max_tokens: int) -> str:
-		self.messages.append({"role": "user", "content": prompt})
+	def build_messages(self, prompt: str) -> list[dict[str, str]]:
+		"""
+		Build the chat messages for one call.
+
+		Args:
+			prompt: Current user prompt.
+
+		Returns:
+			System message (if any), windowed history turns, then the prompt.
+		"""
+		messages: list[dict[str, str]] = []
+		if self.system_message:
+			messages.append({"role": "system", "content": self.system_message})
+		if self.history_tokens:
+			turns: list[tuple[str, str]] = []
+			budget = self.history_tokens
+			with self._history_lock:
+				# newest turns first until the token cap is reached
+				for user_text, assistant_text in reversed(self.history):
+					cost = estimate_tokens(user_text) + estimate_tokens(assistant_text)
+					if cost > budget:
+						break
+					budget -= cost
+					turns.append((user_text, assistant_text))
+			for user_text, assistant_text in reversed(turns):
+				messages.append({"role": "user", "content": user_text})
+				messages.append({"role": "assistant", "content": assistant_text})
+		messages.append({"role": "user", "content": prompt})
+		return messages
+
+	def _remember(self, prompt: str, reply: str) -> None:
+		if not self.history_tokens:
+			return
+		with self._history_lock:
+			self.history.append((prompt, reply))
+			total = sum(
+				estimate_tokens(user_text) + estimate_tokens(assistant_text)
+				for user_text, assistant_text in self.history
+			)
+			while self.history and total > self.history_tokens:
+				user_text, assistant_text = self.history.popleft()
+				total -= estimate_tokens(user_text) + estimate_tokens(assistant_text)
+
+	def _payload(self, prompt: str, max_tokens: int, stream: bool) -> bytes:
 		payload: dict[str, object] = {
 			"model": self.model,
-			"messages": self.messages,
-			"stream": False,
+			"messages": self.build_messages(prompt),
+			"stream": stream,
 			"options": {"num_predict": max_tokens},
 		}
-		time.sleep(random.random())
-		request = urllib.request.Request(
-			f"{self.base_url}/api/chat",
-			data=json.dumps(payload).encode("utf-8"),
-			headers={"Content-Type": "application/json"},
-			method="POST",
-		)
-		with urllib.request.urlopen(request, timeout=30) as response:
-			if response.status >= 400:
-				raise RuntimeError(f"Ollama chat error: status {response.status}")
-			response_body = response.read()
+		return json.dumps(payload).encode("utf-8")
+
+	def generate(self, prompt: str, *, purpose: str, max_tokens: int) -> str:
+		body = self._payload(prompt, max_tokens, stream=False)
+		response_body = self._with_retry(lambda: self._post_chat(body))
 		parsed = json.loads(response_body.decode("utf-8"))
 		assistant_message = parsed.get("message", {}).get("content", "")
 		if not assistant_message:
 			raise RuntimeError("Ollama chat returned empty content")
-		self.messages.append({"role": "assistant", "content": assistant_message})
+		self._remember(prompt, assistant_message)
 		return assistant_message
+
+	def generate_until(
+		self,
+		prompt: str,
+		*,
+		purpose: str,
+		max_tokens: int,
+		stop_when: Callable[[str], bool],
+	) -> str:
+		"""
+		Stream a reply and stop as soon as stop_when(text) is True.
+
+		Falls back to a plain generate() call when streaming is disabled.
+		"""
+		if not self.stream:
+			return self.generate(prompt, purpose=purpose, max_tokens=max_tokens)
+		body = self._payload(prompt, max_tokens, stream=True)
+		text, generated, stopped = self._with_retry(lambda: self._stream_chat(body, stop_when))
+		if not text:
+			raise RuntimeError("Ollama chat returned empty content")
+		if stopped:
+			saved = max(0, max_tokens - generated)
+			with self._stats_lock:
+				self.early_stops += 1
+				self.tokens_saved += saved
+			_print_llm(
+				f"{self.name} stopped after {generated} tokens for {purpose}"
+				f" (up to {saved} of {max_tokens} saved)"
+			)
+		self._remember(prompt, text)
+		return text
+
+	async def agenerate(self, prompt: str, *, purpose: str, max_tokens: int) -> str:
+		"""
+		Async generate; the blocking pooled request runs in a worker thread.
+		"""
+		text = await asyncio.to_thread(
+			self.generate, prompt, purpose=purpose, max_tokens=max_tokens
+		)
+		return text
+
+	def _post_chat(self, body: bytes) -> bytes:
+		headers = {"Content-Type": "application/json"}
+		status, response_body = self.pool.request("POST", "/api/chat", body=body, headers=headers)
+		if status >= 400:
+			raise OllamaHTTPError(status, response_body)
+		return response_body
+
+	def _stream_chat(self, body: bytes, stop_when: Callable[[str], bool]) -> tuple[str, int, bool]:
+		"""
+		Read NDJSON chat chunks until done or stop_when passes.
+
+		Returns:
+			(text, tokens generated, stopped early).
+		"""
+		headers = {"Content-Type": "application/json"}
+		conn, response = self.pool.open_response("POST", "/api/chat", body=body, headers=headers)
+		reuse = False
+		try:
+			if response.status >= 400:
+				data = response.read()
+				reuse = not response.will_close
+				raise OllamaHTTPError(response.status, data)
+			text = ""
+			chunks = 0
+			while True:
+				line = response.readline()
+				if not line:
+					return text, chunks, False
+				if not line.strip():
+					continue
+				event = json.loads(line)
+				if event.get("error"):
+					raise RuntimeError(f"Ollama chat error: {event['error']}")
+				piece = event.get("message", {}).get("content", "")
+				if piece:
+					text += piece
+					chunks += 1
+				if event.get("done"):
+					response.read()
+					reuse = not response.will_close
+					generated = int(event.get("eval_count") or chunks)
+					return text, generated, False
+				if piece and stop_when(text):
+					# closing the socket makes Ollama abort the generation
+					return text, chunks, True
+		finally:
+			self.pool.release(conn, reuse=reuse)
+
+	def _with_retry(self, call: Callable):
+		attempt = 0
+		while True:
+			try:
+				return call()
+			except (OSError, http.client.HTTPException, OllamaHTTPError) as exc:
+				# 4xx means the request itself is wrong; retrying cannot help
+				client_error = isinstance(exc, OllamaHTTPError) and exc.status < 500
+				if client_error or attempt >= self.max_retries:
+					raise
+			# full jitter keeps parallel workers from retrying in lockstep
+			delay = random.uniform(0, self.backoff_seconds * (2 ** attempt))
+			time.sleep(delay)
+			attempt += 1
+
+	def close(self) -> None:
+		"""
+		Close pooled connections.
+		"""
+		self.pool.close()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark streamed DOCX head/tail extraction against a full python-docx load.
+
+Builds a large report with many paragraphs, a table and an embedded image,
+then times both paths and reports their peak Python heap use. lxml
+allocates outside the heap tracemalloc sees, so the python-docx peak is a
+lower bound. Run from the repo root with the package installed
+(pip install -e .) or with PYTHONPATH=. set.
+"""
+
+# Standard Library
+import io
+import time
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+# PIP3 modules
+import docx
+from PIL import Image
+
+# local repo modules
+from rename_n_sort.plugins.office_xml import head_tail_summary, iter_docx_paragraphs
+
+#============================================
+
+
+def parse_args() -> argparse.Namespace:
+	"""
+	Parse command-line arguments.
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark streamed DOCX extraction.")
+	parser.add_argument(
+		"-p", "--paragraphs", dest="paragraphs", type=int, default=20000,
+		help="Paragraphs in the generated document (default 20000).",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+
+
+def build_document(path: Path, paragraphs: int) -> None:
+	"""
+	Write a report-like DOCX with a table and an embedded image.
+	"""
+	document = docx.Document()
+	document.core_properties.title = "Benchmark Report"
+	image = Image.effect_noise((1600, 1200), 64).convert("RGB")
+	buffer = io.BytesIO()
+	image.save(buffer, format="PNG")
+	buffer.seek(0)
+	document.add_picture(buffer)
+	table = document.add_table(rows=50, cols=4)
+	for row in table.rows:
+		for cell in row.cells:
+			cell.text = "cell value 1234.56"
+	for idx in range(paragraphs):
+		document.add_paragraph(f"Paragraph {idx}: revenue grew in the northern region this quarter.")
+	document.save(path)
+
+
+#============================================
+
+
+def full_load(path: Path) -> str:
+	"""
+	Old path: load the document and join every paragraph.
+	"""
+	document = docx.Document(path)
+	texts = [paragraph.text.strip() for paragraph in document.paragraphs if paragraph.text]
+	full = " ".join(texts)
+	return f"{full[:256]} ... {full[-256:]}"
+
+
+#============================================
+
+
+def streamed(path: Path) -> str:
+	"""
+	New path: iterparse word/document.xml with a head buffer and tail deque.
+	"""
+	summary = head_tail_summary(iter_docx_paragraphs(path)) or ""
+	return summary
+
+
+#============================================
+
+
+def measure(label: str, func, path: Path) -> None:
+	"""
+	Print wall time and peak traced memory for one extraction.
+	"""
+	tracemalloc.start()
+	start = time.perf_counter()
+	func(path)
+	elapsed = time.perf_counter() - start
+	_current, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	print(f"{label:>10}: {elapsed:.2f} s, peak {peak / 1024 / 1024:.1f} MB")
+
+
+#============================================
+
+
+def main() -> None:
+	args = parse_args()
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		path = Path(tmp_dir) / "report.docx"
+		build_document(path, args.paragraphs)
+		size_mb = path.stat().st_size / 1024 / 1024
+		print(f"document: {args.paragraphs} paragraphs, {size_mb:.1f} MB on disk")
+		measure("python-docx", full_load, path)
+		measure("streamed", streamed, path)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark CLI startup import time against a budget.
+
+Runs `python -X importtime -c "import rename_n_sort.cli"` in fresh
+interpreters, reports the median cumulative import time, the slowest
+modules, and any parser libraries that were imported eagerly. Exits with
+status 1 when the median is over the budget or a parser library loads at
+startup. Run from the repo root with the package installed
+(pip install -e .) or with PYTHONPATH=. set.
+"""
+
+# Standard Library
+import sys
+import argparse
+import statistics
+import subprocess
+
+TARGET_MODULE = "rename_n_sort.cli"
+DEFAULT_BUDGET_MS = 200.0
+
+# plugin dependencies that must stay out of startup
+HEAVY_MODULES = (
+	"pypdf",
+	"pdf2image",
+	"PIL",
+	"pillow_heif",
+	"pytesseract",
+	"bs4",
+	"openpyxl",
+	"xlrd",
+	"odf",
+	"docx",
+	"pptx",
+)
+
+#============================================
+
+
+def parse_args() -> argparse.Namespace:
+	"""
+	Parse command-line arguments.
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark CLI import time.")
+	parser.add_argument(
+		"-n", "--runs", dest="runs", type=int, default=5,
+		help="Fresh interpreter runs (default 5).",
+	)
+	parser.add_argument(
+		"-b", "--budget-ms", dest="budget_ms", type=float, default=DEFAULT_BUDGET_MS,
+		help=f"Startup budget in milliseconds (default {DEFAULT_BUDGET_MS:.0f}).",
+	)
+	parser.add_argument(
+		"-t", "--top", dest="top", type=int, default=10,
+		help="Slowest modules to list (default 10).",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+
+
+def run_once() -> dict[str, int]:
+	"""
+	Import the CLI in a fresh interpreter.
+
+	Returns:
+		Module name -> cumulative import microseconds.
+	"""
+	result = subprocess.run(
+		[sys.executable, "-X", "importtime", "-c", f"import {TARGET_MODULE}"],
+		capture_output=True,
+		text=True,
+		check=True,
+	)
+	timings: dict[str, int] = {}
+	for line in result.stderr.splitlines():
+		if not line.startswith("import time:") or "cumulative" in line:
+			continue
+		_self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+		timings[name.strip()] = int(cumulative_us)
+	return timings
+
+
+#============================================
+
+
+def main() -> None:
+	args = parse_args()
+	runs = [run_once() for _ in range(max(1, args.runs))]
+	totals_ms = [timings[TARGET_MODULE] / 1000 for timings in runs]
+	median_ms = statistics.median(totals_ms)
+	last = runs[-1]
+	print(f"{TARGET_MODULE}: median {median_ms:.1f} ms over {len(runs)} runs (budget {args.budget_ms:.0f} ms)")
+	slowest = sorted(
+		(item for item in last.items() if item[0] != TARGET_MODULE and "." not in item[0]),
+		key=lambda item: item[1],
+		reverse=True,
+	)
+	for name, cumulative_us in slowest[: args.top]:
+		print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+	eager = [name for name in HEAVY_MODULES if name in last]
+	if eager:
+		print(f"parser libraries imported at startup: {', '.join(eager)}")
+	over_budget = median_ms > args.budget_ms
+	print("OVER BUDGET" if over_budget else "within budget")
+	if over_budget or eager:
+		sys.exit(1)
+
+
+if __name__ == "__main__":
+	main()
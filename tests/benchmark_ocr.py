@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark the OCR backends, serially and through the shared OCR pool.
+
+OCRs the generated images under tests/test_files (regenerated into a temp
+folder when missing), repeated to make a workload. Each available backend
+(pytesseract: temp file + tesseract process per image; tesserocr: one
+in-process API handle) is timed one image at a time, then through
+OcrService with one process per core. pytesseract needs the tesseract
+binary, tesserocr needs the tesserocr module. Run from the repo root with
+the package installed (pip install -e .) or with PYTHONPATH=. set.
+"""
+
+# Standard Library
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+# PIP3 modules
+from PIL import Image
+
+# local repo modules
+from rename_n_sort.ocr_backends import PytesseractBackend, TesserocrBackend
+from rename_n_sort.ocr_service import OcrService, available_cores
+from tests.generate_test_images import generate_images
+
+TEST_FILES = Path("tests/test_files")
+
+#============================================
+
+
+def parse_args() -> argparse.Namespace:
+	"""
+	Parse command-line arguments.
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark serial OCR against the OCR pool.")
+	parser.add_argument(
+		"-r", "--repeat", dest="repeat", type=int, default=8,
+		help="Times each generated image is OCRed (default 8).",
+	)
+	parser.add_argument(
+		"-w", "--workers", dest="workers", type=int, default=0,
+		help="Pool processes (default 0: one per available core).",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+
+
+def load_images(folder: Path, repeat: int) -> list[Image.Image]:
+	"""
+	Decode the generated sample images and repeat them into a workload.
+	"""
+	images: list[Image.Image] = []
+	for path in sorted(folder.glob("sample_*")):
+		with Image.open(path) as image:
+			images.append(image.convert("RGB"))
+	return images * repeat
+
+
+#============================================
+
+
+def time_serial(backend: PytesseractBackend | TesserocrBackend, images: list[Image.Image]) -> float:
+	"""
+	OCR one image at a time on this thread.
+	"""
+	# the first call pays the tesserocr handle setup
+	backend(images[0], 60.0)
+	start = time.perf_counter()
+	for image in images:
+		backend(image, 60.0)
+	elapsed = time.perf_counter() - start
+	return elapsed
+
+
+#============================================
+
+
+def time_pool(backend_name: str, images: list[Image.Image], workers: int) -> tuple[float, dict]:
+	"""
+	Submit every image to the OCR pool and wait for all futures.
+	"""
+	service = OcrService(backend=backend_name, workers=workers)
+	# start the workers before timing
+	service.ocr(images[0])
+	start = time.perf_counter()
+	futures = [service.submit(image) for image in images]
+	for future in futures:
+		future.result()
+	elapsed = time.perf_counter() - start
+	stats = service.stats()
+	service.close()
+	return (elapsed, stats)
+
+
+#============================================
+
+
+def main() -> None:
+	args = parse_args()
+	backends = [
+		backend() for backend in (PytesseractBackend, TesserocrBackend) if backend.available()
+	]
+	if not backends:
+		print("neither tesseract (pytesseract) nor tesserocr found; nothing to benchmark")
+		return
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		folder = TEST_FILES
+		if not any(folder.glob("sample_*")):
+			folder = Path(tmp_dir)
+			generate_images(folder)
+		images = load_images(folder, args.repeat)
+	workers = args.workers or available_cores()
+	print(f"{len(images)} images, {workers} worker process(es)")
+	baseline = None
+	for backend in backends:
+		serial = time_serial(backend, images)
+		pooled, stats = time_pool(backend.name, images, workers)
+		if baseline is None:
+			baseline = serial
+		label = f"{backend.name} serial"
+		print(f"{label:>20}: {serial:.2f} s ({len(images) / serial:.1f} images/s)")
+		label = f"{backend.name} pool"
+		print(
+			f"{label:>20}: {pooled:.2f} s ({len(images) / pooled:.1f} images/s,"
+			f" max queue {stats['max_queue_depth']})"
+		)
+		speedup = baseline / pooled if pooled else float("inf")
+		print(f"{'':>20}  {speedup:.2f}x over serial {backends[0].name}")
+
+
+if __name__ == "__main__":
+	main()
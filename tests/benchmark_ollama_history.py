@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark OllamaTransport per-call latency across a long run.
+
+Starts a local stand-in for the Ollama /api/chat endpoint whose response
+time grows with the number of prompt characters it receives, like model
+prefill. Runs the same prompt sequence with the old unbounded history and
+with the stateless default, and prints per-call latency at points through
+the run. Run from the repo root with the package installed
+(pip install -e .) or with PYTHONPATH=. set.
+"""
+
+# Standard Library
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# local repo modules
+from rename_n_sort.transports.ollama import OllamaTransport
+
+#============================================
+
+
+def parse_args() -> argparse.Namespace:
+	"""
+	Parse command-line arguments.
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark Ollama history modes.")
+	parser.add_argument(
+		"-n", "--calls", dest="calls", type=int, default=150,
+		help="Calls per mode (default 150).",
+	)
+	parser.add_argument(
+		"-c", "--prompt-chars", dest="prompt_chars", type=int, default=1500,
+		help="Characters per prompt (default 1500).",
+	)
+	parser.add_argument(
+		"-u", "--us-per-char", dest="us_per_char", type=float, default=0.5,
+		help="Simulated prefill microseconds per prompt character (default 0.5).",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+
+
+def make_handler(us_per_char: float) -> type:
+	"""
+	Build a request handler that sleeps in proportion to prompt size.
+	"""
+
+	class Handler(BaseHTTPRequestHandler):
+		protocol_version = "HTTP/1.1"
+		disable_nagle_algorithm = True
+
+		def do_POST(self) -> None:
+			length = int(self.headers.get("Content-Length", "0"))
+			payload = json.loads(self.rfile.read(length).decode("utf-8"))
+			chars = sum(len(message["content"]) for message in payload["messages"])
+			time.sleep(chars * us_per_char / 1_000_000)
+			body = json.dumps({"message": {"content": "<new_name>Report</new_name>"}})
+			encoded = body.encode("utf-8")
+			self.send_response(200)
+			self.send_header("Content-Type", "application/json")
+			self.send_header("Content-Length", str(len(encoded)))
+			self.end_headers()
+			self.wfile.write(encoded)
+
+		def log_message(self, format: str, *args) -> None:
+			return
+
+	return Handler
+
+
+#============================================
+
+
+def run_mode(label: str, transport: OllamaTransport, calls: int, prompt_chars: int) -> list[float]:
+	"""
+	Time every call of one run and print latency checkpoints.
+	"""
+	latencies: list[float] = []
+	for idx in range(calls):
+		prompt = f"file {idx} " + "x" * prompt_chars
+		start = time.perf_counter()
+		transport.generate(prompt, purpose="benchmark", max_tokens=32)
+		latencies.append(time.perf_counter() - start)
+	checkpoints = sorted({0, calls // 4, calls // 2, (3 * calls) // 4, calls - 1})
+	marks = "  ".join(f"#{idx + 1}={latencies[idx] * 1000:.1f}ms" for idx in checkpoints)
+	print(f"{label:>10}: total {sum(latencies):.2f} s  {marks}")
+	return latencies
+
+
+#============================================
+
+
+def main() -> None:
+	args = parse_args()
+	server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.us_per_char))
+	thread = threading.Thread(target=server.serve_forever, daemon=True)
+	thread.start()
+	base_url = f"http://127.0.0.1:{server.server_address[1]}"
+	try:
+		unbounded = OllamaTransport(model="bench", base_url=base_url, history_tokens=10**9)
+		legacy = run_mode("unbounded", unbounded, args.calls, args.prompt_chars)
+		stateless = OllamaTransport(model="bench", base_url=base_url)
+		current = run_mode("stateless", stateless, args.calls, args.prompt_chars)
+	finally:
+		server.shutdown()
+	ratio_legacy = legacy[-1] / legacy[0]
+	ratio_current = current[-1] / current[0]
+	print(f"last/first call latency: unbounded {ratio_legacy:.1f}x, stateless {ratio_current:.1f}x")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Benchmark the in-memory PDF page pipeline against the old PNG round trip.
+
+Always times the PNG encode/decode cycle the old pipeline paid per page on
+synthetic 200 dpi letter-size pages, and the embedded-scan fast path on a
+300 dpi JPEG scan. When poppler (pdftoppm) is installed the same pages are
+also rendered through convert_from_path for comparison, and with tesseract
+the full render + OCR path is timed both ways. Captioning is left out so the numbers show
+only the rendering and I/O difference. Run from the repo root with the
+package installed (pip install -e .) or with PYTHONPATH=. set.
+"""
+
+# Standard Library
+import io
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+# PIP3 modules
+from PIL import Image, ImageDraw
+from pypdf import PdfReader
+from pdf2image import convert_from_path
+
+# local repo modules
+from rename_n_sort.plugins.image_plugin import ImagePlugin
+from rename_n_sort.plugins.pdf_images import embedded_page_image
+
+PAGE_SIZE_200DPI = (1700, 2200)
+PAGE_SIZE_300DPI = (2550, 3300)
+
+#============================================
+
+
+def parse_args() -> argparse.Namespace:
+	"""
+	Parse command-line arguments.
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark PDF page rendering for OCR.")
+	parser.add_argument(
+		"-p", "--pages", dest="pages", type=int, default=6,
+		help="Pages in the synthetic scanned PDF (default 6).",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+
+
+def make_page(page_idx: int, size: tuple[int, int] = PAGE_SIZE_200DPI) -> Image.Image:
+	"""
+	Draw a text-bearing page that looks like a scan.
+	"""
+	image = Image.new("RGB", size, "white")
+	draw = ImageDraw.Draw(image)
+	step = size[1] // 46
+	for line_idx in range(40):
+		text = f"Page {page_idx} line {line_idx} invoice total 1234.56 account 0042"
+		draw.text((120, 120 + line_idx * step), text, fill="black")
+	return image
+
+
+#============================================
+
+
+def time_png_round_trip(pages: list[Image.Image]) -> float:
+	"""
+	Time the save-to-PNG and re-open cycle the old pipeline did per page.
+	"""
+	start = time.perf_counter()
+	for image in pages:
+		buffer = io.BytesIO()
+		image.save(buffer, format="PNG")
+		buffer.seek(0)
+		with Image.open(buffer) as reopened:
+			reopened.load()
+	elapsed = time.perf_counter() - start
+	return elapsed
+
+
+#============================================
+
+
+def time_embedded(pdf_path: Path) -> float:
+	"""
+	Time pulling every page's embedded scan at 200 dpi.
+	"""
+	start = time.perf_counter()
+	with pdf_path.open("rb") as handle:
+		for page in PdfReader(handle).pages:
+			embedded_page_image(page, dpi=200)
+	elapsed = time.perf_counter() - start
+	return elapsed
+
+
+#============================================
+
+
+def time_poppler(pdf_path: Path, page_count: int) -> float:
+	"""
+	Time rendering every page through poppler at 200 dpi, one at a time.
+	"""
+	start = time.perf_counter()
+	for page_idx in range(1, page_count + 1):
+		convert_from_path(str(pdf_path), first_page=page_idx, last_page=page_idx, dpi=200)
+	elapsed = time.perf_counter() - start
+	return elapsed
+
+
+#============================================
+
+
+def legacy_render_ocr(pdf_path: Path, page_count: int, plugin: ImagePlugin) -> float:
+	"""
+	Old path: render all pages, write PNGs, OCR each PNG from disk.
+	"""
+	start = time.perf_counter()
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		images = convert_from_path(str(pdf_path), first_page=1, last_page=page_count, dpi=200)
+		for page_idx, image in enumerate(images, start=1):
+			out_path = Path(tmp_dir) / f"page{page_idx}.png"
+			image.save(out_path)
+			plugin._extract_ocr_text(out_path)
+	elapsed = time.perf_counter() - start
+	return elapsed
+
+
+#============================================
+
+
+def in_memory_render_ocr(pdf_path: Path, page_count: int, plugin: ImagePlugin) -> float:
+	"""
+	New path: render one page at a time and OCR the PIL image directly.
+	"""
+	start = time.perf_counter()
+	for page_idx in range(1, page_count + 1):
+		rendered = convert_from_path(
+			str(pdf_path), first_page=page_idx, last_page=page_idx, dpi=200
+		)
+		plugin._ocr_image(rendered[0])
+	elapsed = time.perf_counter() - start
+	return elapsed
+
+
+#============================================
+
+
+def main() -> None:
+	args = parse_args()
+	pages = [make_page(idx) for idx in range(1, args.pages + 1)]
+	round_trip = time_png_round_trip(pages)
+	per_page_ms = round_trip * 1000 / len(pages)
+	print(f"png round trip: {len(pages)} pages in {round_trip * 1000:.1f} ms ({per_page_ms:.1f} ms/page)")
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		scan_path = Path(tmp_dir) / "scan300.pdf"
+		scans = [make_page(idx, PAGE_SIZE_300DPI) for idx in range(1, args.pages + 1)]
+		scans[0].save(scan_path, save_all=True, append_images=scans[1:], resolution=300)
+		embedded = time_embedded(scan_path)
+		print(f"{'embedded':>10}: {embedded:.2f} s for {len(scans)} pages (JPEG draft decode)")
+		if shutil.which("pdftoppm"):
+			poppler = time_poppler(scan_path, len(scans))
+			print(f"{'poppler':>10}: {poppler:.2f} s for {len(scans)} pages (200 dpi render)")
+	if not shutil.which("pdftoppm") or not shutil.which("tesseract"):
+		print("pdftoppm or tesseract not found; skipping full render + OCR comparison")
+		return
+	plugin = ImagePlugin()
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		pdf_path = Path(tmp_dir) / "scanned.pdf"
+		pages[0].save(pdf_path, save_all=True, append_images=pages[1:], resolution=200)
+		legacy = legacy_render_ocr(pdf_path, len(pages), plugin)
+		current = in_memory_render_ocr(pdf_path, len(pages), plugin)
+	print(f"{'before':>10}: {legacy:.2f} s (render all, PNG to disk, OCR from disk)")
+	print(f"{'after':>10}: {current:.2f} s (render per page, OCR in memory)")
+	speedup = legacy / current if current else float("inf")
+	print(f"speedup: {speedup:.2f}x over {len(pages)} pages")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark the depth-pruned scanner against the old rglob scan.
+
+Builds a synthetic deep tree in a temporary directory and times both
+approaches at a shallow max depth. Run from the repo root with the package
+installed (pip install -e .) or with PYTHONPATH=. set.
+"""
+
+# Standard Library
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+# local repo modules
+from rename_n_sort.config import AppConfig
+from rename_n_sort.scanner import iter_files
+
+#============================================
+
+
+def parse_args() -> argparse.Namespace:
+	"""
+	Parse command-line arguments.
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark scanner.iter_files on a synthetic tree.")
+	parser.add_argument(
+		"-d", "--depth", dest="depth", type=int, default=6,
+		help="Depth of the synthetic tree (default 6).",
+	)
+	parser.add_argument(
+		"-w", "--width", dest="width", type=int, default=4,
+		help="Subdirectories per directory (default 4).",
+	)
+	parser.add_argument(
+		"-f", "--files", dest="files_per_dir", type=int, default=10,
+		help="Files per directory (default 10).",
+	)
+	parser.add_argument(
+		"-m", "--max-depth", dest="max_depth", type=int, default=1,
+		help="Scanner max depth to benchmark (default 1).",
+	)
+	args = parser.parse_args()
+	return args
+
+
+#============================================
+
+
+def build_tree(root: Path, depth: int, width: int, files_per_dir: int) -> int:
+	"""
+	Create a synthetic directory tree.
+
+	Returns:
+		Number of files created.
+	"""
+	created = 0
+	level: list[Path] = [root]
+	for _level_idx in range(depth + 1):
+		next_level: list[Path] = []
+		for directory in level:
+			for file_idx in range(files_per_dir):
+				(directory / f"file_{file_idx}.txt").write_bytes(b"x")
+				created += 1
+			for dir_idx in range(width):
+				sub = directory / f"dir_{dir_idx}"
+				sub.mkdir()
+				next_level.append(sub)
+		level = next_level
+	return created
+
+
+#============================================
+
+
+def legacy_iter_files(config: AppConfig) -> list[Path]:
+	"""
+	Previous rglob-based scanner kept for comparison.
+	"""
+	paths: list[Path] = []
+	for root in config.normalized_roots():
+		for path in root.rglob("*"):
+			if not path.is_file():
+				continue
+			rel = path.relative_to(root)
+			depth = max(len(rel.parts) - 1, 0)
+			if depth > config.max_depth:
+				continue
+			if config.exclude_hidden and path.name.startswith("."):
+				continue
+			paths.append(path)
+	return paths
+
+
+#============================================
+
+
+def time_call(label: str, func, config: AppConfig) -> float:
+	"""
+	Time one full scan and print the result.
+	"""
+	start = time.perf_counter()
+	found = len(list(func(config)))
+	elapsed = time.perf_counter() - start
+	print(f"{label:>10}: {found} files in {elapsed * 1000:.1f} ms")
+	return elapsed
+
+
+#============================================
+
+
+def main() -> None:
+	args = parse_args()
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		root = Path(tmp_dir)
+		total = build_tree(root, args.depth, args.width, args.files_per_dir)
+		print(f"tree: depth={args.depth} width={args.width} files={total}")
+		config = AppConfig(roots=[root], max_depth=args.max_depth)
+		legacy = time_call("rglob", legacy_iter_files, config)
+		current = time_call("scandir", iter_files, config)
+		speedup = legacy / current if current else float("inf")
+		print(f"speedup: {speedup:.1f}x at max_depth={args.max_depth}")
+
+
+if __name__ == "__main__":
+	main()
@@ -2,6 +2,8 @@ import os
 
 import pytest
 
+from rename_n_sort.llm_parsers import KeepResult, RenameResult, SortResult
+
 
 REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 SKIP_ENV = "SKIP_REPO_HYGIENE"
@@ -45,3 +47,31 @@ def ascii_fix_enabled(request) -> bool:
 	Check whether ASCII compliance auto-fix is enabled.
 	"""
 	return not request.config.getoption("--no-ascii-fix")
+
+
+#============================================
+class StubLLM:
+	"""
+	Deterministic stand-in for LLMEngine used by organizer tests.
+	"""
+
+	def __init__(self, category: str = "Document") -> None:
+		self.category = category
+		self.calls: list[str] = []
+
+	def rename(self, current_name: str, metadata: dict) -> RenameResult:
+		self.calls.append(f"rename:{current_name}")
+		new_name = f"Renamed_{os.path.splitext(current_name)[0]}"
+		return RenameResult(new_name=new_name, reason="stub rename", raw_text="")
+
+	def stem_action(
+		self, original_stem: str, suggested_name: str, extension: str | None = None
+	) -> KeepResult:
+		self.calls.append(f"stem_action:{original_stem}")
+		return KeepResult(stem_action="drop", reason="stub stem", raw_text="")
+
+	def sort(self, files: list) -> SortResult:
+		self.calls.append(f"sort:{len(files)}")
+		assignments = {item.path: self.category for item in files}
+		reasons = {item.path: "stub sort" for item in files}
+		return SortResult(assignments=assignments, reasons=reasons, raw_text="")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared captioner service.
+"""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from rename_n_sort import captioner as captioner_module
+from rename_n_sort.captioner import CaptionerService, get_captioner, set_captioner
+from rename_n_sort.plugins.image_plugin import ImagePlugin
+
+
+class CountingLoader:
+	def __init__(self, error: Exception | None = None) -> None:
+		self.calls = 0
+		self.error = error
+
+	def __call__(self) -> dict:
+		self.calls += 1
+		if self.error:
+			raise self.error
+		return {"model": "fake"}
+
+
+def _fake_caption(image, components: dict) -> str:
+	return f"caption of {Path(str(image)).name}"
+
+
+@pytest.fixture
+def fake_captioner():
+	loader = CountingLoader()
+	service = CaptionerService(load_components=loader, run_caption=_fake_caption)
+	previous = set_captioner(service)
+	yield service, loader
+	set_captioner(previous)
+
+
+def test_model_loads_once_across_threads(fake_captioner) -> None:
+	service, loader = fake_captioner
+	threads = [
+		threading.Thread(target=service.caption, args=(Path(f"/tmp/img{idx}.png"),))
+		for idx in range(8)
+	]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	assert loader.calls == 1
+	stats = service.stats()
+	assert stats["captions"] == 8
+	assert stats["load_seconds"] is not None
+
+
+def test_plugins_share_process_captioner(fake_captioner) -> None:
+	service, loader = fake_captioner
+	first = ImagePlugin()._try_caption(Path("/tmp/a.png"))
+	second = ImagePlugin()._try_caption(Path("/tmp/b.png"))
+	assert first == "caption of a.png"
+	assert second == "caption of b.png"
+	assert get_captioner() is service
+	assert loader.calls == 1
+
+
+def test_failed_load_is_not_retried() -> None:
+	loader = CountingLoader(error=ValueError("no accelerator"))
+	service = CaptionerService(load_components=loader, run_caption=_fake_caption)
+	for _ in range(3):
+		with pytest.raises(RuntimeError, match="Failed to initialize Moondream2"):
+			service.caption(Path("/tmp/a.png"))
+	assert loader.calls == 1
+	assert not service.loaded
+
+
+def test_default_service_is_created_lazily() -> None:
+	previous = set_captioner(None)
+	try:
+		service = get_captioner()
+		assert not service.loaded
+		assert captioner_module._SHARED is service
+	finally:
+		set_captioner(previous)
+
+
+def test_caption_errors_propagate() -> None:
+	def broken(image, components: dict) -> str:
+		raise ValueError("device lost")
+
+	service = CaptionerService(load_components=CountingLoader(), run_caption=broken)
+	with pytest.raises(ValueError, match="device lost"):
+		service.caption(Path("/tmp/a.png"))
+	assert service.stats()["captions"] == 0
@@ -3,6 +3,7 @@
 
 from rename_n_sort.organizer import Organizer
 from rename_n_sort.config import AppConfig
+from rename_n_sort.llm_parsers import KeepResult
 from conftest import StubLLM
 
 
@@ -10,3 +11,17 @@ def test_keep_original_combines_original_stem():
 	org = Organizer(AppConfig(roots=[]), llm=StubLLM())
 	final = org._normalize_new_name("orig.txt", "orig_NewName.txt")
 	assert "orig" in final.lower()
+
+
+class _SilentKeepLLM(StubLLM):
+	def stem_action(self, original_stem, suggested_name, extension=None):
+		return KeepResult(stem_action="keep", reason="", raw_text="")
+
+
+def test_stem_reason_tagged_only_when_present(tmp_path):
+	path = tmp_path / "notes.txt"
+	path.write_text("hello", encoding="utf-8")
+	plan, _ = Organizer(AppConfig(roots=[]), llm=_SilentKeepLLM())._plan_one(path)
+	assert plan.stem_reason == ""
+	plan, _ = Organizer(AppConfig(roots=[]), llm=StubLLM())._plan_one(path)
+	assert plan.stem_reason == "[llm] stub stem"
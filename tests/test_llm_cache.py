@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the LLM response cache.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from rename_n_sort.llm_cache import LLMResponseCache
+from rename_n_sort.llm_engine import LLMEngine
+from rename_n_sort.llm_parsers import ParseError
+
+
+class DummyTransport:
+	name = "Dummy"
+	model = "dummy-model"
+
+	def __init__(self, responses=None):
+		self.responses = list(responses or [])
+		self.calls: list[tuple[str, str]] = []
+
+	def generate(self, prompt: str, *, purpose: str, max_tokens: int) -> str:
+		self.calls.append((purpose, prompt))
+		if not self.responses:
+			raise RuntimeError("No response queued")
+		return self.responses.pop(0)
+
+
+def test_identical_prompt_is_served_from_cache(tmp_path: Path):
+	cache = LLMResponseCache(tmp_path / "llm.sqlite3")
+	transport = DummyTransport(responses=["<new_name>Good.pdf</new_name><reason>title</reason>"])
+	engine = LLMEngine(transports=[transport], response_cache=cache)
+	first = engine.rename("old.pdf", {"extension": "pdf"})
+	second = engine.rename("old.pdf", {"extension": "pdf"})
+	assert first.new_name == second.new_name == "Good.pdf"
+	assert len(transport.calls) == 1
+	assert cache.hits == 1
+
+
+def test_format_fixed_reply_is_cached_not_the_malformed_one(tmp_path: Path):
+	cache = LLMResponseCache(tmp_path / "llm.sqlite3")
+	transport = DummyTransport(
+		responses=["not xml", "<new_name>Fixed.pdf</new_name><reason>ok</reason>"]
+	)
+	engine = LLMEngine(transports=[transport], response_cache=cache)
+	engine.rename("old.pdf", {"extension": "pdf"})
+	result = engine.rename("old.pdf", {"extension": "pdf"})
+	assert result.new_name == "Fixed.pdf"
+	assert len(transport.calls) == 2
+
+
+def test_parse_failures_are_never_cached(tmp_path: Path):
+	cache = LLMResponseCache(tmp_path / "llm.sqlite3")
+	transport = DummyTransport(responses=["not xml", "still bad"])
+	engine = LLMEngine(transports=[transport], response_cache=cache)
+	with pytest.raises(ParseError):
+		engine.rename("old.pdf", {"extension": "pdf"})
+	assert cache.entry_count() == 0
+
+
+def test_expired_entries_miss(tmp_path: Path):
+	cache = LLMResponseCache(tmp_path / "llm.sqlite3", ttl_seconds=-1)
+	cache.put("Dummy", "m", "prompt", 10, "<category>Document</category>")
+	assert cache.get("Dummy", "m", "prompt", 10) is None
+	assert cache.entry_count() == 0
+
+
+def test_key_includes_model_and_max_tokens(tmp_path: Path):
+	cache = LLMResponseCache(tmp_path / "llm.sqlite3")
+	cache.put("Dummy", "m1", "prompt", 10, "reply")
+	assert cache.get("Dummy", "m1", "prompt", 10) == "reply"
+	assert cache.get("Dummy", "m2", "prompt", 10) is None
+	assert cache.get("Dummy", "m1", "prompt", 20) is None
+	assert cache.get("Other", "m1", "prompt", 10) is None
+
+
+def test_size_budget_evicts_oldest(tmp_path: Path):
+	cache = LLMResponseCache(tmp_path / "llm.sqlite3", max_bytes=250)
+	for idx in range(3):
+		cache.put("Dummy", "m", f"prompt {idx}", 10, "x" * 100)
+	assert cache.entry_count() == 2
+	assert cache.get("Dummy", "m", "prompt 0", 10) is None
@@ -4,6 +4,7 @@ Tests for LLMEngine retry and fallback behavior.
 """
 
 from rename_n_sort.llm_engine import LLMEngine
+from rename_n_sort.llm_prompts import SortItem
 
 
 class GuardrailViolationError(Exception):
@@ -142,3 +143,74 @@ def test_keep_original_requires_reason():
 	assert result.stem_action == "keep"
 	assert "meaningful" in result.reason
 	assert transport.calls[0][1] != transport.calls[1][1]
+
+
+def _sort_items(count: int) -> list:
+	items = []
+	for idx in range(count):
+		items.append(SortItem(path=f"/tmp/f{idx}.pdf", name=f"f{idx}", ext="pdf", description=""))
+	return items
+
+
+def test_sort_batches_files_into_one_prompt():
+	transport = DummyTransport(
+		responses=[
+			'<file id="F1"><category>Document</category></file>'
+			'<file id="F2"><category>Image</category></file>'
+			'<file id="F3"><category>Code</category></file>'
+		]
+	)
+	engine = LLMEngine(transports=[transport])
+	result = engine.sort(_sort_items(3))
+	assert len(transport.calls) == 1
+	assert "id=F3" in transport.calls[0][1]
+	assert result.assignments["/tmp/f2.pdf"] == "Code"
+
+
+def test_sort_reasks_only_missing_or_invalid_ids():
+	transport = DummyTransport(
+		responses=[
+			'<file id="F1"><category>Document</category></file>'
+			'<file id="F2"><category>Bogus</category></file>',
+			"<category>Image</category><reason>photo</reason>",
+			"<category>Video</category>",
+		]
+	)
+	engine = LLMEngine(transports=[transport])
+	result = engine.sort(_sort_items(3))
+	assert len(transport.calls) == 3
+	assert "f1" in transport.calls[1][1]
+	assert "f2" in transport.calls[2][1]
+	assert result.assignments == {
+		"/tmp/f0.pdf": "Document",
+		"/tmp/f1.pdf": "Image",
+		"/tmp/f2.pdf": "Video",
+	}
+
+
+def test_sort_batch_parse_failure_falls_back_per_item():
+	transport = DummyTransport(
+		responses=["no tags", "<category>Data</category>", "<category>Other</category>"]
+	)
+	engine = LLMEngine(transports=[transport])
+	result = engine.sort(_sort_items(2))
+	assert len(transport.calls) == 3
+	assert result.assignments["/tmp/f0.pdf"] == "Data"
+
+
+class BatchRejectingTransport(DummyTransport):
+	def generate(self, prompt: str, *, purpose: str, max_tokens: int) -> str:
+		if "files)" in purpose:
+			self.calls.append((purpose, prompt))
+			raise ContextWindowExceededError("Exceeded model context window size")
+		return super().generate(prompt, purpose=purpose, max_tokens=max_tokens)
+
+
+def test_sort_batch_transport_error_falls_back_per_item():
+	transport = BatchRejectingTransport(
+		responses=["<category>Data</category>", "<category>Other</category>"]
+	)
+	engine = LLMEngine(transports=[transport])
+	result = engine.sort(_sort_items(2))
+	assert len(transport.calls) == 3
+	assert result.assignments == {"/tmp/f0.pdf": "Data", "/tmp/f1.pdf": "Other"}
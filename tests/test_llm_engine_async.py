@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Tests for AsyncLLMEngine concurrency, fallback and format fixes.
+"""
+
+import asyncio
+
+from rename_n_sort.llm_engine import AsyncLLMEngine, LLMEngine
+from rename_n_sort.llm_prompts import SortItem
+
+RENAME_REPLY = "<new_name>Quarterly_Report</new_name><reason>report text</reason>"
+
+
+class GuardrailViolationError(Exception):
+	pass
+
+
+class AsyncDummyTransport:
+	name = "AsyncDummy"
+
+	def __init__(self, responses=None, error: Exception | None = None, delay: float = 0.0):
+		self.responses = list(responses or [])
+		self.error = error
+		self.delay = delay
+		self.calls: list[tuple[str, str]] = []
+		self.in_flight = 0
+		self.max_in_flight = 0
+
+	def generate(self, prompt: str, *, purpose: str, max_tokens: int) -> str:
+		raise AssertionError("async engine should call agenerate")
+
+	async def agenerate(self, prompt: str, *, purpose: str, max_tokens: int) -> str:
+		self.calls.append((purpose, prompt))
+		self.in_flight += 1
+		self.max_in_flight = max(self.max_in_flight, self.in_flight)
+		try:
+			await asyncio.sleep(self.delay)
+			if self.error:
+				raise self.error
+			if not self.responses:
+				return RENAME_REPLY
+			return self.responses.pop(0)
+		finally:
+			self.in_flight -= 1
+
+
+class SyncDummyTransport:
+	name = "SyncDummy"
+
+	def __init__(self, responses: list[str]):
+		self.responses = list(responses)
+
+	def generate(self, prompt: str, *, purpose: str, max_tokens: int) -> str:
+		return self.responses.pop(0)
+
+
+def test_concurrent_renames_respect_semaphore() -> None:
+	transport = AsyncDummyTransport(delay=0.01)
+	engine = AsyncLLMEngine(transports=[transport], max_concurrency=3)
+
+	async def run_all() -> list:
+		tasks = [engine.rename(f"scan_{idx}.pdf", {"extension": "pdf"}) for idx in range(10)]
+		return await asyncio.gather(*tasks)
+
+	results = asyncio.run(run_all())
+	assert [result.new_name for result in results] == ["Quarterly_Report"] * 10
+	assert transport.max_in_flight == 3
+
+
+def test_async_fallback_on_guardrail() -> None:
+	first = AsyncDummyTransport(error=GuardrailViolationError("guardrail"))
+	second = AsyncDummyTransport(responses=[RENAME_REPLY])
+	engine = AsyncLLMEngine(transports=[first, second])
+	result = asyncio.run(engine.rename("old.pdf", {"extension": "pdf"}))
+	assert result.new_name == "Quarterly_Report"
+	assert len(second.calls) == 1
+
+
+def test_async_format_fix_retry() -> None:
+	transport = AsyncDummyTransport(responses=["not tags", RENAME_REPLY])
+	engine = AsyncLLMEngine(transports=[transport])
+	result = asyncio.run(engine.rename("old.pdf", {"extension": "pdf"}))
+	assert result.new_name == "Quarterly_Report"
+	assert transport.calls[1][0].endswith("(format fix)")
+
+
+def test_async_engine_runs_sync_transport_in_thread() -> None:
+	transport = SyncDummyTransport([RENAME_REPLY])
+	engine = AsyncLLMEngine(transports=[transport])
+	result = asyncio.run(engine.rename("old.pdf", {"extension": "pdf"}))
+	assert result.new_name == "Quarterly_Report"
+
+
+def test_async_sort_batches_in_parallel() -> None:
+	replies = [
+		'<file id="F1"><category>Document</category></file>'
+		'<file id="F2"><category>Image</category></file>',
+	]
+	transport = AsyncDummyTransport(responses=replies)
+	engine = AsyncLLMEngine(transports=[transport])
+	items = [
+		SortItem(path=f"/tmp/f{idx}.pdf", name=f"f{idx}", ext="pdf", description="")
+		for idx in range(2)
+	]
+	result = asyncio.run(engine.sort(items))
+	assert result.assignments == {"/tmp/f0.pdf": "Document", "/tmp/f1.pdf": "Image"}
+
+
+def test_sync_wrapper_shares_async_core() -> None:
+	transport = SyncDummyTransport(["not tags", RENAME_REPLY])
+	engine = LLMEngine(transports=[transport])
+	assert engine.rename("old.pdf", {"extension": "pdf"}).new_name == "Quarterly_Report"
+	assert isinstance(engine.as_async(), AsyncLLMEngine)
+
+
+class StreamingDummyTransport:
+	name = "StreamingDummy"
+
+	def __init__(self, reply: str):
+		self.reply = reply
+		self.stopped_at: list[str] = []
+
+	def generate(self, prompt: str, *, purpose: str, max_tokens: int) -> str:
+		raise AssertionError("engine should prefer generate_until")
+
+	def generate_until(self, prompt: str, *, purpose: str, max_tokens: int, stop_when) -> str:
+		text = ""
+		for char in self.reply:
+			text += char
+			if stop_when(text):
+				break
+		self.stopped_at.append(text)
+		return text
+
+
+def test_engine_streams_until_required_tags_close() -> None:
+	transport = StreamingDummyTransport(RENAME_REPLY + "<new_name>Rambling</new_name>")
+	engine = LLMEngine(transports=[transport])
+	result = engine.rename("old.pdf", {"extension": "pdf"})
+	assert result.new_name == "Quarterly_Report"
+	assert transport.stopped_at == [RENAME_REPLY]
+
+
+def test_sync_callers_share_one_loop_and_limit() -> None:
+	from concurrent.futures import ThreadPoolExecutor
+
+	transport = AsyncDummyTransport(delay=0.05)
+	engine = LLMEngine(transports=[transport], max_concurrency=2)
+	try:
+		with ThreadPoolExecutor(max_workers=6) as pool:
+			results = list(pool.map(lambda idx: engine.rename(f"f{idx}.pdf", {}), range(6)))
+		loop = engine._loop
+		engine.rename("again.pdf", {})
+		assert engine._loop is loop
+	finally:
+		engine.close()
+	assert [result.new_name for result in results] == ["Quarterly_Report"] * 6
+	# six threads, one semaphore: more than one call in flight, never more than two
+	assert transport.max_in_flight == 2
+
+
+def test_sync_transport_prints_reach_the_callers_pipeline_output() -> None:
+	from rename_n_sort.pipeline import run_pipeline
+
+	class PrintingTransport(SyncDummyTransport):
+		def generate(self, prompt: str, *, purpose: str, max_tokens: int) -> str:
+			print(f"transport saw {purpose}")
+			return super().generate(prompt, purpose=purpose, max_tokens=max_tokens)
+
+	engine = LLMEngine(transports=[PrintingTransport([RENAME_REPLY, RENAME_REPLY])])
+	try:
+		results = list(
+			run_pipeline(
+				["a.pdf", "b.pdf"],
+				lambda name: name,
+				lambda name, _value: engine.rename(name, {}),
+				second_workers=2,
+			)
+		)
+	finally:
+		engine.close()
+	for result in results:
+		assert result.error is None
+		assert "transport saw filename based on content" in result.output
+		assert result.output.count("transport saw") == 1
@@ -88,3 +88,33 @@ def test_parse_sort_duplicate_reason_raises():
 			"<category>Document</category><reason>one</reason><reason>two</reason>",
 			["/tmp/a.pdf"],
 		)
+
+
+def test_parse_sort_batch_maps_ids_to_paths():
+	result = parse_sort_response(
+		'<file id="F2"><category>image</category><reason>photo</reason></file>'
+		'<file id="F1"><category>Document</category></file>',
+		["/tmp/a.pdf", "/tmp/b.jpg"],
+	)
+	assert result.assignments == {"/tmp/a.pdf": "Document", "/tmp/b.jpg": "Image"}
+	assert result.reasons == {"/tmp/b.jpg": "photo"}
+
+
+def test_parse_sort_batch_drops_invalid_and_duplicate_ids():
+	result = parse_sort_response(
+		'<file id="F1"><category>Document</category></file>'
+		'<file id="F2"><category>Recipes</category></file>'
+		'<file id="F3"><category>Image</category></file>'
+		'<file id="F3"><category>Video</category></file>'
+		'<file id="F9"><category>Audio</category></file>',
+		["/tmp/a.pdf", "/tmp/b.txt", "/tmp/c.jpg"],
+	)
+	assert result.assignments == {"/tmp/a.pdf": "Document"}
+
+
+def test_parse_sort_batch_without_file_blocks_raises():
+	with pytest.raises(ParseError):
+		parse_sort_response(
+			"<category>Document</category>",
+			["/tmp/a.pdf", "/tmp/b.jpg"],
+		)
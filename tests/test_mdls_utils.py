@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched, cached mdls provider.
+"""
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from rename_n_sort.plugins import mdls_utils
+from rename_n_sort.plugins.mdls_utils import (
+	MdlsProvider,
+	get_mdls_provider,
+	mdls_field,
+	mdls_fields,
+	set_mdls_provider,
+)
+
+
+class FakeMdls:
+	"""
+	Stand-in for subprocess.run that answers like mdls -raw.
+	"""
+
+	def __init__(self, values: dict[str, dict[str, str]], fail_for: set[str] | None = None) -> None:
+		self.values = values
+		self.fail_for = fail_for or set()
+		self.commands: list[list[str]] = []
+
+	def __call__(self, command: list[str], **kwargs) -> subprocess.CompletedProcess:
+		self.commands.append(command)
+		names = [command[idx + 1] for idx, arg in enumerate(command) if arg == "-name"]
+		paths = command[2 + 2 * len(names):]
+		parts: list[str] = []
+		for path in paths:
+			if path in self.fail_for:
+				# real mdls prints an error for the file and skips its values
+				continue
+			for name in names:
+				parts.append(self.values.get(path, {}).get(name, "(null)"))
+		return subprocess.CompletedProcess(command, 0, stdout="\0".join(parts), stderr="")
+
+
+def _provider(runner: FakeMdls) -> MdlsProvider:
+	provider = MdlsProvider(runner=runner)
+	provider._available = True
+	return provider
+
+
+@pytest.fixture
+def two_files(tmp_path: Path) -> tuple[Path, Path]:
+	first = tmp_path / "a.pdf"
+	second = tmp_path / "b.pdf"
+	first.write_text("a", encoding="utf-8")
+	second.write_text("b", encoding="utf-8")
+	return first, second
+
+
+def test_one_call_reads_all_fields(two_files) -> None:
+	first, _second = two_files
+	runner = FakeMdls({str(first): {"kMDItemTitle": "Invoice", "kMDItemPageCount": "3"}})
+	provider = _provider(runner)
+	data = provider.fields(first, ["kMDItemTitle", "kMDItemAuthors", "kMDItemPageCount"])
+	assert data == {"kMDItemTitle": "Invoice", "kMDItemPageCount": "3"}
+	assert len(runner.commands) == 1
+	assert runner.commands[0].count("-name") == 3
+
+
+def test_results_cached_until_mtime_changes(two_files) -> None:
+	first, _second = two_files
+	runner = FakeMdls({str(first): {"kMDItemTitle": "Invoice"}})
+	provider = _provider(runner)
+	provider.fields(first, ["kMDItemTitle"])
+	provider.fields(first, ["kMDItemTitle"])
+	assert len(runner.commands) == 1
+	stat = first.stat()
+	os.utime(first, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+	provider.fields(first, ["kMDItemTitle"])
+	assert len(runner.commands) == 2
+
+
+def test_prefetch_uses_one_call_for_many_files(two_files) -> None:
+	first, second = two_files
+	runner = FakeMdls({
+		str(first): {"kMDItemTitle": "First"},
+		str(second): {"kMDItemKind": "PDF document"},
+	})
+	provider = _provider(runner)
+	provider.prefetch([first, second])
+	assert len(runner.commands) == 1
+	assert provider.fields(first, ["kMDItemTitle"]) == {"kMDItemTitle": "First"}
+	assert provider.fields(second, ["kMDItemKind", "kMDItemTitle"]) == {"kMDItemKind": "PDF document"}
+	assert len(runner.commands) == 1
+
+
+def test_batch_falls_back_per_file_on_mismatch(two_files) -> None:
+	first, second = two_files
+	runner = FakeMdls({str(second): {"kMDItemTitle": "Second"}}, fail_for={str(first)})
+	provider = _provider(runner)
+	results = provider.fields_many([first, second], ["kMDItemTitle"])
+	assert results[first] == {}
+	assert results[second] == {"kMDItemTitle": "Second"}
+	assert len(runner.commands) == 3
+
+
+def test_missing_binary_never_spawns(two_files) -> None:
+	first, _second = two_files
+	runner = FakeMdls({})
+	provider = MdlsProvider(binary="mdls-definitely-missing", runner=runner)
+	assert provider.fields(first, ["kMDItemTitle"]) == {}
+	provider.prefetch([first])
+	assert runner.commands == []
+
+
+def test_module_helpers_use_swappable_provider(two_files) -> None:
+	first, _second = two_files
+	runner = FakeMdls({str(first): {"kMDItemTitle": "Stubbed", "kMDItemKind": "Text"}})
+	previous = set_mdls_provider(_provider(runner))
+	try:
+		assert mdls_field(first, "kMDItemTitle") == "Stubbed"
+		assert mdls_fields(first, ["kMDItemKind"]) == {"kMDItemKind": "Text"}
+		assert get_mdls_provider() is mdls_utils._PROVIDER
+	finally:
+		set_mdls_provider(previous)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent FileMetadata cache.
+"""
+
+import os
+from pathlib import Path
+
+from rename_n_sort.config import AppConfig
+from rename_n_sort.metadata_cache import MetadataCache
+from rename_n_sort.organizer import Organizer
+from rename_n_sort.plugins import FileMetadata
+from rename_n_sort.plugins.text import TextDocumentPlugin
+from conftest import StubLLM
+
+
+def test_cache_round_trip_and_counts(tmp_path: Path) -> None:
+	source = tmp_path / "note.txt"
+	source.write_text("hello", encoding="utf-8")
+	plugin = TextDocumentPlugin()
+	cache = MetadataCache(tmp_path / "cache" / "meta.sqlite3")
+	assert cache.get(source, plugin) is None
+	meta = FileMetadata(path=source, title="Note", keywords=["a"], summary="hello")
+	meta.extra["size_bytes"] = 5
+	cache.put(source, plugin, meta)
+	cached = cache.get(source, plugin)
+	assert cached is not None
+	assert cached.title == "Note"
+	assert cached.keywords == ["a"]
+	assert cached.extra["size_bytes"] == 5
+	assert (cache.hits, cache.misses) == (1, 1)
+	# contains() is a side-effect-free probe
+	assert cache.contains(source, plugin)
+	assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_misses_after_file_or_plugin_change(tmp_path: Path) -> None:
+	source = tmp_path / "note.txt"
+	source.write_text("hello", encoding="utf-8")
+	plugin = TextDocumentPlugin()
+	cache = MetadataCache(tmp_path / "meta.sqlite3")
+	cache.put(source, plugin, FileMetadata(path=source, summary="hello"))
+	stat = source.stat()
+	os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+	assert cache.get(source, plugin) is None
+	cache.put(source, plugin, FileMetadata(path=source, summary="hello"))
+	plugin.version = f"{plugin.version}.1"
+	assert cache.get(source, plugin) is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+	plugin = TextDocumentPlugin()
+	cache = MetadataCache(tmp_path / "meta.sqlite3", max_bytes=400)
+	paths = []
+	for idx in range(3):
+		path = tmp_path / f"f{idx}.txt"
+		path.write_text(str(idx), encoding="utf-8")
+		paths.append(path)
+		cache.put(path, plugin, FileMetadata(path=path, summary="x" * 100))
+	assert cache.entry_count() == 2
+	assert cache.get(paths[0], plugin) is None
+	assert cache.get(paths[2], plugin) is not None
+
+
+def test_refresh_mode_ignores_entries(tmp_path: Path) -> None:
+	source = tmp_path / "note.txt"
+	source.write_text("hello", encoding="utf-8")
+	plugin = TextDocumentPlugin()
+	db_path = tmp_path / "meta.sqlite3"
+	MetadataCache(db_path).put(source, plugin, FileMetadata(path=source))
+	refreshing = MetadataCache(db_path, refresh=True)
+	assert refreshing.get(source, plugin) is None
+	assert refreshing.misses == 1
+
+
+def test_organizer_reuses_cached_metadata(tmp_path: Path) -> None:
+	source = tmp_path / "note.txt"
+	source.write_text("hello world", encoding="utf-8")
+	cfg = AppConfig(roots=[tmp_path], cache_mode="on", cache_dir=tmp_path / "cache")
+	first = Organizer(cfg, llm=StubLLM())
+	first.process_one_by_one([source])
+	second = Organizer(cfg, llm=StubLLM())
+	second.process_one_by_one([source])
+	assert (first.metadata_cache.hits, first.metadata_cache.misses) == (0, 1)
+	assert (second.metadata_cache.hits, second.metadata_cache.misses) == (1, 0)
+
+
+def test_degraded_metadata_is_not_stored(tmp_path: Path) -> None:
+	source = tmp_path / "scan.txt"
+	source.write_text("hello", encoding="utf-8")
+	plugin = TextDocumentPlugin()
+	cache = MetadataCache(tmp_path / "meta.sqlite3")
+	meta = FileMetadata(path=source, summary="partial")
+	meta.degraded.append("page 1 OCR failed")
+	cache.put(source, plugin, meta)
+	assert cache.entry_count() == 0
+	assert cache.get(source, plugin) is None
+
+
+def test_cache_misses_when_extraction_settings_change(tmp_path: Path) -> None:
+	source = tmp_path / "note.txt"
+	source.write_text("hello", encoding="utf-8")
+	plugin = TextDocumentPlugin()
+	db_path = tmp_path / "meta.sqlite3"
+	MetadataCache(db_path, settings="pdf_min_text_chars=200").put(
+		source, plugin, FileMetadata(path=source, summary="hello")
+	)
+	assert MetadataCache(db_path, settings="pdf_min_text_chars=200").get(source, plugin) is not None
+	assert MetadataCache(db_path, settings="pdf_min_text_chars=50").get(source, plugin) is None
+
+
+def test_organizer_cache_key_tracks_pdf_threshold(tmp_path: Path) -> None:
+	cache_dir = tmp_path / "cache"
+	low = Organizer(
+		AppConfig(roots=[tmp_path], cache_mode="on", cache_dir=cache_dir, pdf_min_text_chars=50),
+		llm=StubLLM(),
+	)
+	high = Organizer(
+		AppConfig(roots=[tmp_path], cache_mode="on", cache_dir=cache_dir, pdf_min_text_chars=400),
+		llm=StubLLM(),
+	)
+	assert low.metadata_cache.settings != high.metadata_cache.settings
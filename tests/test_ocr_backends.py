@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for the OCR backend selection and the in-process tesserocr handle.
+"""
+
+import sys
+import types
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from PIL import Image
+
+from rename_n_sort import ocr_backends
+from rename_n_sort.ocr_backends import PytesseractBackend, TesserocrBackend, make_backend
+from rename_n_sort.ocr_service import OcrService
+
+
+class _FakeApi:
+	created: list[str] = []
+
+	def __init__(self, lang: str) -> None:
+		_FakeApi.created.append(lang)
+		self.image = None
+		self.cleared = 0
+		self.finish = True
+
+	def SetImage(self, image: Image.Image) -> None:
+		self.image = image
+
+	def Recognize(self, timeout: int = 0) -> bool:
+		self.timeout = timeout
+		return self.finish
+
+	def GetUTF8Text(self) -> str:
+		return f"text {self.image.size[0]}\n"
+
+	def Clear(self) -> None:
+		self.cleared += 1
+
+
+@pytest.fixture
+def fake_tesserocr(monkeypatch):
+	_FakeApi.created = []
+	module = types.SimpleNamespace(
+		PyTessBaseAPI=_FakeApi, get_languages=lambda: ("/tessdata/", ["eng", "osd"])
+	)
+	monkeypatch.setitem(sys.modules, "tesserocr", module)
+	monkeypatch.setattr(ocr_backends, "_LOCAL", threading.local())
+	return module
+
+
+def test_make_backend_by_name(monkeypatch) -> None:
+	assert isinstance(make_backend("pytesseract"), PytesseractBackend)
+	monkeypatch.setattr(TesserocrBackend, "ready", staticmethod(lambda lang="eng": False))
+	assert make_backend("auto").name == "pytesseract"
+	monkeypatch.setattr(TesserocrBackend, "ready", staticmethod(lambda lang="eng": True))
+	assert make_backend("auto").name == "tesserocr"
+	assert isinstance(make_backend("tesserocr", lang="deu"), TesserocrBackend)
+	with pytest.raises(ValueError):
+		make_backend("easyocr")
+
+
+def test_tesserocr_handle_is_reused_across_images(fake_tesserocr) -> None:
+	backend = TesserocrBackend()
+	assert backend(Image.new("L", (11, 5)), 2.0) == "text 11\n"
+	assert backend(Image.new("L", (12, 5)), 2.0) == "text 12\n"
+	# a fresh unpickled copy in the same worker shares the handle
+	assert TesserocrBackend()(Image.new("L", (13, 5)), 2.0) == "text 13\n"
+	assert _FakeApi.created == ["eng"]
+	api = ocr_backends._LOCAL.handles["eng"]
+	assert api.cleared == 3
+	assert api.timeout == 2000
+
+
+def test_tesserocr_deadline_raises_timeout(fake_tesserocr) -> None:
+	backend = TesserocrBackend()
+	backend(Image.new("L", (4, 4)), 1.0)
+	ocr_backends._LOCAL.handles["eng"].finish = False
+	with pytest.raises(TimeoutError):
+		backend(Image.new("L", (4, 4)), 1.0)
+
+
+def test_requested_tesserocr_must_be_usable(fake_tesserocr, monkeypatch) -> None:
+	monkeypatch.setattr(TesserocrBackend, "available", staticmethod(lambda: True))
+	# no tessdata for the language: auto falls back, an explicit request fails
+	assert make_backend("auto", lang="deu").name == "pytesseract"
+	with pytest.raises(RuntimeError, match="tesserocr"):
+		make_backend("tesserocr", lang="deu")
+	assert make_backend("tesserocr", lang="eng").name == "tesserocr"
+	monkeypatch.setattr(TesserocrBackend, "available", staticmethod(lambda: False))
+	assert make_backend("auto").name == "pytesseract"
+	with pytest.raises(RuntimeError, match="tesserocr"):
+		make_backend("tesserocr")
+
+
+def test_pytesseract_timeout_becomes_timeout_error(monkeypatch) -> None:
+	def image_to_string(image: Image.Image, lang: str, timeout: float) -> str:
+		raise RuntimeError("Tesseract process timeout")
+
+	monkeypatch.setitem(
+		sys.modules, "pytesseract", types.SimpleNamespace(image_to_string=image_to_string)
+	)
+	with pytest.raises(TimeoutError):
+		PytesseractBackend()(Image.new("L", (4, 4)), 5.0)
+
+
+def test_service_resolves_backend_when_pool_starts(fake_tesserocr, monkeypatch) -> None:
+	monkeypatch.setattr(TesserocrBackend, "available", staticmethod(lambda: True))
+	service = OcrService(backend="tesserocr", executor_factory=ThreadPoolExecutor)
+	try:
+		assert service.stats()["backend"] == "tesserocr"
+		assert service.ocr(Image.new("RGB", (21, 9))) == "text 21\n"
+	finally:
+		service.close()
+	assert service.stats()["completed"] == 1
+
+
+def test_service_reports_backend_that_ran(monkeypatch) -> None:
+	monkeypatch.setattr(TesserocrBackend, "ready", staticmethod(lambda lang="eng": False))
+	monkeypatch.setattr(PytesseractBackend, "__call__", lambda self, image, timeout: "from binary")
+	service = OcrService(backend="auto", executor_factory=ThreadPoolExecutor)
+	try:
+		assert service.ocr(Image.new("L", (4, 4))) == "from binary"
+	finally:
+		service.close()
+	assert service.stats()["backend"] == "pytesseract"
+
+
+def test_installed_tesserocr_is_ready() -> None:
+	# tesserocr comes from the optional "ocr" extra
+	pytest.importorskip("tesserocr")
+	assert TesserocrBackend.ready() is True
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared OCR pool.
+"""
+
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from PIL import Image
+
+from rename_n_sort.ocr_service import OcrService, available_cores, get_ocr_service, set_ocr_service
+from rename_n_sort.plugins.image_plugin import ImagePlugin
+
+
+def _size_ocr(image: Image.Image, timeout: float) -> str:
+	# module level so it pickles into worker processes
+	return f"{image.size[0]}x{image.size[1]}"
+
+
+def test_pool_sized_to_cores_and_counts_throughput() -> None:
+	sizes: list[int] = []
+
+	def factory(workers: int) -> ThreadPoolExecutor:
+		sizes.append(workers)
+		return ThreadPoolExecutor(workers)
+
+	service = OcrService(run_ocr=_size_ocr, executor_factory=factory)
+	try:
+		futures = [service.submit(Image.new("L", (idx, 5))) for idx in range(1, 9)]
+		texts = [future.result() for future in futures]
+	finally:
+		service.close()
+	assert texts == [f"{idx}x5" for idx in range(1, 9)]
+	assert sizes == [available_cores()]
+	stats = service.stats()
+	assert stats["submitted"] == 8
+	assert stats["completed"] == 8
+	assert stats["queue_depth"] == 0
+	assert 1 <= stats["max_queue_depth"] <= 8
+	assert stats["images_per_second"] > 0
+
+
+def test_queue_depth_counts_waiting_images() -> None:
+	release = threading.Event()
+
+	def blocking_ocr(image: Image.Image, timeout: float) -> str:
+		release.wait(5)
+		return "text"
+
+	service = OcrService(run_ocr=blocking_ocr, workers=1, executor_factory=ThreadPoolExecutor)
+	try:
+		futures = [service.submit(Image.new("L", (4, 4))) for _ in range(3)]
+		assert service.queue_depth == 3
+		release.set()
+		assert [future.result() for future in futures] == ["text"] * 3
+	finally:
+		service.close()
+	assert service.queue_depth == 0
+	assert service.stats()["max_queue_depth"] == 3
+
+
+def test_timeouts_surface_on_the_future() -> None:
+	def slow_ocr(image: Image.Image, timeout: float) -> str:
+		raise TimeoutError(f"OCR exceeded {timeout:.0f}s")
+
+	service = OcrService(
+		run_ocr=slow_ocr, timeout_seconds=3, executor_factory=ThreadPoolExecutor
+	)
+	try:
+		future = service.submit(Image.new("L", (4, 4)))
+		with pytest.raises(TimeoutError, match="3s"):
+			future.result()
+	finally:
+		service.close()
+	stats = service.stats()
+	assert stats["failures"] == 1
+	assert stats["timeouts"] == 1
+
+
+def test_process_pool_ocr_round_trip() -> None:
+	service = OcrService(run_ocr=_size_ocr, workers=2)
+	try:
+		assert service.ocr(Image.new("RGB", (30, 20))) == "30x20"
+	finally:
+		service.close()
+
+
+def test_image_plugin_ocr_goes_through_shared_service() -> None:
+	path = Path("tests/test_files/sample_ocr.png")
+	if not path.exists():
+		pytest.skip("sample_ocr.png not available")
+	service = OcrService(
+		run_ocr=lambda image, timeout: "  SAMPLE\n text ", executor_factory=ThreadPoolExecutor
+	)
+	previous = set_ocr_service(service)
+	try:
+		assert get_ocr_service() is service
+		assert ImagePlugin()._extract_ocr_text(path) == "SAMPLE text"
+	finally:
+		set_ocr_service(previous)
+		service.close()
+	assert service.stats()["completed"] == 1
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Tests for OllamaTransport history handling and pooled HTTP calls.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from rename_n_sort.transports.ollama import OllamaHTTPError, OllamaTransport
+
+
+class FakeOllama:
+	"""
+	Local /api/chat stand-in that records payloads and client sockets.
+	"""
+
+	def __init__(self) -> None:
+		self.payloads: list[dict] = []
+		self.clients: set[tuple] = set()
+		self.fail_statuses: list[int] = []
+		fake = self
+
+		class Handler(BaseHTTPRequestHandler):
+			protocol_version = "HTTP/1.1"
+			disable_nagle_algorithm = True
+
+			def do_POST(self) -> None:
+				length = int(self.headers.get("Content-Length", "0"))
+				payload = json.loads(self.rfile.read(length).decode("utf-8"))
+				fake.clients.add(self.client_address)
+				if payload.get("stream"):
+					fake.payloads.append(payload)
+					self._stream(fake.stream_tokens)
+					return
+				if fake.fail_statuses:
+					status = fake.fail_statuses.pop(0)
+					body = b"busy"
+				else:
+					fake.payloads.append(payload)
+					status = 200
+					reply = {"message": {"content": f"reply {len(fake.payloads)}"}}
+					body = json.dumps(reply).encode("utf-8")
+				self.send_response(status)
+				self.send_header("Content-Length", str(len(body)))
+				self.end_headers()
+				self.wfile.write(body)
+
+			def _stream(self, tokens: list[str]) -> None:
+				self.send_response(200)
+				self.send_header("Content-Type", "application/x-ndjson")
+				self.send_header("Transfer-Encoding", "chunked")
+				self.end_headers()
+				events = [{"message": {"content": token}, "done": False} for token in tokens]
+				events.append({"message": {"content": ""}, "done": True, "eval_count": len(tokens)})
+				try:
+					for event in events:
+						line = (json.dumps(event) + "\n").encode("utf-8")
+						self.wfile.write(f"{len(line):x}\r\n".encode("ascii") + line + b"\r\n")
+						self.wfile.flush()
+					self.wfile.write(b"0\r\n\r\n")
+				except (BrokenPipeError, ConnectionResetError):
+					self.close_connection = True
+
+			def log_message(self, format: str, *args) -> None:
+				return
+
+		self.stream_tokens: list[str] = []
+		self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+		self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+		self.thread = threading.Thread(
+			target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+		)
+		self.thread.start()
+
+
+@pytest.fixture
+def fake_ollama():
+	fake = FakeOllama()
+	yield fake
+	fake.server.shutdown()
+	fake.server.server_close()
+
+
+def test_stateless_by_default(fake_ollama) -> None:
+	transport = OllamaTransport(
+		model="m", base_url=fake_ollama.base_url, system_message="be terse"
+	)
+	for idx in range(5):
+		transport.generate(f"prompt {idx}", purpose="test", max_tokens=10)
+	sent = fake_ollama.payloads
+	assert [len(payload["messages"]) for payload in sent] == [2] * 5
+	assert sent[-1]["messages"][-1] == {"role": "user", "content": "prompt 4"}
+	assert not transport.history
+
+
+def test_history_window_respects_token_cap(fake_ollama) -> None:
+	# each turn costs 25 + 2 estimated tokens, so two turns fit in 60
+	transport = OllamaTransport(model="m", base_url=fake_ollama.base_url, history_tokens=60)
+	for idx in range(6):
+		transport.generate(f"{idx}" * 100, purpose="test", max_tokens=10)
+	sent = fake_ollama.payloads
+	assert len(sent[0]["messages"]) == 1
+	assert len(sent[1]["messages"]) == 3
+	assert len(sent[-1]["messages"]) == 5
+	assert sent[-1]["messages"][0]["content"] == "3" * 100
+	assert len(transport.history) == 2
+
+
+def test_oversized_turn_is_not_sent() -> None:
+	transport = OllamaTransport(model="m", history_tokens=10)
+	transport.history.append(("x" * 400, "y"))
+	assert transport.build_messages("next") == [{"role": "user", "content": "next"}]
+
+
+def test_calls_reuse_one_keep_alive_connection(fake_ollama) -> None:
+	transport = OllamaTransport(model="m", base_url=fake_ollama.base_url)
+	for idx in range(5):
+		transport.generate(f"prompt {idx}", purpose="test", max_tokens=10)
+	assert len(fake_ollama.clients) == 1
+	assert transport.pool.connections_opened == 1
+	transport.close()
+
+
+def test_pool_is_bounded_across_threads(fake_ollama) -> None:
+	transport = OllamaTransport(model="m", base_url=fake_ollama.base_url, pool_size=2)
+	threads = [
+		threading.Thread(
+			target=transport.generate, args=(f"p{idx}",), kwargs={"purpose": "t", "max_tokens": 5}
+		)
+		for idx in range(8)
+	]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	assert len(fake_ollama.payloads) == 8
+	assert transport.pool.connections_opened <= 2
+
+
+def test_server_errors_retry_with_backoff(fake_ollama, monkeypatch) -> None:
+	from rename_n_sort.transports import ollama as ollama_module
+
+	sleeps: list[float] = []
+	monkeypatch.setattr(ollama_module.time, "sleep", sleeps.append)
+	fake_ollama.fail_statuses = [503, 503]
+	transport = OllamaTransport(model="m", base_url=fake_ollama.base_url, backoff_seconds=0.2)
+	assert transport.generate("p", purpose="t", max_tokens=5) == "reply 1"
+	assert len(sleeps) == 2
+	assert 0 <= sleeps[0] <= 0.2 and 0 <= sleeps[1] <= 0.4
+
+
+def test_client_errors_are_not_retried(fake_ollama, monkeypatch) -> None:
+	from rename_n_sort.transports import ollama as ollama_module
+
+	sleeps: list[float] = []
+	monkeypatch.setattr(ollama_module.time, "sleep", sleeps.append)
+	fake_ollama.fail_statuses = [400]
+	transport = OllamaTransport(model="m", base_url=fake_ollama.base_url)
+	with pytest.raises(OllamaHTTPError):
+		transport.generate("p", purpose="t", max_tokens=5)
+	assert sleeps == []
+
+
+def test_successful_calls_do_not_sleep(fake_ollama, monkeypatch) -> None:
+	from rename_n_sort.transports import ollama as ollama_module
+
+	sleeps: list[float] = []
+	monkeypatch.setattr(ollama_module.time, "sleep", sleeps.append)
+	transport = OllamaTransport(model="m", base_url=fake_ollama.base_url)
+	transport.generate("p", purpose="t", max_tokens=5)
+	assert sleeps == []
+
+
+def test_streaming_stops_once_tags_close(fake_ollama) -> None:
+	from rename_n_sort.llm_parsers import tags_closed
+
+	fake_ollama.stream_tokens = [
+		"<new_name>", "Report", "</new_name>", "<reason>", "annual", "</reason>",
+	] + [" more"] * 50
+	transport = OllamaTransport(model="m", base_url=fake_ollama.base_url)
+	text = transport.generate_until(
+		"p",
+		purpose="t",
+		max_tokens=200,
+		stop_when=tags_closed("new_name", "reason"),
+	)
+	assert text == "<new_name>Report</new_name><reason>annual</reason>"
+	assert fake_ollama.payloads[-1]["stream"] is True
+	assert transport.early_stops == 1
+	assert transport.tokens_saved == 194
+
+
+def test_streaming_full_reply_keeps_connection(fake_ollama) -> None:
+	from rename_n_sort.llm_parsers import tags_closed
+
+	fake_ollama.stream_tokens = ["<category>", "Document", "</category>"]
+	transport = OllamaTransport(model="m", base_url=fake_ollama.base_url)
+	for _ in range(3):
+		text = transport.generate_until(
+			"p", purpose="t", max_tokens=50, stop_when=tags_closed("category", "reason")
+		)
+		assert text == "<category>Document</category>"
+	assert transport.early_stops == 0
+	assert transport.pool.connections_opened == 1
+
+
+def test_stream_disabled_uses_plain_generate(fake_ollama) -> None:
+	transport = OllamaTransport(model="m", base_url=fake_ollama.base_url, stream=False)
+	text = transport.generate_until("p", purpose="t", max_tokens=5, stop_when=lambda _text: True)
+	assert text == "reply 1"
+	assert fake_ollama.payloads[-1]["stream"] is False
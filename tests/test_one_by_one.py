@@ -22,3 +22,25 @@ def test_one_by_one_assigns_category_and_target(tmp_path: Path):
 	assert len(plans) == 1
 	assert plans[0].category == "Document"
 	assert str(plans[0].target).startswith(str(target_root))
+
+
+def test_one_by_one_keeps_input_order_with_workers(tmp_path: Path):
+	sources = []
+	for idx in range(6):
+		source = tmp_path / f"note_{idx}.txt"
+		source.write_text(f"note {idx}")
+		sources.append(source)
+	missing = tmp_path / "missing.txt"
+	cfg = AppConfig(
+		roots=[tmp_path],
+		target_root=tmp_path / "out",
+		dry_run=True,
+		extract_workers=3,
+		llm_workers=2,
+		pipeline_queue_size=2,
+	)
+	org = Organizer(cfg, llm=StubLLM())
+
+	plans = org.process_one_by_one(sources[:3] + [missing] + sources[3:])
+	assert [plan.source for plan in plans] == sources
+	assert all(plan.new_name.startswith("Renamed_note") for plan in plans)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tests for pulling embedded scans out of image-only PDF pages.
+"""
+
+import io
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import NumberObject
+
+from rename_n_sort.plugins.pdf_images import embedded_page_image
+
+
+def _scanned_pdf(mode: str, size: tuple[int, int], resolution: int) -> bytes:
+	image = Image.new(mode, size, "white")
+	ImageDraw.Draw(image).text((100, 100), "Invoice 0042", fill="black")
+	buffer = io.BytesIO()
+	image.save(buffer, format="PDF", resolution=resolution)
+	return buffer.getvalue()
+
+
+def _first_page(data: bytes):
+	return PdfReader(io.BytesIO(data)).pages[0]
+
+
+def _numbers(*values: int) -> list:
+	return [NumberObject(value) for value in values]
+
+
+def _edit_operations(data: bytes, edit) -> bytes:
+	writer = PdfWriter(clone_from=io.BytesIO(data))
+	page = writer.pages[0]
+	contents = page.get_contents()
+	contents.operations = edit(contents.operations)
+	page.replace_contents(contents)
+	buffer = io.BytesIO()
+	writer.write(buffer)
+	return buffer.getvalue()
+
+
+def test_jpeg_scan_is_decoded_at_reduced_scale() -> None:
+	# 400 dpi letter page; libjpeg halves it while decoding
+	page = _first_page(_scanned_pdf("RGB", (3400, 4400), 400))
+	image = embedded_page_image(page, dpi=200)
+	assert image is not None
+	assert image.mode == "RGB"
+	assert image.size == (1700, 2200)
+
+
+def test_ccitt_scan_is_reduced_and_converted() -> None:
+	page = _first_page(_scanned_pdf("1", (3400, 4400), 400))
+	image = embedded_page_image(page, dpi=200)
+	assert image is not None
+	assert image.mode == "RGB"
+	assert image.size == (1700, 2200)
+
+
+def test_low_resolution_scan_is_not_upscaled() -> None:
+	page = _first_page(_scanned_pdf("L", (850, 1100), 100))
+	image = embedded_page_image(page, dpi=200)
+	assert image is not None
+	assert image.size == (850, 1100)
+
+
+def test_rotated_page_matches_rendered_orientation() -> None:
+	writer = PdfWriter(clone_from=io.BytesIO(_scanned_pdf("RGB", (1700, 2200), 200)))
+	writer.pages[0].rotate(90)
+	buffer = io.BytesIO()
+	writer.write(buffer)
+	image = embedded_page_image(_first_page(buffer.getvalue()), dpi=200)
+	assert image is not None
+	assert image.size == (2200, 1700)
+
+
+def test_pages_with_vector_content_need_a_render() -> None:
+	scan = _scanned_pdf("RGB", (1700, 2200), 200)
+	with_box = _edit_operations(scan, lambda ops: ops + [(_numbers(0, 0, 10, 10), b"re"), ([], b"f")])
+	assert embedded_page_image(_first_page(with_box)) is None
+	# a logo-sized image is not a scan
+	small = _edit_operations(
+		scan,
+		lambda ops: [(_numbers(100, 0, 0, 130, 0, 0), b"cm") if op == b"cm" else (args, op) for args, op in ops],
+	)
+	assert embedded_page_image(_first_page(small)) is None
+	blank = PdfWriter()
+	blank.add_blank_page(width=612, height=792)
+	buffer = io.BytesIO()
+	blank.write(buffer)
+	assert embedded_page_image(_first_page(buffer.getvalue())) is None
+
+
+def test_pdf_plugin_uses_embedded_scan_without_poppler(monkeypatch) -> None:
+	from concurrent.futures import ThreadPoolExecutor
+
+	from rename_n_sort.captioner import CaptionerService, set_captioner
+	from rename_n_sort.ocr_service import OcrService, set_ocr_service
+	from rename_n_sort.plugins import pdf as pdf_module
+	from rename_n_sort.plugins.base import FileMetadata
+	from rename_n_sort.plugins.pdf import PDFPlugin
+	from rename_n_sort.plugins.pdf_pages import PdfPageRouter, set_pdf_page_router
+
+	def no_poppler(*args, **kwargs) -> list:
+		raise AssertionError("scanned page should not be rendered")
+
+	ocr_sizes: list[tuple[int, int]] = []
+
+	def fake_ocr(image: Image.Image, timeout: float) -> str:
+		ocr_sizes.append(image.size)
+		return "Invoice 0042"
+
+	monkeypatch.setattr(pdf_module, "convert_from_path", no_poppler)
+	captioner = CaptionerService(load_components=dict, run_caption=lambda image, components: "a page")
+	previous_captioner = set_captioner(captioner)
+	router = PdfPageRouter()
+	previous_router = set_pdf_page_router(router)
+	ocr = OcrService(run_ocr=fake_ocr, executor_factory=ThreadPoolExecutor)
+	previous_ocr = set_ocr_service(ocr)
+	try:
+		reader = PdfReader(io.BytesIO(_scanned_pdf("RGB", (3400, 4400), 400)))
+		meta = FileMetadata(path=Path("scan.pdf"), plugin_name="pdf")
+		PDFPlugin()._summarize_with_images(Path("scan.pdf"), [1], meta, pages=reader.pages)
+	finally:
+		set_captioner(previous_captioner)
+		set_pdf_page_router(previous_router)
+		set_ocr_service(previous_ocr)
+		ocr.close()
+	assert ocr_sizes == [(1700, 2200)]
+	assert meta.extra["ocr_text"] == "Page 1: Invoice 0042"
+	assert router.stats()["embedded_images"] == 1
+
+
+def test_unparsable_page_is_logged_and_rendered(monkeypatch, caplog) -> None:
+	from pypdf.errors import PdfStreamError
+
+	from rename_n_sort.plugins import pdf as pdf_module
+	from rename_n_sort.plugins.pdf import PDFPlugin
+
+	def broken_stream(page, dpi: int) -> None:
+		raise PdfStreamError("Stream has ended unexpectedly")
+
+	rendered = Image.new("RGB", (8, 8))
+	monkeypatch.setattr(pdf_module, "embedded_page_image", broken_stream)
+	monkeypatch.setattr(pdf_module, "convert_from_path", lambda *args, **kwargs: [rendered])
+	image = PDFPlugin()._page_image(Path("scan.pdf"), 1, [object()])
+	assert image is rendered
+	assert "scan.pdf page 1" in caplog.text
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the staged worker pipeline.
+"""
+
+import sys
+import time
+import contextlib
+
+from rename_n_sort.pipeline import run_pipeline
+
+
+def _slow_first(item: int) -> int:
+	# later items finish first so ordering has to be restored
+	time.sleep(0.01 * (5 - item))
+	print(f"extract {item}")
+	return item * 10
+
+
+def _second(item: int, value: int) -> int:
+	print(f"llm {item}")
+	if item == 2:
+		raise ValueError("boom")
+	return value + 1
+
+
+def test_pipeline_yields_results_in_input_order():
+	results = list(
+		run_pipeline(
+			range(5), _slow_first, _second,
+			first_workers=4, second_workers=2, max_in_flight=3,
+		)
+	)
+	assert [result.item for result in results] == [0, 1, 2, 3, 4]
+	assert [result.value for result in results if result.error is None] == [1, 11, 31, 41]
+
+
+def test_pipeline_captures_output_and_errors_per_item(capsys):
+	results = list(run_pipeline(range(3), _slow_first, _second, first_workers=3))
+	assert results[1].output == "extract 1\nllm 1\n"
+	assert isinstance(results[2].error, ValueError)
+	assert "extract 2" in results[2].output
+	assert "extract" not in capsys.readouterr().out
+
+
+def _failing_first(item: int) -> int:
+	if item == 1:
+		raise OSError("unreadable")
+	return item
+
+
+def test_pipeline_reports_which_stage_failed():
+	results = list(run_pipeline(range(3), _failing_first, _second))
+	assert results[1].failed_stage == "first"
+	assert isinstance(results[1].error, OSError)
+	assert results[2].failed_stage == "second"
+	assert results[0].failed_stage is None
+
+
+def test_pipeline_restores_stdout_when_closed_early():
+	original = sys.stdout
+	results = run_pipeline(range(10), _slow_first, _second, max_in_flight=2)
+	with contextlib.closing(results):
+		next(results)
+		assert sys.stdout is not original
+	assert sys.stdout is original
+
+
+def test_pipeline_cancels_queued_first_stage_work_when_closed_early():
+	started: list[int] = []
+
+	def slow_extract(item: int) -> int:
+		started.append(item)
+		time.sleep(0.05)
+		return item
+
+	results = run_pipeline(range(8), slow_extract, lambda item, value: value, max_in_flight=4)
+	with contextlib.closing(results):
+		next(results)
+	# at most item 1 was extracting at close; items 2 and 3 were still queued
+	assert len(started) <= 2
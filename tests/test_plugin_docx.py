@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 """Tests for DOCX metadata extraction."""
 
+import random
 from pathlib import Path
 
+import docx
 import pytest
 
-from rename_n_sort.plugins import docx_plugin
 from rename_n_sort.plugins.docx_plugin import DocxPlugin
+from rename_n_sort.plugins.office_xml import head_tail_summary, iter_docx_paragraphs
 
 
 def test_docx_plugin_extracts_summary() -> None:
@@ -17,5 +19,38 @@ def test_docx_plugin_extracts_summary() -> None:
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "docx"
 	assert meta.extra.get("extension") == "docx"
-	if docx_plugin.docx:
-		assert meta.summary
+	assert meta.summary
+
+
+def test_docx_streaming_reads_properties_tables_and_tail(tmp_path: Path) -> None:
+	document = docx.Document()
+	document.core_properties.title = "Quarterly Report"
+	document.core_properties.author = "Finance Team"
+	document.add_paragraph("Opening paragraph.")
+	table = document.add_table(rows=1, cols=2)
+	table.cell(0, 0).text = "Cell A"
+	table.cell(0, 1).text = "Cell B"
+	for idx in range(200):
+		document.add_paragraph(f"Body line {idx} " + "x" * 20)
+	document.add_paragraph("Closing words.")
+	path = tmp_path / "report.docx"
+	document.save(path)
+	paragraphs = list(iter_docx_paragraphs(path))
+	assert paragraphs[:3] == ["Opening paragraph.", "Cell A", "Cell B"]
+	meta = DocxPlugin().extract_metadata(path)
+	assert meta.title == "Quarterly Report"
+	assert meta.keywords == ["Finance Team"]
+	assert meta.summary.startswith("Opening paragraph. Cell A Cell B")
+	assert meta.summary.endswith("Closing words.")
+
+
+def test_head_tail_summary_matches_full_join() -> None:
+	rng = random.Random(3)
+	for _ in range(200):
+		paragraphs = ["w" * rng.randint(1, 90) for _ in range(rng.randint(0, 20))]
+		full = " ".join(paragraphs)
+		if not full:
+			assert head_tail_summary(paragraphs, 50) is None
+			continue
+		expected = f"{full[:50]} ... {full[-50:]}" if len(full) > 50 else full
+		assert head_tail_summary(iter(paragraphs), 50) == expected
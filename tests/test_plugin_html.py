@@ -17,6 +17,44 @@ def test_html_plugin_extracts_text_and_title(tmp_path: Path) -> None:
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "html"
 	assert meta.extra.get("extension") == "html"
-	if html_plugin.BeautifulSoup:
-		assert meta.summary and "Hello" in meta.summary
-		assert meta.title == "Sample"
+	assert meta.summary and "Hello" in meta.summary
+	assert meta.title == "Sample"
+
+
+def test_html_plugin_skips_scripts_and_collects_headings(tmp_path: Path) -> None:
+	path = tmp_path / "page.htm"
+	path.write_text(
+		"<html><head><title> Quarterly\n Report </title>"
+		"<style>body { color: red; }</style>"
+		"<script>var hidden = '<h1>not a heading</h1>';</script></head>"
+		"<body><noscript>Enable JavaScript</noscript>"
+		"<h1>Revenue &amp; Costs</h1><p>Sales <b>grew</b> 5%.</p>"
+		"<h2>Outlook</h2><p>Stable.</p></body></html>",
+		encoding="utf-8",
+	)
+	meta = HtmlPlugin().extract_metadata(path)
+	assert meta.title == "Quarterly Report"
+	assert meta.summary == "Quarterly Report Revenue & Costs Sales grew 5%. Outlook Stable."
+	assert meta.extra["headings"] == ["Revenue & Costs", "Outlook"]
+
+
+def test_html_plugin_stops_once_summary_is_full(tmp_path: Path) -> None:
+	path = tmp_path / "big.html"
+	paragraph = "<p>" + "word " * 50 + "</p>\n"
+	with open(path, "w", encoding="utf-8") as handle:
+		handle.write("<html><head><title>Big</title></head><body>")
+		for _ in range(20000):
+			handle.write(paragraph)
+		handle.write("<h1>Too Late</h1></body></html>")
+	parser = html_plugin._HtmlTextParser()
+	fed = 0
+	for chunk in html_plugin.iter_text(path, chunk_bytes=4096):
+		parser.feed(chunk)
+		fed += 1
+		if parser.full:
+			break
+	assert fed == 1
+	meta = HtmlPlugin().extract_metadata(path)
+	assert meta.title == "Big"
+	assert len(meta.summary) == html_plugin.SUMMARY_CHARS
+	assert "headings" not in meta.extra
@@ -1,13 +1,33 @@
 #!/usr/bin/env python3
 """Tests for ODT metadata extraction."""
 
+import zipfile
 from pathlib import Path
 
 import pytest
 
-from rename_n_sort.plugins import odt_plugin
 from rename_n_sort.plugins.odt_plugin import OdtPlugin
 
+CONTENT_XML = (
+	'<office:document-content'
+	' xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+	' xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0">'
+	"<office:body><office:text>"
+	"<text:h>Minutes</text:h>"
+	'<text:p>Budget<text:s text:c="2"/>approved<text:tab/>today</text:p>'
+	"<text:p><text:span>Next</text:span> meeting in May</text:p>"
+	"</office:text></office:body></office:document-content>"
+)
+META_XML = (
+	'<office:document-meta'
+	' xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+	' xmlns:dc="http://purl.org/dc/elements/1.1/"'
+	' xmlns:meta="urn:oasis:names:tc:opendocument:xmlns:meta:1.0">'
+	"<office:meta><dc:creator>Last Editor</dc:creator>"
+	"<meta:initial-creator>Board Secretary</meta:initial-creator>"
+	"<dc:title>Board Minutes</dc:title></office:meta></office:document-meta>"
+)
+
 
 def test_odt_plugin_extracts_summary() -> None:
 	path = Path("tests/test_files/sample.odt")
@@ -17,5 +37,16 @@ def test_odt_plugin_extracts_summary() -> None:
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "odt"
 	assert meta.extra.get("extension") == "odt"
-	if odt_plugin.load and odt_plugin.text and odt_plugin.teletype:
-		assert meta.summary
+	assert meta.summary
+
+
+def test_odt_streaming_reads_meta_and_inline_markup(tmp_path: Path) -> None:
+	path = tmp_path / "minutes.odt"
+	with zipfile.ZipFile(path, "w") as archive:
+		archive.writestr("mimetype", "application/vnd.oasis.opendocument.text")
+		archive.writestr("content.xml", CONTENT_XML)
+		archive.writestr("meta.xml", META_XML)
+	meta = OdtPlugin().extract_metadata(path)
+	assert meta.title == "Board Minutes"
+	assert meta.keywords == ["Board Secretary"]
+	assert meta.summary == "Minutes Budget  approved\ttoday Next meeting in May"
@@ -13,3 +13,157 @@ def test_pdf_plugin_extracts_basic_metadata(tmp_path: Path) -> None:
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "pdf"
 	assert meta.extra.get("extension") == "pdf"
+
+
+def test_pdf_pages_render_one_at_a_time_in_memory(monkeypatch) -> None:
+	from PIL import Image
+
+	from concurrent.futures import ThreadPoolExecutor
+
+	from rename_n_sort.captioner import CaptionerService, set_captioner
+	from rename_n_sort.ocr_service import OcrService, set_ocr_service
+	from rename_n_sort.plugins import pdf as pdf_module
+	from rename_n_sort.plugins.base import FileMetadata
+
+	render_calls: list[tuple[int, int]] = []
+
+	def fake_convert(path: str, first_page: int, last_page: int, dpi: int) -> list:
+		render_calls.append((first_page, last_page))
+		return [Image.new("RGB", (20, 20), "white")]
+
+	seen: list[object] = []
+
+	def fake_caption(image: Image.Image, components: dict) -> str:
+		seen.append(image)
+		return "a scanned page"
+
+	monkeypatch.setattr(pdf_module, "convert_from_path", fake_convert)
+	previous = set_captioner(CaptionerService(load_components=dict, run_caption=fake_caption))
+	ocr_seen: list[object] = []
+
+	def fake_ocr(image: Image.Image, timeout: float) -> str:
+		ocr_seen.append(image)
+		return " page\n text "
+
+	ocr = OcrService(run_ocr=fake_ocr, executor_factory=ThreadPoolExecutor)
+	previous_ocr = set_ocr_service(ocr)
+	try:
+		meta = FileMetadata(path=Path("scan.pdf"), plugin_name="pdf")
+		PDFPlugin()._summarize_with_images(Path("scan.pdf"), [1, 2], meta)
+	finally:
+		set_captioner(previous)
+		set_ocr_service(previous_ocr)
+		ocr.close()
+	assert render_calls == [(1, 1), (2, 2)]
+	assert all(isinstance(image, Image.Image) for image in seen)
+	# OCR and captioning never share one PIL image across threads
+	assert not {id(image) for image in seen} & {id(image) for image in ocr_seen}
+	assert meta.extra["ocr_text"] == "Page 1: page text | Page 2: page text"
+	assert meta.extra["caption"] == "Page 1: a scanned page | Page 2: a scanned page"
+	assert ocr.stats()["completed"] == 2
+
+
+class _FakePage:
+	def __init__(self, text: str) -> None:
+		self.text = text
+
+	def extract_text(self) -> str:
+		return self.text
+
+
+def test_pdf_renders_only_text_sparse_pages(tmp_path: Path, monkeypatch) -> None:
+	from rename_n_sort.plugins import pdf as pdf_module
+	from rename_n_sort.plugins.base import FileMetadata
+	from rename_n_sort.plugins.pdf_pages import PdfPageRouter, set_pdf_page_router
+
+	dense = "Quarterly report on regional revenue. " * 10
+	pages = [_FakePage(dense), _FakePage("  Fig. 1 \n"), _FakePage(dense)]
+	monkeypatch.setattr(pdf_module, "PdfReader", lambda handle: type("R", (), {"pages": pages})())
+	rendered: list[list[int]] = []
+
+	def fake_summarize(self, path: Path, page_numbers: list[int], meta: FileMetadata, pages=None) -> None:
+		rendered.append(page_numbers)
+		meta.summary = "OCR: scanned chart"
+
+	monkeypatch.setattr(PDFPlugin, "_summarize_with_images", fake_summarize)
+	path = tmp_path / "mixed.pdf"
+	path.write_bytes(b"%PDF-1.4\n")
+	router = PdfPageRouter(min_text_chars=200)
+	previous = set_pdf_page_router(router)
+	try:
+		meta = FileMetadata(path=path, plugin_name="pdf")
+		PDFPlugin()._read_preview(path, meta)
+		assert rendered == [[2]]
+		assert meta.summary.startswith("Quarterly report")
+		assert meta.summary.endswith("| OCR: scanned chart")
+		assert meta.extra["page_count"] == 3
+		# a digital-only document never renders
+		pages[1] = _FakePage(dense)
+		meta = FileMetadata(path=path, plugin_name="pdf")
+		PDFPlugin()._read_preview(path, meta)
+		assert rendered == [[2]]
+		assert meta.summary == " ".join([dense.strip(), dense.strip()])[:1500]
+	finally:
+		set_pdf_page_router(previous)
+	stats = router.stats()
+	assert stats["pages_checked"] == 4
+	assert stats["pages_rendered"] == 1
+	assert stats["renders_skipped"] == 3
+
+
+def test_pdf_page_failures_are_logged_per_page(monkeypatch, caplog) -> None:
+	from PIL import Image
+
+	from concurrent.futures import ThreadPoolExecutor
+
+	from rename_n_sort.captioner import CaptionerService, set_captioner
+	from rename_n_sort.ocr_service import OcrService, set_ocr_service
+	from rename_n_sort.plugins import pdf as pdf_module
+	from rename_n_sort.plugins.base import FileMetadata
+
+	def fake_convert(path: str, first_page: int, last_page: int, dpi: int) -> list:
+		return [Image.new("RGB", (first_page, 20), "white")]
+
+	def fake_caption(image: Image.Image, components: dict) -> str:
+		if image.size[0] == 1:
+			raise RuntimeError("Moondream2 returned an empty caption.")
+		return "a chart"
+
+	def fake_ocr(image: Image.Image, timeout: float) -> str:
+		if image.size[0] == 2:
+			raise TimeoutError("OCR exceeded 60s")
+		return "Invoice"
+
+	monkeypatch.setattr(pdf_module, "convert_from_path", fake_convert)
+	previous = set_captioner(CaptionerService(load_components=dict, run_caption=fake_caption))
+	ocr = OcrService(run_ocr=fake_ocr, executor_factory=ThreadPoolExecutor)
+	previous_ocr = set_ocr_service(ocr)
+	try:
+		meta = FileMetadata(path=Path("scan.pdf"), plugin_name="pdf")
+		PDFPlugin()._summarize_with_images(Path("scan.pdf"), [1, 2], meta)
+	finally:
+		set_captioner(previous)
+		set_ocr_service(previous_ocr)
+		ocr.close()
+	assert meta.extra["caption"] == "Page 2: a chart"
+	assert meta.extra["ocr_text"] == "Page 1: Invoice"
+	assert "scan.pdf page 1: caption failed" in caplog.text
+	assert meta.degraded == ["page 1 caption failed", "page 2 OCR failed"]
+	assert "scan.pdf page 2: OCR failed" in caplog.text
+
+
+def test_malformed_pdf_keeps_mdls_fields(tmp_path: Path, monkeypatch, caplog) -> None:
+	from rename_n_sort.plugins import pdf as pdf_module
+	from rename_n_sort.plugins.base import FileMetadata
+
+	def broken_reader(handle) -> None:
+		# pypdf raises plain KeyError on a trailer without /Root
+		raise KeyError("/Root")
+
+	path = tmp_path / "broken.pdf"
+	path.write_bytes(b"%PDF-1.4\n")
+	monkeypatch.setattr(pdf_module, "PdfReader", broken_reader)
+	meta = FileMetadata(path=path, plugin_name="pdf")
+	PDFPlugin()._read_preview(path, meta)
+	assert "page_count" not in meta.extra
+	assert "broken.pdf: unreadable PDF" in caplog.text
@@ -3,9 +3,14 @@
 Tests for plugin selection.
 """
 
+import sys
+import zipfile
+import importlib
+import subprocess
 from pathlib import Path
 
-from rename_n_sort.plugins import build_registry
+from rename_n_sort.plugins import FileMetadataPlugin, PluginRegistry, build_registry
+from rename_n_sort.plugins.generic import GenericPlugin
 
 
 def test_registry_picks_pdf_plugin(tmp_path: Path):
@@ -22,3 +27,90 @@ def test_registry_picks_image_plugin(tmp_path: Path):
 	test_file.write_bytes(b"data")
 	plugin = registry.for_path(test_file)
 	assert plugin.name == "image"
+
+
+def test_registry_priorities_resolve_overlaps(tmp_path: Path):
+	registry = build_registry()
+	expected = {"notes.txt": "document", "table.csv": "spreadsheet", "letter.docx": "docx"}
+	for name, plugin_name in expected.items():
+		assert registry.for_path(tmp_path / name).name == plugin_name
+
+
+def test_registry_dispatch_skips_supports_scan(tmp_path: Path):
+	class CountingPlugin(FileMetadataPlugin):
+		name = "counting"
+		supported_suffixes = {"abc"}
+		calls = 0
+
+		def supports(self, path: Path) -> bool:
+			CountingPlugin.calls += 1
+			return True
+
+	registry = PluginRegistry()
+	registry.register(CountingPlugin())
+	registry.register(GenericPlugin())
+	assert registry.for_path(tmp_path / "x.abc").name == "counting"
+	assert registry.for_path(tmp_path / "x.zzz").name == "generic"
+	assert CountingPlugin.calls == 0
+
+
+def test_registry_sniffs_unknown_suffix(tmp_path: Path):
+	test_file = tmp_path / "download.bin"
+	test_file.write_bytes(b"%PDF-1.7\n%binary\n")
+	assert build_registry().for_path(test_file).name == "generic"
+	assert build_registry(sniff=True).for_path(test_file).name == "pdf"
+
+
+def test_registry_sniffs_missing_suffix(tmp_path: Path):
+	archive = tmp_path / "report"
+	with zipfile.ZipFile(archive, "w") as handle:
+		handle.writestr("[Content_Types].xml", "<Types/>")
+		handle.writestr("word/document.xml", "<w:document/>")
+	image = tmp_path / "scan"
+	image.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 32)
+	registry = build_registry(sniff=True)
+	assert registry.for_path(archive).name == "docx"
+	assert registry.for_path(image).name == "image"
+
+
+def test_registry_sniffs_mislabeled_suffix(tmp_path: Path):
+	pdf_as_txt = tmp_path / "statement.txt"
+	pdf_as_txt.write_bytes(b"%PDF-1.7\n%binary\n")
+	docx_as_doc = tmp_path / "letter.doc"
+	with zipfile.ZipFile(docx_as_doc, "w") as handle:
+		handle.writestr("[Content_Types].xml", "<Types/>")
+		handle.writestr("word/document.xml", "<w:document/>")
+	notes = tmp_path / "notes.md"
+	notes.write_text("# plain markdown\n", encoding="utf-8")
+	registry = build_registry(sniff=True)
+	assert build_registry().for_path(pdf_as_txt).name != "pdf"
+	assert registry.for_path(pdf_as_txt).name == "pdf"
+	assert registry.for_path(docx_as_doc).name == "docx"
+	# a text guess never overrides the suffix's own plugin
+	assert registry.for_path(notes).name == build_registry().for_path(notes).name
+
+
+def test_descriptors_match_plugin_classes():
+	registry = build_registry()
+	for descriptor in registry.descriptors():
+		module = importlib.import_module(descriptor.module, "rename_n_sort.plugins")
+		plugin_class = getattr(module, descriptor.class_name)
+		assert plugin_class.name == descriptor.name
+		assert set(plugin_class.supported_suffixes) == set(descriptor.suffixes)
+
+
+def test_registry_loads_only_dispatched_plugins(tmp_path: Path):
+	registry = build_registry()
+	assert "pdf" in registry.suffixes()
+	assert registry.for_path(tmp_path / "notes.txt").name == "document"
+	loaded = [descriptor.name for descriptor in registry.descriptors() if descriptor.plugin is not None]
+	assert loaded == ["document"]
+
+
+def test_cli_import_skips_parser_libraries():
+	code = (
+		"import sys, rename_n_sort.cli; "
+		"print(','.join(m for m in ('pypdf', 'PIL', 'docx', 'pptx', 'openpyxl', 'bs4') if m in sys.modules))"
+	)
+	result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+	assert result.stdout.strip() == ""
@@ -26,3 +26,42 @@ def test_max_depth_limits(tmp_path: Path) -> None:
 	assert "a.txt" in names
 	assert "b.txt" in names
 	assert "c.txt" not in names
+
+
+def test_max_depth_zero_skips_subdirectories(tmp_path: Path) -> None:
+	(tmp_path / "a.txt").write_text("root file", encoding="utf-8")
+	sub = tmp_path / "sub"
+	sub.mkdir()
+	(sub / "b.txt").write_text("sub file", encoding="utf-8")
+
+	cfg = AppConfig(roots=[tmp_path], max_depth=0)
+	names = {path.name for path in iter_files(cfg)}
+
+	assert names == {"a.txt"}
+
+
+def test_hidden_directories_are_pruned(tmp_path: Path) -> None:
+	hidden = tmp_path / ".cache"
+	hidden.mkdir()
+	(hidden / "inside.txt").write_text("hidden dir file", encoding="utf-8")
+	(tmp_path / ".dotfile.txt").write_text("hidden file", encoding="utf-8")
+	(tmp_path / "visible.txt").write_text("visible", encoding="utf-8")
+
+	cfg = AppConfig(roots=[tmp_path], max_depth=3, exclude_hidden=True)
+	names = {path.name for path in iter_files(cfg)}
+	assert names == {"visible.txt"}
+
+	cfg = AppConfig(roots=[tmp_path], max_depth=3, exclude_hidden=False)
+	names = {path.name for path in iter_files(cfg)}
+	assert names == {"visible.txt", ".dotfile.txt", "inside.txt"}
+
+
+def test_iter_files_is_lazy_and_filters_extensions(tmp_path: Path) -> None:
+	(tmp_path / "keep.pdf").write_bytes(b"%PDF")
+	(tmp_path / "skip.txt").write_text("text", encoding="utf-8")
+
+	cfg = AppConfig(roots=[tmp_path], include_extensions={"pdf"})
+	files = iter_files(cfg)
+
+	assert not isinstance(files, list)
+	assert [path.name for path in files] == ["keep.pdf"]
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming file selection.
+"""
+
+import random
+from pathlib import Path
+
+from rename_n_sort.config import AppConfig
+from rename_n_sort.scanner import select_files
+
+
+def _paths(count: int) -> list[Path]:
+	return [Path(f"/tmp/file_{idx:03d}.txt") for idx in range(count)]
+
+
+def test_sorted_selection_keeps_smallest_paths() -> None:
+	paths = _paths(50)
+	cfg = AppConfig(max_files=5, randomize=False)
+	selected = select_files(reversed(paths), cfg)
+	assert selected == paths[:5]
+
+
+def test_randomized_selection_is_bounded_subset() -> None:
+	paths = _paths(200)
+	cfg = AppConfig(max_files=10, randomize=True)
+	selected = select_files(iter(paths), cfg, rng=random.Random(7))
+	assert len(selected) == 10
+	assert len(set(selected)) == 10
+	assert set(selected) <= set(paths)
+
+
+def test_randomized_selection_reaches_late_items() -> None:
+	paths = _paths(100)
+	cfg = AppConfig(max_files=1, randomize=True)
+	rng = random.Random(3)
+	picks = {select_files(iter(paths), cfg, rng=rng)[0] for _ in range(200)}
+	assert any(path in picks for path in paths[50:])
+
+
+def test_selection_without_limit_returns_everything() -> None:
+	paths = _paths(20)
+	cfg = AppConfig(max_files=None, randomize=False)
+	assert select_files(reversed(paths), cfg) == paths
+	cfg = AppConfig(max_files=None, randomize=True)
+	assert sorted(select_files(iter(paths), cfg, rng=random.Random(1))) == paths
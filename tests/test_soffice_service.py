@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared LibreOffice conversion service.
+"""
+
+import shutil
+import threading
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from rename_n_sort.plugins.document_plugin import DocumentPlugin
+from rename_n_sort.plugins.soffice_service import SofficeConverter, set_soffice_converter
+
+
+class FakeSoffice:
+	"""
+	Stand-in for subprocess.run that "converts" by copying inputs to --outdir.
+	"""
+
+	def __init__(self, bad_contents: set[str] | None = None, hang: bool = False) -> None:
+		self.bad_contents = bad_contents or set()
+		self.hang = hang
+		self.commands: list[list[str]] = []
+		self._lock = threading.Lock()
+
+	def __call__(self, command: list[str], **kwargs) -> subprocess.CompletedProcess:
+		with self._lock:
+			self.commands.append(command)
+		if self.hang:
+			raise subprocess.TimeoutExpired(command, kwargs.get("timeout"))
+		fmt = command[command.index("--convert-to") + 1]
+		out_dir = Path(command[command.index("--outdir") + 1])
+		inputs = [Path(arg) for arg in command[command.index("--outdir") + 2:]]
+		failed = False
+		for path in inputs:
+			if path.read_text(encoding="utf-8") in self.bad_contents:
+				failed = True
+				continue
+			shutil.copyfile(path, out_dir / f"{path.stem}.{fmt}")
+		return subprocess.CompletedProcess(command, 1 if failed else 0)
+
+
+def _converter(runner: FakeSoffice, tmp_path: Path, **kwargs) -> SofficeConverter:
+	converter = SofficeConverter(runner=runner, work_dir=tmp_path / "work", **kwargs)
+	converter._available = True
+	return converter
+
+
+def _write(tmp_path: Path, name: str, content: str) -> Path:
+	path = tmp_path / name
+	path.write_text(content, encoding="utf-8")
+	return path
+
+
+def test_queued_files_share_one_soffice_start(tmp_path: Path) -> None:
+	runner = FakeSoffice()
+	converter = _converter(runner, tmp_path, workers=1, max_wait_seconds=0.5)
+	paths = [_write(tmp_path, f"file{idx}.doc", f"body {idx}") for idx in range(3)]
+	outputs = converter.convert_many(paths, "docx")
+	assert len(runner.commands) == 1
+	assert [output.read_text(encoding="utf-8") for output in outputs] == ["body 0", "body 1", "body 2"]
+	assert any(arg.startswith("-env:UserInstallation=file://") for arg in runner.commands[0])
+
+
+def test_same_content_converted_once(tmp_path: Path) -> None:
+	runner = FakeSoffice()
+	converter = _converter(runner, tmp_path, workers=1)
+	first = _write(tmp_path, "a.doc", "same bytes")
+	nested = tmp_path / "nested"
+	nested.mkdir()
+	second = _write(nested, "a.doc", "same bytes")
+	assert converter.convert(first, "docx") == converter.convert(second, "docx")
+	assert len(runner.commands) == 1
+	assert converter.stats()["cache_hits"] == 1
+
+
+def test_failed_batch_retries_files_alone(tmp_path: Path) -> None:
+	runner = FakeSoffice(bad_contents={"broken"})
+	converter = _converter(runner, tmp_path, workers=1, max_wait_seconds=0.5)
+	good = _write(tmp_path, "good.doc", "fine")
+	bad = _write(tmp_path, "bad.doc", "broken")
+	outputs = converter.convert_many([good, bad], "docx")
+	assert outputs[0] is not None
+	assert outputs[1] is None
+	assert converter.stats()["failures"] == 1
+
+
+def test_timeout_fails_the_file(tmp_path: Path) -> None:
+	runner = FakeSoffice(hang=True)
+	converter = _converter(runner, tmp_path, workers=1, timeout_seconds=0.1)
+	path = _write(tmp_path, "slow.doc", "slow")
+	with pytest.raises(RuntimeError, match="timed out"):
+		converter.convert(path, "docx")
+	assert converter.stats()["timeouts"] == 1
+
+
+def test_document_plugin_reports_conversion_failure(tmp_path: Path, capsys) -> None:
+	runner = FakeSoffice(bad_contents={"broken"})
+	previous = set_soffice_converter(_converter(runner, tmp_path, workers=1))
+	try:
+		path = _write(tmp_path, "legacy.doc", "broken")
+		meta = DocumentPlugin().extract_metadata(path)
+	finally:
+		set_soffice_converter(previous)
+	assert meta.summary is None
+	assert "LibreOffice conversion failed" in capsys.readouterr().out
+
+
+def test_organizer_prefetches_legacy_files_in_one_batch(tmp_path: Path) -> None:
+	from conftest import StubLLM
+	from rename_n_sort.config import AppConfig
+	from rename_n_sort.organizer import Organizer
+
+	runner = FakeSoffice()
+	converter = _converter(runner, tmp_path, workers=1, max_wait_seconds=0.5)
+	previous = set_soffice_converter(converter)
+	try:
+		organizer = Organizer(AppConfig(roots=[], soffice_workers=1), llm=StubLLM())
+		docs = [_write(tmp_path, f"memo{idx}.doc", f"memo {idx}") for idx in range(3)]
+		notes = _write(tmp_path, "notes.txt", "plain text")
+		organizer._prefetch_conversions(docs + [notes])
+		outputs = [converter.convert(path, "docx") for path in docs]
+	finally:
+		set_soffice_converter(previous)
+	assert len(runner.commands) == 1
+	assert [output.read_text(encoding="utf-8") for output in outputs] == ["memo 0", "memo 1", "memo 2"]
+	# picking up a prefetched conversion is not a cache hit
+	assert converter.stats()["cache_hits"] == 0
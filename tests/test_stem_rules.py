@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for deterministic stem_action rules.
+"""
+
+from rename_n_sort.llm_engine import LLMEngine
+from rename_n_sort.llm_utils import compute_stem_features
+from rename_n_sort.stem_rules import DEFAULT_STEM_RULES, StemRule, match_stem_rule
+
+
+class RecordingTransport:
+	name = "Recording"
+
+	def __init__(self) -> None:
+		self.calls = 0
+
+	def generate(self, prompt: str, *, purpose: str, max_tokens: int) -> str:
+		self.calls += 1
+		return "<stem_action>keep</stem_action><reason>project code is meaningful</reason>"
+
+
+def _rule_name(stem: str, suggested: str = "Quarterly_Report.pdf") -> str | None:
+	rule = match_stem_rule(compute_stem_features(stem, suggested), DEFAULT_STEM_RULES)
+	return rule.name if rule else None
+
+
+def test_default_rules_cover_obvious_stems() -> None:
+	assert _rule_name("3f2504e0-4f89-11d3-9a0c-0305e82c3301") == "uuid_like"
+	assert _rule_name("IMG_1234") == "generic_label"
+	assert _rule_name("deadbeefcafe") == "hex_blob"
+	assert _rule_name("1697040000123") == "long_digit_run"
+	assert _rule_name("1697040000123_001") == "long_digit_run"
+
+
+def test_ambiguous_stems_fall_through() -> None:
+	assert _rule_name("Budget-Report-2024") is None
+	assert _rule_name("ProjectAtlas_notes") is None
+
+
+def test_meaningful_numeric_stems_go_to_the_llm() -> None:
+	# years, dates, tax forms and invoice numbers are not camera counters
+	for stem in ("2023", "20240115", "2024-01-15", "1040", "0012345678-001"):
+		assert _rule_name(stem) is None, stem
+
+
+def test_operator_conditions() -> None:
+	rule = StemRule(name="short", action="normalize", reason="short", conditions={"length": ("<=", 4)})
+	assert match_stem_rule({"length": 3}, [rule]) is rule
+	assert match_stem_rule({"length": 9}, [rule]) is None
+	assert match_stem_rule({}, [rule]) is None
+
+
+def test_engine_skips_llm_when_rule_matches() -> None:
+	transport = RecordingTransport()
+	engine = LLMEngine(transports=[transport])
+	result = engine.stem_action("IMG_1234", "Beach_Sunset.jpg")
+	assert transport.calls == 0
+	assert result.stem_action == "drop"
+	assert result.decided_by == "rule:generic_label"
+
+
+def test_engine_asks_llm_for_ambiguous_stem() -> None:
+	transport = RecordingTransport()
+	engine = LLMEngine(transports=[transport])
+	result = engine.stem_action("ProjectAtlas_notes", "Meeting_Notes.txt")
+	assert transport.calls == 1
+	assert result.stem_action == "keep"
+	assert result.decided_by == "llm"
+
+
+def test_empty_rule_table_always_asks_llm() -> None:
+	transport = RecordingTransport()
+	engine = LLMEngine(transports=[transport], stem_rules=())
+	engine.stem_action("IMG_1234", "Beach_Sunset.jpg")
+	assert transport.calls == 1
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded text preview reader.
+"""
+
+import random
+from pathlib import Path
+
+from rename_n_sort.plugins.code_plugin import CodePlugin
+from rename_n_sort.plugins.text import TextDocumentPlugin
+from rename_n_sort.plugins.text_reader import (
+	collapse_whitespace,
+	detect_encoding,
+	iter_text,
+	read_head_text,
+	read_tail_text,
+)
+
+
+def test_streaming_collapse_matches_split_join(tmp_path: Path) -> None:
+	rng = random.Random(7)
+	pieces = ["a", "bb", " ", "\n\n", "\t", "caf\u00e9", "  x ", "\r\n"]
+	path = tmp_path / "sample.txt"
+	for _ in range(50):
+		text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 300)))
+		path.write_text(text, encoding="utf-8")
+		limit = rng.randint(1, 200)
+		chunks = iter_text(path, chunk_bytes=rng.randint(1, 13))
+		assert collapse_whitespace(chunks, limit) == " ".join(text.split())[:limit]
+
+
+def test_detect_encoding() -> None:
+	assert detect_encoding("caf\u00e9".encode("utf-8")) == "utf-8"
+	# a character cut off by the sample boundary is still UTF-8
+	assert detect_encoding("caf\u00e9".encode("utf-8")[:-1]) == "utf-8"
+	assert detect_encoding("caf\u00e9 cr\u00e8me".encode("cp1252")) == "cp1252"
+	assert detect_encoding("hi".encode("utf-16")).startswith("utf-16")
+
+
+def test_non_utf8_and_bom_files(tmp_path: Path) -> None:
+	latin = tmp_path / "latin.txt"
+	latin.write_bytes("caf\u00e9   cr\u00e8me".encode("cp1252"))
+	assert read_head_text(latin, 100) == "caf\u00e9 cr\u00e8me"
+	wide = tmp_path / "wide.txt"
+	wide.write_text("hello  world", encoding="utf-16")
+	assert read_head_text(wide, 100) == "hello world"
+	assert read_tail_text(wide, 5) == "world"
+
+
+def test_huge_file_reads_are_bounded(tmp_path: Path) -> None:
+	path = tmp_path / "dump.txt"
+	with open(path, "wb") as handle:
+		handle.write(b"first words here\n")
+		# sparse file: a gigabyte on paper, nothing on disk
+		handle.truncate(1024 ** 3)
+		handle.seek(0, 2)
+		handle.write(b"\nlast words")
+	assert read_head_text(path, 16) == "first words here"
+	assert read_tail_text(path, 10) == "last words"
+	meta = TextDocumentPlugin().extract_metadata(path)
+	assert meta.summary.startswith("first words here")
+
+
+def test_code_preview_uses_first_lines(tmp_path: Path) -> None:
+	path = tmp_path / "script.py"
+	lines = [f"line_{idx} = {idx}" for idx in range(5000)]
+	path.write_text("\n".join(lines), encoding="utf-8")
+	meta = CodePlugin().extract_metadata(path)
+	assert meta.summary == " ".join(" ".join(lines[:10]).split())